@@ -0,0 +1,97 @@
+"""
+Benchmark Encoding Kategorikal
+Membandingkan encoding per batch lama (LabelEncoder + pd.get_dummies) dengan
+CategoricalEncoder yang di-fit sekali, pada 1, 1.000 dan 1.000.000 baris
+
+Jalankan dari root project:
+    python benchmarks/bench_categorical_encoder.py
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from categorical_encoder import CategoricalEncoder
+
+
+CATEGORIES = {
+    'Sex': ['M', 'F'],
+    'Oxygen_need': ['Yes', 'No'],
+    'Shock_vital': ['Yes', 'No'],
+    'LOC': ['Yes', 'No'],
+    'Bedsore': ['Yes', 'No'],
+    'Aspiration': ['Yes', 'No'],
+    'Nursing_insurance': ['Yes', 'No'],
+    'ADL_category': ['Independent', 'Semi-dependent', 'Dependent'],
+    'Key_person': ['Son', 'Daughter', 'Spouse', 'Other'],
+}
+
+
+def make_batch(n_rows, seed=0):
+    """Buat batch data mentah dengan kolom kategorikal seperti dataset asli"""
+    rng = np.random.default_rng(seed)
+    data = {'Age': rng.integers(40, 100, n_rows), 'CRP': rng.gamma(2, 5, n_rows)}
+    for col, values in CATEGORIES.items():
+        data[col] = rng.choice(values, n_rows)
+    return pd.DataFrame(data)
+
+
+def legacy_encode(df):
+    """Encoding lama: vocabulary di-fit ulang pada setiap batch"""
+    from sklearn.preprocessing import LabelEncoder
+    df = df.copy()
+    le = LabelEncoder()
+    for col in df.select_dtypes(include=['object']).columns:
+        if df[col].nunique() == 2:
+            df[col] = le.fit_transform(df[col])
+        else:
+            df = pd.get_dummies(df, columns=[col], prefix=col)
+    return df
+
+
+def best_of(func, repeat):
+    """Waktu terbaik dari beberapa kali eksekusi (detik)"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 1_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    encoder = CategoricalEncoder().fit(make_batch(10_000, seed=42))
+
+    print(f"{'Baris':>10} | {'Lama (ms)':>12} | {'Encoder (ms)':>12} | {'Speedup':>8}")
+    print("-" * 52)
+    for n_rows in args.sizes:
+        batch = make_batch(n_rows)
+        repeat = args.repeat if n_rows < 1_000_000 else max(1, args.repeat // 2)
+        t_legacy = best_of(lambda: legacy_encode(batch), repeat)
+        t_encoder = best_of(lambda: encoder.transform(batch), repeat)
+        print(f"{n_rows:>10} | {t_legacy * 1000:>12.3f} | {t_encoder * 1000:>12.3f} | {t_legacy / t_encoder:>7.1f}x")
+
+    # Konsistensi: batch 1 pasien harus mendapat kode yang sama dengan batch besar
+    single = make_batch(1, seed=7)
+    single_legacy = legacy_encode(single)
+    single_encoder = encoder.transform(single)
+    print("\nBatch 1 pasien:")
+    print(f"   Kolom (lama)   : {single_legacy.shape[1]} -> {list(single_legacy.columns)}")
+    print(f"   Kolom (encoder): {single_encoder.shape[1]}")
+    legacy_sex = single_legacy['Sex'].iloc[0] if 'Sex' in single_legacy else 'one-hot (1 kategori)'
+    print(f"   Sex = {single['Sex'].iloc[0]!r} -> lama {legacy_sex}, encoder {single_encoder['Sex'].iloc[0]}")
+
+
+if __name__ == "__main__":
+    main()
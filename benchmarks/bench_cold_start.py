@@ -0,0 +1,87 @@
+"""
+Benchmark Cold Start Prediksi
+Membandingkan waktu startup (import, load model, prediksi pertama) dan peak RSS
+proses prediksi yang memakai pipeline PyCaret (.pkl) dengan inference bundle
+(.bundle.joblib, tanpa PyCaret)
+
+Butuh model hasil training (beserta bundle) di folder models/. Jalankan dari
+root project:
+    python benchmarks/bench_cold_start.py --repeat 5
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+import statistics
+from pathlib import Path
+
+from load_test import SAMPLE_PATIENT
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Dijalankan di proses baru agar setiap pengukuran benar-benar cold start
+CHILD_SCRIPT = """
+import sys, time, json, resource
+start = time.perf_counter()
+sys.path.append({src!r})
+import pandas as pd
+from predict import score_frame, warm_up_models
+imported = time.perf_counter()
+warm_up_models({mortality!r}, {los!r})
+loaded = time.perf_counter()
+score_frame(pd.DataFrame([{patient!r}]), task='both', mortality_model={mortality!r}, los_model={los!r})
+done = time.perf_counter()
+print(json.dumps({{
+    'import_s': imported - start,
+    'load_s': loaded - imported,
+    'first_predict_s': done - loaded,
+    'total_s': done - start,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'pycaret_imported': 'pycaret' in sys.modules,
+}}))
+"""
+
+
+def run_child(use_bundle, mortality_model, los_model):
+    """Jalankan satu proses prediksi cold start, kembalikan metriknya"""
+    code = CHILD_SCRIPT.format(src=str(PROJECT_ROOT / 'src'), mortality=mortality_model,
+                               los=los_model, patient=SAMPLE_PATIENT)
+    env = dict(os.environ, PNEUMONIA_INFERENCE_BUNDLE='1' if use_bundle else '0')
+    output = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--mortality-model', default='models/mortality_model')
+    parser.add_argument('--los-model', default='models/los_model')
+    args = parser.parse_args()
+
+    for name in (args.mortality_model, args.los_model):
+        if not (PROJECT_ROOT / (name + '.bundle.joblib')).exists():
+            print(f"Warning: inference bundle untuk {name} tidak ditemukan, mode bundle memakai PyCaret")
+
+    print(f"{'Mode':>8} | {'Import (s)':>10} | {'Load (s)':>9} | {'Prediksi 1 (s)':>14} | "
+          f"{'Total (s)':>9} | {'Peak RSS (MB)':>13} | PyCaret")
+    print("-" * 90)
+    results = {}
+    for mode, use_bundle in [('pycaret', False), ('bundle', True)]:
+        runs = [run_child(use_bundle, args.mortality_model, args.los_model) for _ in range(args.repeat)]
+        median = {key: statistics.median(run[key] for run in runs)
+                  for key in ('import_s', 'load_s', 'first_predict_s', 'total_s', 'max_rss_mb')}
+        results[mode] = median
+        print(f"{mode:>8} | {median['import_s']:>10.2f} | {median['load_s']:>9.3f} | "
+              f"{median['first_predict_s']:>14.3f} | {median['total_s']:>9.2f} | "
+              f"{median['max_rss_mb']:>13.0f} | {runs[0]['pycaret_imported']}")
+
+    print(f"\nCold start: {results['pycaret']['total_s'] / results['bundle']['total_s']:.1f}x lebih cepat, "
+          f"peak RSS {results['pycaret']['max_rss_mb'] - results['bundle']['max_rss_mb']:.0f} MB lebih kecil")
+
+
+if __name__ == "__main__":
+    main()
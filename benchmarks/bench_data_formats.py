@@ -0,0 +1,108 @@
+"""
+Benchmark Format Data Hasil Preprocessing
+Membandingkan CSV dengan Parquet dan Feather (Arrow) untuk data hasil
+DataPreprocessor: waktu tulis, ukuran file, waktu baca penuh, baca dengan
+proyeksi kolom, baca header (fallback skema prediksi) dan apakah dtype
+bertahan setelah round-trip
+
+Jalankan dari root project:
+    python benchmarks/bench_data_formats.py --sizes 10000 100000 1000000
+    python benchmarks/bench_data_formats.py --sizes 100000 --formats .csv .parquet --output results/formats.json
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from synthetic_cohort import write_cohort
+from data_io import FORMATS, read_table, read_header, write_table
+
+
+PROJECTED_COLUMNS = ['Age', 'Albumin', 'BUN', 'CRP', 'Mortality', 'LOS_days']
+
+
+def processed_frame(n_rows, work_dir, seed=0):
+    """Kohort sintetis yang sudah melalui missing value dan encoding"""
+    from data_preprocessing import DataPreprocessor
+
+    raw_path = os.path.join(work_dir, f'cohort_{n_rows}.csv')
+    write_cohort(raw_path, n_rows, seed=seed)
+    preprocessor = DataPreprocessor(raw_path)
+    with contextlib.redirect_stdout(io.StringIO()):
+        preprocessor.load_data()
+        preprocessor.handle_missing_values()
+        preprocessor.encode_categorical()
+    return preprocessor.df
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def bench_format(df, path, repeat):
+    """Waktu tulis/baca dan ukuran satu format"""
+    write_seconds, _ = best_of(lambda: write_table(df, path), 1)
+    read_seconds, loaded = best_of(lambda: read_table(path), repeat)
+    columns = [col for col in PROJECTED_COLUMNS if col in df.columns]
+    projected_seconds, _ = best_of(lambda: read_table(path, columns=columns), repeat)
+    header_seconds, _ = best_of(lambda: read_header(path), repeat)
+    return {
+        'size_mb': os.path.getsize(path) / 1e6,
+        'write_seconds': write_seconds,
+        'read_seconds': read_seconds,
+        'projected_read_seconds': projected_seconds,
+        'header_seconds': header_seconds,
+        'dtypes_preserved': loaded.dtypes.equals(df.dtypes),
+        'values_equal': loaded.equals(df.reset_index(drop=True)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--formats', nargs='+', default=['.csv', '.parquet', '.feather'],
+                        choices=[ext for ext in FORMATS if ext not in ('.xls',)])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='Simpan hasil ke file JSON')
+    args = parser.parse_args()
+
+    print(f"{'Baris':>9} | {'Format':>8} | {'MB':>8} | {'Tulis (s)':>9} | {'Baca (s)':>9} | "
+          f"{f'{len(PROJECTED_COLUMNS)} kolom (s)':>12} | {'Header (s)':>10} | {'Dtype':>5} | {'Nilai':>5}")
+    print("-" * 105)
+    rows = []
+    work_dir = tempfile.mkdtemp(prefix='bench_formats_')
+    try:
+        for n_rows in args.sizes:
+            df = processed_frame(n_rows, work_dir)
+            for ext in args.formats:
+                result = bench_format(df, os.path.join(work_dir, f'processed_{n_rows}{ext}'), args.repeat)
+                rows.append({'rows': n_rows, 'columns': df.shape[1], 'format': ext, **result})
+                print(f"{n_rows:>9} | {ext:>8} | {result['size_mb']:>8.2f} | {result['write_seconds']:>9.3f} | "
+                      f"{result['read_seconds']:>9.3f} | {result['projected_read_seconds']:>12.3f} | "
+                      f"{result['header_seconds']:>10.4f} | {str(result['dtypes_preserved']):>5} | "
+                      f"{str(result['values_equal']):>5}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(rows, f, indent=2)
+        print(f"\nHasil disimpan ke: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark Optimasi Dtype
+Laporan memori per kolom sebelum/sesudah DataPreprocessor.optimize_dtypes pada
+kohort sintetis besar, serta waktu optimasi dan waktu langkah preprocessing
+berikutnya (missing value, encoding) dengan dan tanpa optimasi
+
+Jalankan dari root project:
+    python benchmarks/bench_dtype_optimizer.py --rows 1000000
+    python benchmarks/bench_dtype_optimizer.py --rows 100000 1000000 --output results/dtypes.json
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from synthetic_cohort import generate_cohort
+from dtype_optimizer import optimize_dtypes, memory_report, format_memory_report
+
+
+def preprocess_seconds(df):
+    """Waktu handle_missing_values + encode_categorical untuk data yang sudah dimuat"""
+    from data_preprocessing import DataPreprocessor
+
+    preprocessor = DataPreprocessor('cohort.parquet')
+    preprocessor.df = df
+    start = time.perf_counter()
+    preprocessor.handle_missing_values('mean')
+    preprocessor.encode_categorical()
+    return time.perf_counter() - start, preprocessor.df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000_000])
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='Simpan hasil ke file JSON')
+    args = parser.parse_args()
+
+    results = []
+    for n_rows in args.rows:
+        df = generate_cohort(n_rows, seed=args.seed)
+        start = time.perf_counter()
+        optimized, _ = optimize_dtypes(df)
+        optimize_seconds = time.perf_counter() - start
+        report = memory_report(df, optimized)
+        baseline_seconds, expected = preprocess_seconds(df)
+        optimized_seconds, result = preprocess_seconds(optimized)
+        processed_mb = (expected.memory_usage(index=False).sum() / 1e6,
+                        result.memory_usage(index=False).sum() / 1e6)
+        same_values = list(expected.columns) == list(result.columns) and all(
+            np.allclose(expected[col].to_numpy(dtype=float), result[col].to_numpy(dtype=float),
+                        rtol=1e-6, equal_nan=True)
+            for col in expected.columns)
+
+        print(f"\n{n_rows} baris")
+        print(format_memory_report(report))
+        print(f"Optimasi dtype: {optimize_seconds:.2f} s")
+        print(f"Missing value + encoding: {baseline_seconds:.2f} s -> {optimized_seconds:.2f} s")
+        print(f"Data hasil preprocessing: {processed_mb[0]:.1f} MB -> {processed_mb[1]:.1f} MB "
+              f"(nilai sama: {same_values})")
+        total = report.loc['TOTAL']
+        results.append({
+            'rows': n_rows,
+            'mb_before': total['bytes_before'] / 1e6,
+            'mb_after': total['bytes_after'] / 1e6,
+            'saving_pct': total['saving_pct'],
+            'optimize_seconds': optimize_seconds,
+            'preprocess_seconds': baseline_seconds,
+            'preprocess_seconds_optimized': optimized_seconds,
+            'processed_mb': processed_mb[0],
+            'processed_mb_optimized': processed_mb[1],
+            'same_values': same_values,
+            'columns': report.drop(index='TOTAL').reset_index(names='column').to_dict(orient='records'),
+        })
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
+        print(f"\nHasil disimpan ke: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
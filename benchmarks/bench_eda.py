@@ -0,0 +1,77 @@
+"""
+Benchmark EDA (explore_data)
+Membandingkan EDA penuh (info, describe, duplicated, value_counts atas seluruh
+data) dengan profil streaming satu pass (cold) dan profil dari cache (warm)
+pada kohort sintetis, dengan dtype mentah dan dtype yang sudah dioptimasi
+
+Jalankan dari root project:
+    python benchmarks/bench_eda.py --rows 100000 1000000
+"""
+
+import io
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from synthetic_cohort import generate_cohort
+from data_profile import ProfileCache
+
+
+def timed_explore(preprocessor, **kwargs):
+    """Waktu explore_data dengan output INFO dibuang"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        preprocessor.explore_data(**kwargs)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--sample-size', type=int, default=10_000)
+    parser.add_argument('--output', help='Simpan hasil ke file JSON')
+    args = parser.parse_args()
+
+    from data_preprocessing import DataPreprocessor
+
+    print(f"{'Baris':>9} | {'Dtype':>9} | {'Full (s)':>8} | {'Profil cold (s)':>15} | "
+          f"{'Profil warm (s)':>15} | {'Speedup cold':>12} | {'Speedup warm':>12}")
+    print("-" * 100)
+    rows = []
+    cache_dir = tempfile.mkdtemp(prefix='bench_eda_')
+    try:
+        for n_rows in args.rows:
+            df = generate_cohort(n_rows)
+            for dtypes in ('mentah', 'optimasi'):
+                preprocessor = DataPreprocessor('cohort.parquet', verbose=True)
+                preprocessor.df = df
+                if dtypes == 'optimasi':
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        preprocessor.optimize_dtypes(report=False)
+                cache = ProfileCache(cache_dir)
+                cache.clear()
+                full = timed_explore(preprocessor, mode='full')
+                cold = timed_explore(preprocessor, mode='profile', sample_size=args.sample_size, cache=cache)
+                warm = timed_explore(preprocessor, mode='profile', sample_size=args.sample_size, cache=cache)
+                rows.append({'rows': n_rows, 'dtypes': dtypes, 'full_seconds': full,
+                             'profile_seconds': cold, 'cached_profile_seconds': warm})
+                print(f"{n_rows:>9} | {dtypes:>9} | {full:>8.2f} | {cold:>15.2f} | {warm:>15.2f} | "
+                      f"{full / cold:>11.1f}x | {full / warm:>11.1f}x")
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(rows, f, indent=2)
+        print(f"\nHasil disimpan ke: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
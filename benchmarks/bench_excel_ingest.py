@@ -0,0 +1,98 @@
+"""
+Benchmark Ingest Excel
+Membandingkan pembacaan workbook mentah langsung (openpyxl, dan calamine jika
+python-calamine terpasang) dengan cache ingest: konversi pertama (cold) dan
+pembacaan berikutnya dari Parquet (warm, penuh dan dengan proyeksi kolom),
+pada dataset asli dan kohort sintetis
+
+Jalankan dari root project:
+    python benchmarks/bench_excel_ingest.py --data data/data-669-patients.xlsx --sizes 10000 100000
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from synthetic_cohort import generate_cohort
+from ingest_cache import IngestCache, read_excel, calamine_available
+
+
+PROJECTED_COLUMNS = ['Age', 'Albumin', 'CRP', 'Mortality', 'LOS_days']
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def bench_workbook(path, work_dir, repeat):
+    """Waktu baca satu workbook per cara"""
+    result = {'file': os.path.basename(path), 'size_mb': os.path.getsize(path) / 1e6}
+    result['openpyxl_seconds'], expected = best_of(lambda: read_excel(path, engine='openpyxl'), repeat)
+    result['rows'] = len(expected)
+    if calamine_available():
+        result['calamine_seconds'], df = best_of(lambda: read_excel(path, engine='calamine'), repeat)
+        result['calamine_identical'] = df.equals(expected)
+
+    cache = IngestCache(os.path.join(work_dir, 'cache'))
+    cache.clear()
+    result['cold_seconds'], _ = best_of(lambda: cache.read(path), 1)
+    result['warm_seconds'], df = best_of(lambda: cache.read(path), repeat)
+    result['warm_identical'] = df.equals(expected)
+    columns = [col for col in PROJECTED_COLUMNS if col in expected.columns]
+    result['warm_projected_seconds'], _ = best_of(lambda: cache.read(path, columns=columns), repeat)
+    result['speedup'] = result['openpyxl_seconds'] / result['warm_seconds']
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--data', default='data/data-669-patients.xlsx',
+                        help='Workbook asli (dilewati jika tidak ada)')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000],
+                        help='Jumlah baris kohort sintetis (.xlsx)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='Simpan hasil ke file JSON')
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(prefix='bench_ingest_')
+    workbooks = [args.data] if os.path.exists(args.data) else []
+    for n_rows in args.sizes:
+        path = os.path.join(work_dir, f'cohort_{n_rows}.xlsx')
+        generate_cohort(n_rows).to_excel(path, index=False)
+        workbooks.append(path)
+
+    print(f"{'File':<26} | {'Baris':>7} | {'openpyxl (s)':>12} | {'calamine (s)':>12} | {'Cold (s)':>8} | "
+          f"{'Warm (s)':>8} | {'Proyeksi (s)':>12} | {'Speedup':>8}")
+    print("-" * 115)
+    rows = []
+    try:
+        for path in workbooks:
+            result = bench_workbook(path, work_dir, args.repeat)
+            rows.append(result)
+            calamine = f"{result['calamine_seconds']:.3f}" if 'calamine_seconds' in result else '-'
+            print(f"{result['file']:<26} | {result['rows']:>7} | {result['openpyxl_seconds']:>12.3f} | "
+                  f"{calamine:>12} | {result['cold_seconds']:>8.3f} | {result['warm_seconds']:>8.4f} | "
+                  f"{result['warm_projected_seconds']:>12.4f} | {result['speedup']:>7.0f}x")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(rows, f, indent=2)
+        print(f"\nHasil disimpan ke: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
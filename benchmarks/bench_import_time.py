@@ -0,0 +1,135 @@
+"""
+Benchmark Waktu Startup per Subcommand
+Menjalankan setiap subcommand main.py di proses baru dengan `python -X importtime`
+dan melaporkan wall time, total waktu import, modul terberat dan framework ML
+yang ikut dimuat
+
+Jalankan dari root project (subcommand score-stream dan serve butuh model di
+folder models/):
+    python benchmarks/bench_import_time.py --repeat 3
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+
+from load_test import SAMPLE_PATIENT
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+HEAVY_PACKAGES = ('pycaret', 'sklearn', 'lightgbm', 'pandas')
+
+# Startup `serve` sampai server siap menerima request (model sudah dimuat)
+SERVE_SNIPPET = """
+import sys
+sys.argv = ['main.py', 'serve', '--port', '0']
+import main
+args = main.parse_args(sys.argv[1:])
+main.configure_logging('WARNING')
+from server import create_server
+create_server(args.host, args.port, mortality_model=args.mortality_model,
+              los_model=args.los_model).server_close()
+"""
+
+# Modul yang diimpor `main()` sebelum training dimulai
+RUN_SNIPPET = """
+import sys
+sys.argv = ['main.py', 'run']
+import main
+main.parse_args(sys.argv[1:])
+import pandas
+import data_preprocessing, train_mortality, train_los, predict
+"""
+
+
+def parse_importtime(stderr):
+    """
+    Ringkas output `-X importtime`
+
+    Returns:
+    --------
+    total_ms : float
+        Jumlah waktu kumulatif import top-level (ms)
+    top_level : dict
+        Package top-level -> waktu kumulatif (ms)
+    modules : set
+        Semua modul yang diimpor
+    """
+    top_level = {}
+    modules = set()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules.add(name.strip())
+        if name.startswith('  '):  # import bersarang
+            continue
+        top_level[name.strip()] = top_level.get(name.strip(), 0.0) + int(cumulative) / 1000
+    return sum(top_level.values()), top_level, modules
+
+
+def run_subcommand(args):
+    """Jalankan `python -X importtime <args>`, kembalikan metrik startup"""
+    start = time.perf_counter()
+    process = subprocess.run([sys.executable, '-X', 'importtime'] + args, cwd=PROJECT_ROOT,
+                             capture_output=True, text=True)
+    wall = time.perf_counter() - start
+    if process.returncode != 0:
+        error = process.stderr.strip().splitlines()[-1] if process.stderr.strip() else 'gagal'
+        raise RuntimeError(error)
+    total_ms, top_level, modules = parse_importtime(process.stderr)
+    loaded = [pkg for pkg in HEAVY_PACKAGES if pkg in modules]
+    return {'wall_s': wall, 'import_ms': total_ms, 'top_level': top_level, 'heavy': loaded}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--top', type=int, default=3, help='Jumlah modul terberat yang ditampilkan')
+    parser.add_argument('--output', help='Simpan hasil ke file JSON')
+    args = parser.parse_args()
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix='bench_import_time_'))
+    input_csv = tmp_dir / 'patient.csv'
+    input_csv.write_text(','.join(SAMPLE_PATIENT) + '\n' + ','.join(str(v) for v in SAMPLE_PATIENT.values()) + '\n')
+
+    subcommands = {
+        '--help': ['main.py', '--help'],
+        'run': ['-c', RUN_SNIPPET],
+        'score-stream': ['main.py', '--quiet', 'score-stream', '--input', str(input_csv),
+                         '--output', str(tmp_dir / 'out.csv')],
+        'serve': ['-c', SERVE_SNIPPET],
+    }
+
+    print(f"{'Subcommand':>12} | {'Wall (s)':>8} | {'Import (ms)':>11} | {'Framework dimuat':<28} | Modul terberat")
+    print("-" * 110)
+    results = {}
+    for name, command in subcommands.items():
+        try:
+            runs = [run_subcommand(command) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"{name:>12} | gagal: {e}")
+            continue
+        wall = statistics.median(run['wall_s'] for run in runs)
+        import_ms = statistics.median(run['import_ms'] for run in runs)
+        heaviest = sorted(runs[-1]['top_level'].items(), key=lambda item: -item[1])[:args.top]
+        results[name] = {'wall_s': wall, 'import_ms': import_ms, 'heavy': runs[-1]['heavy'],
+                         'heaviest': dict(heaviest)}
+        print(f"{name:>12} | {wall:>8.2f} | {import_ms:>11.0f} | {', '.join(runs[-1]['heavy']) or '-':<28} | "
+              + ', '.join(f"{module} ({ms:.0f} ms)" for module, ms in heaviest))
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nHasil disimpan ke: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark Preprocessing Inkremental
+Membandingkan preprocessing penuh (load, optimasi dtype, missing value,
+encoding, simpan) dengan update inkremental (load, diff manifest baris,
+transform dan tambahkan hanya baris baru) setelah beberapa ratus pasien baru
+ditambahkan ke data mentah kohort sintetis
+
+Jalankan dari root project:
+    python benchmarks/bench_incremental.py --rows 100000 1000000 --append 300
+"""
+
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from synthetic_cohort import generate_cohort
+from data_io import write_table, read_table
+
+
+def full_preprocessing(raw_path, store_path):
+    """Pipeline preprocessing penuh seperti main.py (tanpa EDA)"""
+    from data_preprocessing import DataPreprocessor
+
+    start = time.perf_counter()
+    preprocessor = DataPreprocessor(raw_path, track_rows=True)
+    preprocessor.load_data()
+    preprocessor.optimize_dtypes(report=False)
+    preprocessor.handle_missing_values('mean')
+    preprocessor.encode_categorical()
+    preprocessor.save_processed_data(store_path)
+    return time.perf_counter() - start
+
+
+def incremental_preprocessing(raw_path, store_path):
+    """Load data mentah lalu update_processed_data"""
+    from data_preprocessing import DataPreprocessor
+
+    start = time.perf_counter()
+    preprocessor = DataPreprocessor(raw_path, track_rows=True)
+    preprocessor.load_data()
+    counts = preprocessor.update_processed_data(store_path, strategy='mean')
+    return time.perf_counter() - start, counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--append', type=int, default=300, help='Jumlah pasien baru per update')
+    parser.add_argument('--formats', nargs='+', default=['.csv', '.parquet'],
+                        help='Format data hasil preprocessing')
+    parser.add_argument('--output', help='Simpan hasil ke file JSON')
+    args = parser.parse_args()
+
+    print(f"{'Baris':>9} | {'Format':>8} | {'Penuh (s)':>9} | {'Inkremental (s)':>15} | "
+          f"{'Speedup':>8} | {'Baris sama':>10}")
+    print("-" * 75)
+    rows = []
+    workdir = Path(tempfile.mkdtemp(prefix='bench_incremental_'))
+    try:
+        for n_rows in args.rows:
+            history = generate_cohort(n_rows, seed=0)
+            admissions = generate_cohort(args.append, seed=1)
+            admissions['Patient_ID'] += history['Patient_ID'].max()
+            updated = pd.concat([history, admissions], ignore_index=True)
+            for ext in args.formats:
+                raw_path = str(workdir / 'raw.parquet')
+                store_path = str(workdir / f'processed{ext}')
+                write_table(history, raw_path)
+                full_preprocessing(raw_path, store_path)
+                stored = read_table(store_path)
+
+                write_table(updated, raw_path)
+                incremental_seconds, counts = incremental_preprocessing(raw_path, store_path)
+                result = read_table(store_path)
+                # Baris lama tidak berubah dan setiap pasien baru tercatat tepat sekali
+                same_rows = (counts is not None and counts['new'] == args.append
+                             and len(result) == len(stored) + args.append
+                             and result.iloc[:len(stored)].equals(stored))
+                full_seconds = full_preprocessing(raw_path, store_path)
+
+                rows.append({'rows': n_rows, 'append': args.append, 'format': ext,
+                             'full_seconds': full_seconds, 'incremental_seconds': incremental_seconds,
+                             'same_rows': bool(same_rows)})
+                print(f"{n_rows:>9} | {ext:>8} | {full_seconds:>9.2f} | {incremental_seconds:>15.2f} | "
+                      f"{full_seconds / incremental_seconds:>7.1f}x | {str(same_rows):>10}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(rows, f, indent=2)
+        print(f"\nHasil disimpan ke: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
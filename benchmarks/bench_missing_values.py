@@ -0,0 +1,112 @@
+"""
+Benchmark Imputasi Missing Value
+Membandingkan handle_missing_values lama (loop per kolom, isnull().sum() dan
+fillna(inplace=True) per kolom, dropna di dalam loop) dengan
+MissingValueImputer (statistik sekali hitung, isi dalam satu operasi) pada
+kohort sintetis sempit dan lebar, sekaligus memastikan hasilnya identik
+
+Jalankan dari root project:
+    python benchmarks/bench_missing_values.py --rows 10000 100000 --widths 27 200
+    python benchmarks/bench_missing_values.py --rows 1000000 10000000 --widths 27
+"""
+
+import sys
+import json
+import time
+import warnings
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from synthetic_cohort import generate_cohort
+from missing_value_imputer import MissingValueImputer, STRATEGIES
+
+
+def legacy_handle_missing_values(df, strategy):
+    """Alur lama DataPreprocessor.handle_missing_values"""
+    df = df.copy()
+    missing_count = df.isnull().sum()
+    if missing_count.sum() == 0:
+        return df
+    for col in df.columns:
+        if df[col].isnull().sum() > 0:
+            if strategy == 'mean' and df[col].dtype in ['int64', 'float64']:
+                df[col].fillna(df[col].mean(), inplace=True)
+            elif strategy == 'median' and df[col].dtype in ['int64', 'float64']:
+                df[col].fillna(df[col].median(), inplace=True)
+            elif strategy == 'mode':
+                df[col].fillna(df[col].mode()[0], inplace=True)
+            elif strategy == 'drop':
+                df.dropna(subset=[col], inplace=True)
+    return df
+
+
+def vectorized_handle_missing_values(df, strategy):
+    return MissingValueImputer(strategy).fit_transform(df)
+
+
+def make_frame(n_rows, width, seed=0):
+    """
+    Kohort sintetis, dilebarkan dengan kolom lab tambahan (5% missing) sampai
+    `width` kolom
+    """
+    df = generate_cohort(n_rows, seed=seed)
+    rng = np.random.default_rng(seed + 1)
+    extra = width - df.shape[1]
+    if extra > 0:
+        values = rng.normal(size=(n_rows, extra))
+        values[rng.random((n_rows, extra)) < 0.05] = np.nan
+        df = pd.concat([df, pd.DataFrame(values, columns=[f'Lab_{i}' for i in range(extra)])], axis=1)
+    return df
+
+
+def best_of(func, df, strategy, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(df, strategy)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--widths', type=int, nargs='+', default=[27, 200])
+    parser.add_argument('--strategies', nargs='+', choices=STRATEGIES, default=list(STRATEGIES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help='Simpan hasil ke file JSON')
+    args = parser.parse_args()
+
+    # Alur lama memicu FutureWarning chained assignment di pandas 2 untuk setiap kolom
+    warnings.simplefilter('ignore', FutureWarning)
+
+    print(f"{'Baris':>9} | {'Kolom':>5} | {'Strategi':>8} | {'Lama (s)':>9} | {'Vectorized (s)':>14} | "
+          f"{'Speedup':>7} | {'Identik':>7}")
+    print("-" * 80)
+    rows = []
+    for n_rows in args.rows:
+        for width in args.widths:
+            df = make_frame(n_rows, width)
+            for strategy in args.strategies:
+                legacy_seconds, expected = best_of(legacy_handle_missing_values, df, strategy, args.repeat)
+                new_seconds, result = best_of(vectorized_handle_missing_values, df, strategy, args.repeat)
+                identical = result.equals(expected)
+                rows.append({'rows': n_rows, 'columns': df.shape[1], 'strategy': strategy,
+                             'legacy_seconds': legacy_seconds, 'vectorized_seconds': new_seconds,
+                             'speedup': legacy_seconds / new_seconds, 'identical': identical})
+                print(f"{n_rows:>9} | {df.shape[1]:>5} | {strategy:>8} | {legacy_seconds:>9.3f} | "
+                      f"{new_seconds:>14.3f} | {legacy_seconds / new_seconds:>6.1f}x | {str(identical):>7}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(rows, f, indent=2)
+        print(f"\nHasil disimpan ke: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
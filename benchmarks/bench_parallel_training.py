@@ -0,0 +1,62 @@
+"""
+Benchmark Training Paralel Mortalitas + LOS
+Membandingkan wall clock training kedua task secara berurutan (satu proses,
+semua core per task) dengan mode paralel (satu proses worker per task, core
+dibagi rata)
+
+Model disimpan ke folder sementara (folder models/ tidak disentuh). Jalankan
+dari root project setelah preprocessing:
+    python benchmarks/bench_parallel_training.py --data data/processed_pneumonia_data.csv
+"""
+
+import os
+import sys
+import json
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from run_config import load_config
+from parallel_training import TASK_SPECS, train_tasks, print_summary, split_n_jobs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--data', default='data/processed_pneumonia_data.csv')
+    parser.add_argument('--tasks', nargs='+', choices=list(TASK_SPECS), default=list(TASK_SPECS))
+    parser.add_argument('--n-jobs', type=int, default=None, help='Core per task pada mode paralel')
+    parser.add_argument('--output', help='Simpan hasil ke file JSON')
+    args = parser.parse_args()
+
+    # Mode berurutan berjalan di proses ini: impor PyCaret di luar pengukuran.
+    # Worker paralel tetap membayar impor PyCaret-nya sendiri (biaya nyata mode paralel).
+    import pycaret.classification
+    import pycaret.regression
+
+    print(f"CPU: {os.cpu_count()}, n_jobs per task (paralel): {args.n_jobs or split_n_jobs(len(args.tasks))}")
+    results = {}
+    for mode, parallel in [('sequential', False), ('parallel', True)]:
+        model_dir = tempfile.mkdtemp(prefix=f'bench_parallel_{mode}_')
+        config = load_config(overrides={'n_jobs': args.n_jobs if parallel else None})
+        results[mode] = train_tasks(args.data, tasks=args.tasks, config=config, parallel=parallel,
+                                    model_dir=model_dir)
+        print(f"\n== {mode} ==")
+        print_summary(results[mode])
+
+    sequential, parallel = results['sequential']['wall_seconds'], results['parallel']['wall_seconds']
+    print(f"\nWall clock: berurutan {sequential:.1f} s, paralel {parallel:.1f} s ({sequential / parallel:.2f}x)")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        for result in results.values():
+            for task_result in result['tasks'].values():
+                task_result.pop('log', None)
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
+        print(f"\nHasil disimpan ke: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""
+Benchmark End-to-End Pipeline dengan Kohort Sintetis
+Mengukur preprocessing DataPreprocessor (load, missing value, encoding, simpan),
+training per tahap (setup, compare, create, tune, finalize, simpan) untuk
+kedua task dan latency/throughput prediksi, pada kohort sintetis 1k sampai 10M
+baris. Hasil ditulis ke JSON (beserta commit git dan versi library) agar
+regresi performa bisa dibandingkan antar versi.
+
+Jalankan dari root project:
+    python benchmarks/bench_pipeline.py --sizes 1000 100000 1000000 --train-sizes 1000 5000
+    python benchmarks/bench_pipeline.py --stages preprocess --sizes 10000000
+    python benchmarks/bench_pipeline.py --baseline results/benchmarks/pipeline_<commit>.json
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import platform
+import tempfile
+import contextlib
+import subprocess
+from pathlib import Path
+from datetime import datetime, timezone
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.append(str(PROJECT_ROOT / 'src'))
+
+from synthetic_cohort import write_cohort
+from run_config import load_config, parse_assignments
+from leaderboard_cache import library_versions
+
+
+STAGES = ('preprocess', 'training', 'prediction')
+TASKS = {
+    'mortality': ('classification', 'mortality_model_path', 'mortality_optimize', 'classification_models'),
+    'los': ('regression', 'los_model_path', 'los_optimize', 'regression_models'),
+}
+
+
+def git_commit():
+    """Commit git saat ini (None jika bukan repo git)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def timed(func, *args, **kwargs):
+    """Jalankan func dengan output print dibuang, kembalikan (hasil, detik)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        return result, time.perf_counter() - start
+
+
+def cohort_path(work_dir, n_rows, seed):
+    """Kohort sintetis mentah (CSV), dibuat sekali per ukuran"""
+    path = os.path.join(work_dir, f'cohort_{n_rows}.csv')
+    if not os.path.exists(path):
+        write_cohort(path, n_rows, seed=seed)
+    return path
+
+
+def bench_preprocess(n_rows, work_dir, config, seed):
+    """Waktu setiap langkah DataPreprocessor untuk satu ukuran kohort"""
+    from data_preprocessing import DataPreprocessor
+
+    raw_path = cohort_path(work_dir, n_rows, seed)
+    # Format data hasil preprocessing mengikuti ekstensi processed_data_path di config
+    extension = os.path.splitext(config.processed_data_path)[1] or '.csv'
+    processed_path = os.path.join(work_dir, f'processed_{n_rows}{extension}')
+    preprocessor = DataPreprocessor(raw_path)
+    steps = {}
+    _, steps['load'] = timed(preprocessor.load_data)
+    if config.optimize_dtypes:
+        _, steps['optimize_dtypes'] = timed(preprocessor.optimize_dtypes)
+    _, steps['missing_values'] = timed(preprocessor.handle_missing_values,
+                                       strategy=config.missing_value_strategy)
+    _, steps['encode'] = timed(preprocessor.encode_categorical)
+    _, steps['save'] = timed(preprocessor.save_processed_data, processed_path)
+    total = sum(steps.values())
+    return {
+        'rows': n_rows,
+        'seconds': steps,
+        'total_seconds': total,
+        'rows_per_second': n_rows / total,
+        'raw_mb': os.path.getsize(raw_path) / 1e6,
+    }, processed_path
+
+
+def bench_training(n_rows, processed_path, model_dir, config):
+    """Waktu setiap tahap training LightGBM (alur trainer) untuk kedua task"""
+    from training_session import TrainingSession
+
+    results = []
+    for task, (kind, path_field, optimize_field, models_field) in TASKS.items():
+        session = TrainingSession(processed_path, None, task=kind, model_dir=model_dir,
+                                  leaderboard_cache=False, config=config)
+        optimize = getattr(config, optimize_field)
+        stages = {}
+        experiment, _ = timed(session.setup)
+        stages['load'] = session.load_seconds
+        stages['setup'] = session.setup_seconds
+        available = set(experiment.models().index)
+        include = [m for m in getattr(config, models_field) if m in available]
+        _, stages['compare'] = timed(session.compare_models, include=include, sort=optimize,
+                                     n_select=3, verbose=False)
+        model, stages['create'] = timed(experiment.create_model, 'lightgbm', verbose=False)
+        tuned, stages['tune'] = timed(session.tune, model, optimize=optimize)
+        final, stages['finalize'] = timed(experiment.finalize_model, tuned)
+        _, stages['save'] = timed(session.save_model, final, getattr(config, path_field))
+        results.append({
+            'task': task,
+            'rows': n_rows,
+            'seconds': stages,
+            'total_seconds': sum(stages.values()),
+            'compared_models': include,
+            'tuning': session.tuning_history[-1],
+        })
+    return results
+
+
+def bench_prediction(n_rows, work_dir, model_paths, repeat, seed):
+    """Latency dan throughput predict_both untuk satu ukuran batch"""
+    import pandas as pd
+    from predict import predict_both
+
+    source = pd.read_csv(cohort_path(work_dir, max(n_rows, 1000), seed), nrows=n_rows)
+    batch = source.drop(columns=['Mortality', 'LOS_days'])
+    # Panggilan pertama memuat model ke registry (cold start diukur bench_cold_start)
+    timed(predict_both, batch, **model_paths)
+    timings = [timed(predict_both, batch, **model_paths)[1] for _ in range(repeat)]
+    return {
+        'rows': n_rows,
+        'repeat': repeat,
+        'latency_ms': {
+            'min': 1000 * min(timings),
+            'p50': 1000 * float(np.percentile(timings, 50)),
+            'p95': 1000 * float(np.percentile(timings, 95)),
+        },
+        'rows_per_second': n_rows / float(np.median(timings)),
+    }
+
+
+def flatten(results):
+    """Metrik durasi per (stage, task, rows, langkah) untuk perbandingan baseline"""
+    metrics = {}
+    for entry in results.get('preprocess', []):
+        for step, seconds in entry['seconds'].items():
+            metrics[f"preprocess/{entry['rows']}/{step}"] = seconds
+    for entry in results.get('training', []):
+        for step, seconds in entry['seconds'].items():
+            metrics[f"training/{entry['task']}/{entry['rows']}/{step}"] = seconds
+    for entry in results.get('prediction', []):
+        metrics[f"prediction/{entry['rows']}/p50"] = entry['latency_ms']['p50'] / 1000
+    return metrics
+
+
+def print_comparison(results, baseline_path):
+    """Bandingkan durasi dengan hasil benchmark sebelumnya (rasio > 1 = lebih lambat)"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    current, previous = flatten(results), flatten(baseline)
+    print(f"\nPerbandingan dengan {baseline_path} (commit {baseline['meta'].get('commit')}):")
+    print(f"{'Metrik':>40} | {'Baseline (s)':>12} | {'Sekarang (s)':>12} | {'Rasio':>6}")
+    print("-" * 80)
+    for name in sorted(set(current) & set(previous)):
+        ratio = current[name] / previous[name] if previous[name] else float('nan')
+        print(f"{name:>40} | {previous[name]:>12.3f} | {current[name]:>12.3f} | {ratio:>6.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--stages', nargs='+', choices=STAGES, default=list(STAGES))
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000],
+                        help='Ukuran kohort untuk preprocessing')
+    parser.add_argument('--train-sizes', type=int, nargs='+', default=[1_000, 5_000],
+                        help='Ukuran kohort untuk training (model ukuran terakhir dipakai untuk prediksi)')
+    parser.add_argument('--predict-sizes', type=int, nargs='+', default=[1, 100, 10_000])
+    parser.add_argument('--repeat', type=int, default=5, help='Pengulangan per ukuran batch prediksi')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--set', action='append', metavar='NAMA=NILAI',
+                        help='Override config run, mis. --set cv_folds=3 --set tuning_n_iter=10')
+    parser.add_argument('--work-dir', help='Folder data/model sementara (default folder temp, dihapus)')
+    parser.add_argument('--output', help='File JSON hasil (default results/benchmarks/pipeline_<commit>.json)')
+    parser.add_argument('--baseline', help='File JSON benchmark sebelumnya untuk dibandingkan')
+    args = parser.parse_args()
+
+    # Log library dan PyCaret tidak ikut diukur sebagai output
+    logging.getLogger('pneumonia').setLevel(logging.WARNING)
+    config = load_config(overrides=parse_assignments(args.set))
+    work_dir = args.work_dir or tempfile.mkdtemp(prefix='bench_pipeline_')
+    os.makedirs(work_dir, exist_ok=True)
+    commit = git_commit()
+    results = {
+        'meta': {
+            'commit': commit,
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'versions': library_versions(),
+            'config': config.to_dict(),
+            'args': vars(args),
+        },
+    }
+
+    try:
+        if 'preprocess' in args.stages:
+            results['preprocess'] = []
+            print(f"{'Baris':>10} | {'Load (s)':>9} | {'Missing (s)':>11} | {'Encode (s)':>10} | "
+                  f"{'Simpan (s)':>10} | {'Baris/s':>10}")
+            print("-" * 75)
+            for n_rows in args.sizes:
+                entry, _ = bench_preprocess(n_rows, work_dir, config, args.seed)
+                results['preprocess'].append(entry)
+                steps = entry['seconds']
+                print(f"{n_rows:>10} | {steps['load']:>9.2f} | {steps['missing_values']:>11.2f} | "
+                      f"{steps['encode']:>10.2f} | {steps['save']:>10.2f} | {entry['rows_per_second']:>10.0f}")
+
+        model_paths = {'mortality_model': config.project_path(config.mortality_model_path),
+                       'los_model': config.project_path(config.los_model_path)}
+        if 'training' in args.stages:
+            results['training'] = []
+            print(f"\n{'Task':>10} | {'Baris':>7} | {'Setup':>7} | {'Compare':>8} | {'Create':>7} | "
+                  f"{'Tune':>7} | {'Finalize':>8} | {'Simpan':>7} | {'Total':>7}  (detik)")
+            print("-" * 95)
+            for n_rows in args.train_sizes:
+                model_dir = os.path.join(work_dir, f'models_{n_rows}')
+                _, processed_path = bench_preprocess(n_rows, work_dir, config, args.seed)
+                for entry in bench_training(n_rows, processed_path, model_dir, config):
+                    results['training'].append(entry)
+                    s = entry['seconds']
+                    print(f"{entry['task']:>10} | {n_rows:>7} | {s['setup']:>7.1f} | {s['compare']:>8.1f} | "
+                          f"{s['create']:>7.1f} | {s['tune']:>7.1f} | {s['finalize']:>8.1f} | "
+                          f"{s['save']:>7.1f} | {entry['total_seconds']:>7.1f}")
+            model_paths = {key: os.path.join(model_dir, os.path.basename(path))
+                           for key, path in model_paths.items()}
+
+        if 'prediction' in args.stages:
+            results['prediction'] = []
+            results['meta']['prediction_models'] = model_paths
+            print(f"\n{'Baris':>8} | {'p50 (ms)':>10} | {'p95 (ms)':>10} | {'Baris/s':>10}")
+            print("-" * 48)
+            for n_rows in args.predict_sizes:
+                entry = bench_prediction(n_rows, work_dir, model_paths, args.repeat, args.seed)
+                results['prediction'].append(entry)
+                print(f"{n_rows:>8} | {entry['latency_ms']['p50']:>10.1f} | "
+                      f"{entry['latency_ms']['p95']:>10.1f} | {entry['rows_per_second']:>10.0f}")
+    finally:
+        if not args.work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    output = args.output or str(PROJECT_ROOT / 'results' / 'benchmarks' / f"pipeline_{commit or 'local'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2, default=str)
+    print(f"\nHasil disimpan ke: {output}")
+
+    if args.baseline:
+        print_comparison(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark Prediksi Gabungan
+Membandingkan predict_mortality + predict_los terpisah (alur lama predict_both)
+dengan predict_both yang membaca, meng-encode dan meng-align data sekali
+
+Butuh model hasil training di folder models/. Jalankan dari root project:
+    python benchmarks/bench_predict_both.py --data data/data-669-patients.xlsx
+"""
+
+import io
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from predict import predict_mortality, predict_los, predict_both, warm_up_models
+
+
+def separate(new_data):
+    """Alur lama: dua prediksi terpisah, masing-masing preprocessing sendiri"""
+    mortality_pred = predict_mortality(new_data)
+    los_pred = predict_los(new_data)
+    return mortality_pred, los_pred
+
+
+def best_of(func, repeat):
+    """Waktu terbaik dari beberapa kali eksekusi (detik), output print dibuang"""
+    timings = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--data', required=True, help='File Excel/CSV data pasien')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1, 100, 10_000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    source = pd.read_excel(args.data) if args.data.endswith(('.xlsx', '.xls')) else pd.read_csv(args.data)
+    source = source.drop(columns=['Mortality', 'LOS_days'], errors='ignore')
+    with contextlib.redirect_stdout(io.StringIO()):
+        warm_up_models()
+
+    tmp_dir = Path(tempfile.mkdtemp(prefix='bench_predict_both_'))
+    print(f"{'Baris':>8} | {'Input':>6} | {'Terpisah (ms)':>14} | {'predict_both (ms)':>18} | {'Speedup':>8}")
+    print("-" * 68)
+    for n_rows in args.sizes:
+        batch = source.sample(n=n_rows, replace=True, random_state=0).reset_index(drop=True)
+        csv_path = str(tmp_dir / f'batch_{n_rows}.csv')
+        batch.to_csv(csv_path, index=False)
+        for label, new_data in [('df', batch), ('csv', csv_path)]:
+            t_separate = best_of(lambda: separate(new_data), args.repeat)
+            t_fused = best_of(lambda: predict_both(new_data), args.repeat)
+            print(f"{n_rows:>8} | {label:>6} | {t_separate * 1000:>14.1f} | {t_fused * 1000:>18.1f} | "
+                  f"{t_separate / t_fused:>7.2f}x")
+
+    # Hasil harus identik dengan alur lama
+    with contextlib.redirect_stdout(io.StringIO()):
+        mortality_pred, los_pred = separate(batch)
+        fused = predict_both(batch)
+    assert (fused['Predicted_Mortality'].values == mortality_pred['prediction_label'].values).all()
+    assert (fused['Mortality_Probability'].values == mortality_pred['prediction_score'].values).all()
+    assert (fused['Predicted_LOS'].values == los_pred['prediction_label'].values).all()
+    print("\nHasil predict_both identik dengan prediksi terpisah.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark Batch Scoring Ter-shard
+Membandingkan score_frame di satu proses dengan ShardedScorer (process pool,
+model dimuat sekali per worker) untuk beberapa jumlah worker, dengan shard
+dikirim lewat shared memory (Arrow IPC) atau pickle, pada kohort sintetis
+
+Butuh model hasil training di folder models/. Jalankan dari root project:
+    python benchmarks/bench_sharded_scoring.py --rows 100000 500000 --workers 2 4
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from synthetic_cohort import generate_cohort
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 500_000])
+    parser.add_argument('--workers', type=int, nargs='+', default=sorted({2, os.cpu_count() or 1}))
+    parser.add_argument('--mortality-model', default='models/mortality_model')
+    parser.add_argument('--los-model', default='models/los_model')
+    parser.add_argument('--output', help='Simpan hasil ke file JSON')
+    args = parser.parse_args()
+
+    from predict import score_frame, warm_up_models
+    from sharded_scoring import ShardedScorer
+
+    models = {'mortality_model': args.mortality_model, 'los_model': args.los_model}
+    warm_up_models(args.mortality_model, args.los_model)
+    print(f"CPU: {os.cpu_count()}")
+    print(f"{'Baris':>9} | {'Mode':>24} | {'Start pool (s)':>14} | {'Scoring (s)':>11} | "
+          f"{'Speedup':>8} | {'Hasil sama':>10}")
+    print("-" * 94)
+    rows = []
+    for n_rows in args.rows:
+        df = generate_cohort(n_rows, seed=0)
+        start = time.perf_counter()
+        expected = score_frame(df, **models)
+        baseline = time.perf_counter() - start
+        rows.append({'rows': n_rows, 'mode': 'single', 'seconds': baseline})
+        print(f"{n_rows:>9} | {'1 proses':>24} | {'-':>14} | {baseline:>11.2f} | {1.0:>7.1f}x | {'-':>10}")
+
+        for n_workers in args.workers:
+            for transport in ('shared-memory', 'pickle'):
+                with ShardedScorer(n_workers, **models, shared_memory=transport == 'shared-memory') as scorer:
+                    # Panggilan pertama termasuk start worker dan load model per worker
+                    start = time.perf_counter()
+                    scorer.score(df)
+                    cold = time.perf_counter() - start
+                    start = time.perf_counter()
+                    result = scorer.score(df)
+                    warm = time.perf_counter() - start
+                same = bool(result.equals(expected))
+                mode = f"{n_workers} worker, {transport}"
+                rows.append({'rows': n_rows, 'mode': mode, 'workers': n_workers, 'transport': transport,
+                             'cold_seconds': cold, 'seconds': warm, 'same_predictions': same})
+                print(f"{n_rows:>9} | {mode:>24} | {cold - warm:>14.2f} | {warm:>11.2f} | "
+                      f"{baseline / warm:>7.1f}x | {str(same):>10}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(rows, f, indent=2)
+        print(f"\nHasil disimpan ke: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
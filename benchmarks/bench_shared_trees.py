@@ -0,0 +1,132 @@
+"""
+Benchmark Model Pohon Bersama untuk Banyak Worker
+Membandingkan worker yang masing-masing memuat inference bundle (unpickle
+joblib, salinan model per proses) dengan worker yang membuka file pohon
+bersama (`.trees`, memory map read-only) untuk ensemble Extra Trees besar yang
+dilatih pada kohort sintetis. Dilaporkan waktu load dan prediksi per worker
+serta memori USS (privat), PSS (bagian proses atas halaman bersama) dan RSS
+saat semua worker aktif.
+
+Jalankan dari root project:
+    python benchmarks/bench_shared_trees.py --trees 500 --workers 2 4
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import multiprocessing
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from synthetic_cohort import generate_cohort, NUMERIC_COLUMNS
+
+
+def _worker(mode, model_file, X, barrier, results):
+    """Muat model, prediksi X, ukur memori lalu tunggu worker lain sebelum keluar"""
+    import psutil
+    from inference_bundle import InferenceBundle
+    from shared_trees import load_shared_bundle
+
+    start = time.perf_counter()
+    bundle = load_shared_bundle(model_file) if mode == 'shared' else InferenceBundle.load(model_file)
+    load_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    label, score = bundle.predict_with_score(X)
+    predict_seconds = time.perf_counter() - start
+    # Ukur setelah semua worker selesai prediksi agar halaman bersama sudah dipetakan semua proses
+    barrier.wait()
+    memory = psutil.Process().memory_full_info()
+    results.put({'load_seconds': load_seconds, 'predict_seconds': predict_seconds,
+                 'uss_mb': memory.uss / 1e6, 'pss_mb': memory.pss / 1e6, 'rss_mb': memory.rss / 1e6,
+                 'label': np.asarray(label), 'score': score})
+    barrier.wait()
+
+
+def run_workers(mode, model_file, X, n_workers):
+    """Jalankan `n_workers` proses spawn sekaligus; kembalikan hasil per worker"""
+    context = multiprocessing.get_context('spawn')
+    barrier = context.Barrier(n_workers)
+    results = context.Queue()
+    workers = [context.Process(target=_worker, args=(mode, model_file, X, barrier, results))
+               for _ in range(n_workers)]
+    for worker in workers:
+        worker.start()
+    output = [results.get() for _ in workers]
+    for worker in workers:
+        worker.join()
+    return output
+
+
+def build_model(n_trees, n_rows, workdir):
+    """Latih Extra Trees pada kohort sintetis; simpan bundle joblib dan file pohon"""
+    from sklearn.ensemble import ExtraTreesClassifier
+    from inference_bundle import InferenceBundle
+    from shared_trees import build_shared_bundle_store
+
+    columns = list(NUMERIC_COLUMNS)
+    df = generate_cohort(n_rows, seed=0)
+    X = df[columns].astype('float64')
+    estimator = ExtraTreesClassifier(n_estimators=n_trees, min_samples_leaf=2, n_jobs=-1, random_state=42)
+    estimator.fit(X.fillna(X.mean()).to_numpy(), df['Mortality'])
+    bundle = InferenceBundle('classification', columns, X.mean().to_numpy(), np.zeros(len(columns)),
+                             np.ones(len(columns)), estimator, classes=estimator.classes_)
+    bundle_file = str(workdir / 'model.bundle.joblib')
+    trees_file = str(workdir / 'model.trees')
+    bundle.save(bundle_file)
+    build_shared_bundle_store(bundle, trees_file, X.head(2_000))
+    return bundle_file, trees_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--trees', type=int, default=500, help='Jumlah pohon Extra Trees')
+    parser.add_argument('--train-rows', type=int, default=50_000)
+    parser.add_argument('--predict-rows', type=int, default=5_000, help='Baris yang diprediksi per worker')
+    parser.add_argument('--workers', type=int, nargs='+', default=[2, 4])
+    parser.add_argument('--output', help='Simpan hasil ke file JSON')
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix='bench_shared_trees_'))
+    rows = []
+    try:
+        bundle_file, trees_file = build_model(args.trees, args.train_rows, workdir)
+        X = generate_cohort(args.predict_rows, seed=1)[list(NUMERIC_COLUMNS)]
+        print(f"Model: {args.trees} pohon | joblib {os.path.getsize(bundle_file) / 1e6:.1f} MB | "
+              f".trees {os.path.getsize(trees_file) / 1e6:.1f} MB | CPU: {os.cpu_count()}")
+        print(f"{'Worker':>6} | {'Mode':>7} | {'Load (s)':>8} | {'Prediksi (s)':>12} | {'USS (MB)':>9} | "
+              f"{'PSS (MB)':>9} | {'RSS (MB)':>9} | {'Hasil sama':>10}")
+        print("-" * 92)
+        for n_workers in args.workers:
+            expected = None
+            for mode, model_file in (('joblib', bundle_file), ('shared', trees_file)):
+                output = run_workers(mode, model_file, X, n_workers)
+                if expected is None:
+                    expected = output[0]
+                same = all(np.array_equal(r['label'], expected['label'])
+                           and np.array_equal(r['score'], expected['score']) for r in output)
+                summary = {key: float(np.mean([r[key] for r in output]))
+                           for key in ('load_seconds', 'predict_seconds', 'uss_mb', 'pss_mb', 'rss_mb')}
+                rows.append({'workers': n_workers, 'mode': mode, 'trees': args.trees,
+                             'same_predictions': bool(same), **summary})
+                print(f"{n_workers:>6} | {mode:>7} | {summary['load_seconds']:>8.2f} | "
+                      f"{summary['predict_seconds']:>12.2f} | {summary['uss_mb']:>9.1f} | "
+                      f"{summary['pss_mb']:>9.1f} | {summary['rss_mb']:>9.1f} | {str(same):>10}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print("\nMemori per worker rata-rata; total memori host ~ jumlah PSS semua worker")
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(rows, f, indent=2)
+        print(f"\nHasil disimpan ke: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark Prediksi Streaming
+Mengukur predict_stream (CSV -> CSV/Parquet, dengan dan tanpa kolom input)
+dibanding score_frame sekali jalan, pada kohort sintetis. Chunk pertama
+sengaja dibuat tanpa Key_person dan Sex (kolom kosong seluruhnya) agar skema
+Parquet yang ditetapkan chunk pertama juga diuji untuk chunk berikutnya yang
+berisi string.
+
+Butuh model hasil training di folder models/. Jalankan dari root project:
+    python benchmarks/bench_streaming.py --rows 100000 1000000 --chunk-size 50000
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from synthetic_cohort import generate_cohort
+
+# Kolom kategorikal yang dikosongkan di chunk pertama
+SPARSE_COLUMNS = ('Key_person', 'Sex')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000])
+    parser.add_argument('--chunk-size', type=int, default=50_000)
+    parser.add_argument('--mortality-model', default='models/mortality_model')
+    parser.add_argument('--los-model', default='models/los_model')
+    parser.add_argument('--output', help='Simpan hasil ke file JSON')
+    args = parser.parse_args()
+
+    from predict import PREDICTION_COLUMNS, predict_stream, score_frame, warm_up_models
+
+    models = {'mortality_model': args.mortality_model, 'los_model': args.los_model}
+    warm_up_models(args.mortality_model, args.los_model)
+    print(f"{'Baris':>9} | {'Mode':>22} | {'Waktu (s)':>9} | {'Baris/s':>10} | {'Hasil sama':>10}")
+    print("-" * 72)
+    rows = []
+    workdir = Path(tempfile.mkdtemp(prefix='bench_streaming_'))
+    try:
+        for n_rows in args.rows:
+            df = generate_cohort(n_rows, seed=0)
+            df.loc[:min(args.chunk_size, n_rows) - 1, list(SPARSE_COLUMNS)] = np.nan
+            input_path = str(workdir / 'input.csv')
+            df.to_csv(input_path, index=False)
+
+            start = time.perf_counter()
+            expected = score_frame(pd.read_csv(input_path), **models).reset_index(drop=True)
+            baseline = time.perf_counter() - start
+            rows.append({'rows': n_rows, 'mode': 'score_frame', 'seconds': baseline})
+            print(f"{n_rows:>9} | {'score_frame':>22} | {baseline:>9.2f} | {n_rows / baseline:>10.0f} | {'-':>10}")
+
+            for ext in ('.csv', '.parquet'):
+                for include_input in (False, True):
+                    output_path = str(workdir / f'output{ext}')
+                    summary = predict_stream(input_path, output_path, chunk_size=args.chunk_size,
+                                             include_input=include_input, **models)
+                    result = pd.read_parquet(output_path) if ext == '.parquet' else pd.read_csv(output_path)
+                    columns = [c for c in PREDICTION_COLUMNS if c in expected.columns]
+                    # CSV: teks float dibaca ulang bisa berbeda di digit terakhir
+                    same = len(result) == n_rows and np.allclose(result[columns].to_numpy(dtype='float64'),
+                                                                  expected[columns].to_numpy(dtype='float64'),
+                                                                  rtol=1e-12, atol=0, equal_nan=True)
+                    if include_input:
+                        # Nilai string di chunk berikutnya tetap tertulis
+                        same = same and all(result[col].notna().sum() == df[col].notna().sum()
+                                            for col in SPARSE_COLUMNS)
+                    mode = f"stream {ext[1:]}{' + input' if include_input else ''}"
+                    rows.append({'rows': n_rows, 'mode': mode, 'chunk_size': args.chunk_size,
+                                 'seconds': summary['seconds'], 'same_predictions': bool(same)})
+                    print(f"{n_rows:>9} | {mode:>22} | {summary['seconds']:>9.2f} | "
+                          f"{n_rows / summary['seconds']:>10.0f} | {str(bool(same)):>10}")
+                    os.remove(output_path)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(rows, f, indent=2)
+        print(f"\nHasil disimpan ke: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
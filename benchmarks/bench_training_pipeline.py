@@ -0,0 +1,90 @@
+"""
+Benchmark Wall-Clock Pipeline Training
+Membandingkan training LightGBM + Extra Tree per task dengan setup PyCaret
+terpisah untuk setiap model (alur lama) dan satu TrainingSession bersama per task
+
+Model disimpan ke folder sementara (folder models/ tidak disentuh). Jalankan
+dari root project setelah preprocessing:
+    python benchmarks/bench_training_pipeline.py --data data/processed_pneumonia_data.csv
+"""
+
+import io
+import sys
+import time
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from training_session import TrainingSession
+from train_mortality import train_mortality_model, train_extra_tree_model
+from train_los import train_los_model, train_extra_tree_regressor
+
+
+TASKS = {
+    'mortality': ('Mortality', 'classification', train_mortality_model, train_extra_tree_model),
+    'los': ('LOS_days', 'regression', train_los_model, train_extra_tree_regressor),
+}
+
+
+def run_task(task, data_path, model_dir, shared):
+    """
+    Latih LightGBM dan Extra Tree untuk satu task
+
+    Returns:
+    --------
+    timing : dict
+        Durasi total, durasi per model dan total waktu setup (detik)
+    """
+    target_col, kind, train_lgbm, train_et = TASKS[task]
+    if shared:
+        sessions = [TrainingSession(data_path, target_col, task=kind, model_dir=model_dir)] * 2
+    else:
+        # Alur lama: setiap trainer membaca data dan menjalankan setup sendiri
+        sessions = [
+            TrainingSession(data_path, target_col, task=kind, model_dir=model_dir),
+            TrainingSession(data_path, target_col, task=kind, model_dir=model_dir,
+                            feature_selection=False, remove_multicollinearity=False),
+        ]
+
+    timing = {}
+    start = time.perf_counter()
+    for name, trainer, session in [('lightgbm', train_lgbm, sessions[0]), ('et', train_et, sessions[1])]:
+        model_start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            trainer(data_path=data_path, target_col=target_col, session=session)
+        timing[name] = time.perf_counter() - model_start
+    timing['total'] = time.perf_counter() - start
+    timing['setup'] = sum(s.setup_seconds for s in {id(s): s for s in sessions}.values())
+    return timing
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--data', default='data/processed_pneumonia_data.csv')
+    parser.add_argument('--tasks', nargs='+', choices=list(TASKS), default=list(TASKS))
+    args = parser.parse_args()
+
+    # Import PyCaret di luar pengukuran agar mode pertama tidak dirugikan
+    import pycaret.classification
+    import pycaret.regression
+
+    model_dir = tempfile.mkdtemp(prefix='bench_training_')
+    print(f"{'Task':>10} | {'Mode':>8} | {'Setup (s)':>9} | {'LightGBM (s)':>12} | {'ExtraTree (s)':>13} | {'Total (s)':>9}")
+    print("-" * 78)
+    totals = {'separate': 0.0, 'shared': 0.0}
+    for task in args.tasks:
+        for mode in ('separate', 'shared'):
+            timing = run_task(task, args.data, model_dir, shared=(mode == 'shared'))
+            totals[mode] += timing['total']
+            print(f"{task:>10} | {mode:>8} | {timing['setup']:>9.1f} | {timing['lightgbm']:>12.1f} | "
+                  f"{timing['et']:>13.1f} | {timing['total']:>9.1f}")
+
+    print(f"\nTotal pipeline: terpisah {totals['separate']:.1f} s, session bersama {totals['shared']:.1f} s "
+          f"({totals['separate'] - totals['shared']:.1f} s lebih cepat)")
+
+
+if __name__ == "__main__":
+    main()
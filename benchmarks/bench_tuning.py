@@ -0,0 +1,72 @@
+"""
+Benchmark Engine Tuning (Time-to-Quality)
+Membandingkan random search `tune_model` PyCaret (baseline n_iter=50) dengan
+successive halving untuk LightGBM dan Extra Trees pada kedua task: durasi,
+jumlah fit, skor CV dan skor holdout
+
+Jalankan dari root project setelah preprocessing:
+    python benchmarks/bench_tuning.py --data data/processed_pneumonia_data.csv
+"""
+
+import os
+import io
+import sys
+import json
+import argparse
+import contextlib
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+from training_session import TrainingSession
+from tuning import ENGINES
+
+
+# Task -> (target, jenis task, metrik yang dioptimasi trainer)
+TASKS = {
+    'mortality': ('Mortality', 'classification', 'Accuracy'),
+    'los': ('LOS_days', 'regression', 'RMSE'),
+}
+MODELS = ('lightgbm', 'et')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--data', default='data/processed_pneumonia_data.csv')
+    parser.add_argument('--tasks', nargs='+', choices=list(TASKS), default=list(TASKS))
+    parser.add_argument('--engines', nargs='+', choices=ENGINES, default=list(ENGINES))
+    parser.add_argument('--n-iter', type=int, default=50, help='Konfigurasi random search (baseline)')
+    parser.add_argument('--output', default='results/tuning_comparison.json',
+                        help='File JSON hasil perbandingan')
+    args = parser.parse_args()
+
+    print(f"{'Task':>10} | {'Model':>8} | {'Engine':>8} | {'Waktu (s)':>9} | {'Fit':>5} | "
+          f"{'Metrik':>8} | {'CV':>8} | {'Holdout':>8}")
+    print("-" * 88)
+    rows = []
+    for task in args.tasks:
+        target_col, kind, optimize = TASKS[task]
+        session = TrainingSession(args.data, target_col, task=kind)
+        experiment = session.setup()
+        for model_id in MODELS:
+            with contextlib.redirect_stdout(io.StringIO()):
+                base_model = experiment.create_model(model_id, verbose=False)
+            for engine in args.engines:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    tuned = session.tune(base_model, optimize=optimize, n_iter=args.n_iter, engine=engine)
+                    experiment.predict_model(tuned, verbose=False)
+                record = dict(session.tuning_history[-1], task=task,
+                              holdout_score=float(experiment.pull()[optimize].iloc[0]))
+                rows.append(record)
+                print(f"{task:>10} | {model_id:>8} | {engine:>8} | {record['seconds']:>9.1f} | "
+                      f"{record['n_fits']:>5} | {optimize:>8} | {record['cv_score']:>8.4f} | "
+                      f"{record['holdout_score']:>8.4f}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(rows, f, indent=2, default=str)
+    print(f"\nHasil disimpan ke: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Load Test untuk HTTP Scoring Service
+Mengirim request satu-pasien secara bersamaan ke service lokal dan melaporkan
+latency p50/p99 serta throughput
+
+Jalankan service terlebih dahulu (python main.py serve), lalu:
+    python benchmarks/load_test.py --endpoint both --concurrency 16 --requests 2000
+"""
+
+import json
+import time
+import argparse
+import threading
+import urllib.request
+
+import numpy as np
+
+
+SAMPLE_PATIENT = {
+    'Age': 79, 'Sex': 'M', 'BMI': 18.5, 'Heart_rate': 100, 'Respiration_rate': 30,
+    'Temperature': 36.9, 'Systolic_BP': 120, 'Oxygen_need': 'Yes', 'Shock_vital': 'Yes',
+    'WBC': 9.8, 'Hemoglobin': 11.2, 'Platelet': 250, 'Total_protein': 6.7, 'Albumin': 2.8,
+    'Sodium': 138, 'BUN': 29, 'CRP': 15.7, 'LOC': 'Yes', 'Bedsore': 'Yes', 'Aspiration': 'Yes',
+    'ADL_category': 'Dependent', 'CCI': 6, 'Nursing_insurance': 'Yes', 'Key_person': 'Son',
+}
+
+
+def run_load(url, payload, n_requests, concurrency):
+    """
+    Kirim `n_requests` request dengan `concurrency` thread
+
+    Returns:
+    --------
+    latencies : np.ndarray
+        Latency setiap request sukses (detik)
+    elapsed : float
+        Total durasi (detik)
+    n_errors : int
+        Jumlah request gagal
+    """
+    body = json.dumps(payload).encode('utf-8')
+    latencies = []
+    errors = []
+    counter = iter(range(n_requests))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if next(counter, None) is None:
+                    return
+            request = urllib.request.Request(url, data=body, headers={'Content-Type': 'application/json'})
+            start = time.perf_counter()
+            try:
+                with urllib.request.urlopen(request) as response:
+                    response.read()
+                latency = time.perf_counter() - start
+                with lock:
+                    latencies.append(latency)
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return np.array(latencies), time.perf_counter() - start, len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--endpoint', choices=['mortality', 'los', 'both'], default='both')
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--warmup', type=int, default=20)
+    args = parser.parse_args()
+
+    url = f"{args.url}/predict/{args.endpoint}"
+    run_load(url, SAMPLE_PATIENT, args.warmup, 1)
+
+    print(f"Endpoint: {url}")
+    print(f"{'Concurrency':>11} | {'p50 (ms)':>9} | {'p99 (ms)':>9} | {'req/s':>9} | {'Error':>5}")
+    print("-" * 55)
+    for concurrency in args.concurrency:
+        latencies, elapsed, n_errors = run_load(url, SAMPLE_PATIENT, args.requests, concurrency)
+        p50, p99 = (np.percentile(latencies, [50, 99]) * 1000) if len(latencies) else (float('nan'),) * 2
+        print(f"{concurrency:>11} | {p50:>9.2f} | {p99:>9.2f} | {len(latencies) / elapsed:>9.1f} | {n_errors:>5}")
+
+
+if __name__ == "__main__":
+    main()
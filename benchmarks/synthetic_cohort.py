@@ -0,0 +1,204 @@
+"""
+Generator Kohort Pasien Pneumonia Sintetis
+Membuat data pasien dengan skema yang sama seperti data mentah
+(data/data-669-patients.xlsx): 22 fitur klinis di `FEATURES` config.py (dengan
+nama kolom dataset, mis. Respiration -> Respiration_rate, ADL -> ADL_category),
+Patient_ID, Systolic_BP, Key_person, serta target Mortality dan LOS_days
+
+Distribusi marginal, proporsi kategori dan missing value mengikuti dataset
+669 pasien; target dibuat dari fitur klinis sehingga model tetap punya sinyal.
+Data besar (sampai puluhan juta baris) ditulis per chunk:
+    python benchmarks/synthetic_cohort.py --rows 1000000 --output data/synthetic_1m.csv
+"""
+
+import os
+import argparse
+
+import numpy as np
+import pandas as pd
+
+
+# Kolom numerik: (mean, std, min, max, integer)
+NUMERIC_COLUMNS = {
+    'Age': (70.6, 17.6, 40, 99, True),
+    'BMI': (19.9, 2.9, 10.4, 28.6, False),
+    'Heart_rate': (95.1, 21.2, 60, 129, True),
+    'Respiration_rate': (24.9, 8.1, 12, 39, True),
+    'Temperature': (37.2, 0.7, 35.3, 39.1, False),
+    'Systolic_BP': (129.2, 29.0, 80, 179, True),
+    'WBC': (10.1, 2.9, 1.4, 19.0, False),
+    'Hemoglobin': (12.0, 1.5, 7.6, 16.7, False),
+    'Platelet': (250.5, 87.6, 100, 399, True),
+    'Total_protein': (6.5, 0.6, 4.5, 8.3, False),
+    'Albumin': (3.2, 0.5, 1.6, 4.8, False),
+    'Sodium': (137.7, 5.8, 128, 147, True),
+    'BUN': (33.1, 14.6, 8, 59, True),
+    'CRP': (10.1, 6.6, 0.3, 43.3, False),
+    'CCI': (4.4, 2.8, 0, 9, True),
+}
+
+# Kolom kategorikal: (nilai, proporsi)
+CATEGORICAL_COLUMNS = {
+    'Sex': (('F', 'M'), (0.504, 0.496)),
+    'Oxygen_need': (('Yes', 'No'), (0.525, 0.475)),
+    'Shock_vital': (('No', 'Yes'), (0.886, 0.114)),
+    'LOC': (('No', 'Yes'), (0.818, 0.182)),
+    'Bedsore': (('No', 'Yes'), (0.901, 0.099)),
+    'Aspiration': (('No', 'Yes'), (0.697, 0.303)),
+    'ADL_category': (('Independent', 'Dependent', 'Semi-dependent'), (0.359, 0.330, 0.311)),
+    'Nursing_insurance': (('Yes', 'No'), (0.561, 0.439)),
+    'Key_person': (('Son', 'Daughter', 'Spouse'), (0.343, 0.342, 0.315)),
+}
+
+# Proporsi missing value per kolom (seperti dataset asli)
+MISSING_RATES = {'BMI': 0.021, 'Albumin': 0.031, 'Key_person': 0.245}
+
+# Urutan kolom data mentah
+COLUMNS = [
+    'Patient_ID', 'Age', 'Sex', 'BMI', 'Heart_rate', 'Respiration_rate', 'Temperature',
+    'Systolic_BP', 'Oxygen_need', 'Shock_vital', 'WBC', 'Hemoglobin', 'Platelet',
+    'Total_protein', 'Albumin', 'Sodium', 'BUN', 'CRP', 'LOC', 'Bedsore', 'Aspiration',
+    'ADL_category', 'CCI', 'Nursing_insurance', 'Key_person', 'Mortality', 'LOS_days',
+]
+
+MORTALITY_RATE = 0.12
+LOS_RANGE = (3, 59)
+EXCEL_MAX_ROWS = 1_048_575
+DEFAULT_CHUNK_SIZE = 500_000
+
+
+def _standardize(values, column):
+    mean, std = NUMERIC_COLUMNS[column][:2]
+    return (values - mean) / std
+
+
+def _targets(data, rng):
+    """Mortality dan LOS_days dari fitur klinis (skor risiko + noise)"""
+    n_rows = len(data['Age'])
+    risk = (
+        0.6 * _standardize(data['Age'], 'Age')
+        - 0.5 * _standardize(data['Albumin'], 'Albumin')
+        + 0.4 * _standardize(data['BUN'], 'BUN')
+        + 0.3 * _standardize(data['CRP'], 'CRP')
+        + 0.3 * _standardize(data['Respiration_rate'], 'Respiration_rate')
+        + 1.2 * (data['Shock_vital'] == 'Yes')
+        + 0.8 * (data['LOC'] == 'Yes')
+        + 0.5 * (data['ADL_category'] == 'Dependent')
+    )
+    # Ambang kuantil: proporsi pasien meninggal = MORTALITY_RATE
+    logits = risk + rng.logistic(size=n_rows) * 0.5
+    threshold = np.quantile(logits, 1 - MORTALITY_RATE) if n_rows else 0.0
+    mortality = np.where(logits > threshold, 'Yes', 'No')
+
+    los_score = (
+        0.3 * risk
+        + 0.4 * (data['Bedsore'] == 'Yes')
+        + 0.3 * (data['Aspiration'] == 'Yes')
+        + 0.2 * _standardize(data['CCI'], 'CCI')
+        + rng.normal(size=n_rows)
+    )
+    low, high = LOS_RANGE
+    los = np.clip(np.round(28.0 + 14.0 * los_score), low, high).astype(np.int64)
+    return mortality, los
+
+
+def generate_cohort(n_rows, seed=0, start_id=1):
+    """
+    Buat satu kohort sintetis
+
+    Parameters:
+    -----------
+    n_rows : int
+        Jumlah pasien
+    seed : int atau np.random.SeedSequence
+        Seed generator (hasil sama untuk seed yang sama)
+    start_id : int
+        Patient_ID pasien pertama
+
+    Returns:
+    --------
+    df : pd.DataFrame
+        Kolom sesuai `COLUMNS` dengan tipe seperti hasil pd.read_excel data asli
+    """
+    rng = np.random.default_rng(seed)
+    data = {'Patient_ID': np.arange(start_id, start_id + n_rows, dtype=np.int64)}
+
+    for column, (mean, std, low, high, integer) in NUMERIC_COLUMNS.items():
+        values = np.clip(rng.normal(mean, std, n_rows), low, high)
+        data[column] = np.round(values).astype(np.int64) if integer else np.round(values, 1)
+
+    for column, (values, probs) in CATEGORICAL_COLUMNS.items():
+        codes = rng.choice(len(values), size=n_rows, p=np.asarray(probs) / np.sum(probs))
+        data[column] = np.asarray(values, dtype=object)[codes]
+
+    data['Mortality'], data['LOS_days'] = _targets(data, rng)
+
+    for column, rate in MISSING_RATES.items():
+        mask = rng.random(n_rows) < rate
+        values = data[column]
+        data[column] = np.where(mask, None if values.dtype == object else np.nan, values)
+
+    return pd.DataFrame(data, columns=COLUMNS)
+
+
+def iter_cohort_chunks(n_rows, chunk_size=DEFAULT_CHUNK_SIZE, seed=0):
+    """
+    Kohort besar per chunk (memori hanya sebesar satu chunk)
+
+    Setiap chunk memakai seed turunan dari `seed`, sehingga hasilnya
+    deterministik untuk kombinasi (n_rows, chunk_size, seed) yang sama.
+
+    Yields:
+    -------
+    chunk : pd.DataFrame
+    """
+    children = np.random.SeedSequence(seed).spawn(max(1, -(-n_rows // chunk_size)))
+    for index, start in enumerate(range(0, n_rows, chunk_size)):
+        yield generate_cohort(min(chunk_size, n_rows - start), seed=children[index], start_id=start + 1)
+
+
+def write_cohort(output_path, n_rows, chunk_size=DEFAULT_CHUNK_SIZE, seed=0):
+    """
+    Tulis kohort sintetis ke file CSV (per chunk) atau Excel
+
+    Parameters:
+    -----------
+    output_path : str
+        Path output (.csv, .xlsx atau .xls)
+    n_rows : int
+        Jumlah pasien
+    chunk_size : int
+        Jumlah baris per chunk yang dibuat dan ditulis sekaligus
+    seed : int
+        Seed generator
+
+    Returns:
+    --------
+    output_path : str
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    if output_path.endswith(('.xlsx', '.xls')):
+        if n_rows > EXCEL_MAX_ROWS:
+            raise ValueError(f"Excel maksimal {EXCEL_MAX_ROWS} baris, gunakan CSV untuk {n_rows} baris")
+        pd.concat(iter_cohort_chunks(n_rows, chunk_size, seed)).to_excel(output_path, index=False)
+        return output_path
+
+    for index, chunk in enumerate(iter_cohort_chunks(n_rows, chunk_size, seed)):
+        chunk.to_csv(output_path, mode='w' if index == 0 else 'a', header=index == 0, index=False)
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--output', required=True, help='File output .csv atau .xlsx')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    write_cohort(args.output, args.rows, chunk_size=args.chunk_size, seed=args.seed)
+    print(f"{args.rows} pasien sintetis disimpan ke: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,16 @@
 """
 File Konfigurasi untuk Project Prediksi Pneumonia
 Sesuaikan parameter sesuai kebutuhan
+
+Dibaca oleh src/run_config.py (RunConfig). Setiap nilai bisa di-override lewat
+environment `PNEUMONIA_<NAMA>` (mis. PNEUMONIA_N_JOBS=4) atau CLI
+`python main.py run --set n_jobs=4`.
 """
 
 # ============================================================================
 # PATH KONFIGURASI
 # ============================================================================
-RAW_DATA_PATH = "data/pneumonia_dataset.xlsx"
+RAW_DATA_PATH = "data/data-669-patients.xlsx"
 PROCESSED_DATA_PATH = "data/processed_pneumonia_data.csv"
 
 # Path untuk model
@@ -21,8 +25,8 @@ RESULTS_PATH = "results/predictions.csv"
 # ============================================================================
 # KOLOM TARGET
 # ============================================================================
-MORTALITY_TARGET_COL = "mortality"  # Ganti jika nama kolom berbeda
-LOS_TARGET_COL = "LOS"  # Ganti jika nama kolom berbeda
+MORTALITY_TARGET_COL = "Mortality"  # Ganti jika nama kolom berbeda
+LOS_TARGET_COL = "LOS_days"  # Ganti jika nama kolom berbeda
 
 # ============================================================================
 # PARAMETER TRAINING
@@ -35,10 +39,17 @@ NORMALIZE = True
 FEATURE_SELECTION = True
 REMOVE_MULTICOLLINEARITY = True
 MULTICOLLINEARITY_THRESHOLD = 0.95
-IGNORE_LOW_VARIANCE = True
+IGNORE_LOW_VARIANCE = True  # Buang fitur dengan varians nol
+
+# Cross-validation dan paralelisme
+CV_FOLDS = 10  # Jumlah fold CV (compare_models, tuning)
+N_JOBS = None  # Core untuk PyCaret/estimator (None = semua core)
+PARALLEL_TRAINING = False  # Latih task mortalitas dan LOS bersamaan
+LEADERBOARD_CACHE = True  # Cache hasil compare_models
 
 # Parameter Tuning
 TUNING_N_ITER = 50  # Jumlah iterasi untuk hyperparameter tuning
+TUNING_ENGINE = 'random'  # 'random' (random search PyCaret) atau 'halving'
 MORTALITY_OPTIMIZE = 'Accuracy'  # Metrik untuk optimasi klasifikasi
 LOS_OPTIMIZE = 'RMSE'  # Metrik untuk optimasi regresi
 
@@ -52,6 +63,17 @@ REGRESSION_MODELS = ['lightgbm', 'xgboost', 'rf', 'et', 'gbr', 'ada', 'dt']
 # PARAMETER PREPROCESSING
 # ============================================================================
 MISSING_VALUE_STRATEGY = 'mean'  # 'mean', 'median', 'mode', atau 'drop'
+OPTIMIZE_DTYPES = True  # Dtype ringkas (uint8/int kecil/float32/Categorical), lihat src/dtype_optimizer.py
+EDA_MODE = 'auto'  # 'full', 'profile' (streaming + sampel, di-cache), 'skip' atau 'auto'
+EDA_SAMPLE_SIZE = 10000  # Sampel reservoir untuk kuartil pada EDA mode profile
+INCREMENTAL_PREPROCESSING = False  # Hanya proses baris baru/berubah dengan imputer/encoder tersimpan (src/incremental.py)
+INGEST_CACHE = True  # Konversi Excel mentah sekali ke Parquet (cache/ingest/)
+EXCEL_ENGINE = 'auto'  # 'auto' (calamine jika terpasang), 'openpyxl' atau 'calamine'
+
+# ============================================================================
+# PARAMETER PREDIKSI
+# ============================================================================
+SCORING_WORKERS = 1  # Proses worker untuk score-stream (1 = satu proses, None = semua core)
 
 # ============================================================================
 # FITUR YANG DIGUNAKAN (Sesuai dokumen)
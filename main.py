@@ -4,103 +4,167 @@ Menggabungkan semua proses: preprocessing, training, dan prediksi
 """
 
 import sys
+import argparse
 from pathlib import Path
 
 # Add src to path
 sys.path.append(str(Path(__file__).parent / 'src'))
 
-from data_preprocessing import DataPreprocessor
-from train_mortality import train_mortality_model, train_extra_tree_model
-from train_los import train_los_model, train_extra_tree_regressor
-from predict import predict_both
-import pandas as pd
+# Modul pipeline (pandas, PyCaret, sklearn) diimpor di dalam subcommand yang
+# memakainya sehingga startup subcommand lain tetap ringan
+from log_config import configure_logging
 
 
-def main():
-    """Main function untuk menjalankan seluruh pipeline"""
+def main(config=None, clear_leaderboard_cache=False):
+    """
+    Main function untuk menjalankan seluruh pipeline
+
+    Parameters:
+    -----------
+    config : RunConfig atau None
+        Konfigurasi run (path, target, setup PyCaret, CV, tuning, paralelisme).
+        Default: config.py + override environment `PNEUMONIA_*`.
+    clear_leaderboard_cache : bool
+        Hapus cache leaderboard compare_models sebelum training
+    """
+    import pandas as pd
+    from data_preprocessing import DataPreprocessor
+    from predict import predict_both
+    from run_config import load_config
+    
+    config = config or load_config()
     
     print("=" * 70)
     print("PROJECT PREDIKSI MORTALITAS DAN RAWAT INAP PASIEN PNEUMONIA")
     print("Menggunakan Algoritma Machine Learning dengan Low Code PyCaret")
     print("=" * 70)
     
-    # Konfigurasi
-    RAW_DATA_PATH = "data/data-669-patients.xlsx"
-    PROCESSED_DATA_PATH = "data/processed_pneumonia_data.csv"
+    # Konfigurasi (config.py, bisa di-override lewat environment/CLI)
+    RAW_DATA_PATH = config.raw_data_path
+    PROCESSED_DATA_PATH = config.processed_data_path
     
     # Step 1: Data Preprocessing
     print("\n" + "=" * 70)
     print("STEP 1: DATA PREPROCESSING")
     print("=" * 70)
     
-    preprocessor = DataPreprocessor(RAW_DATA_PATH)
+    preprocessor = DataPreprocessor(RAW_DATA_PATH, ingest_cache=config.ingest_cache,
+                                    excel_engine=config.excel_engine,
+                                    track_rows=config.incremental_preprocessing)
     df = preprocessor.load_data()
     
     if df is None:
         print("Error: Gagal memuat data. Pastikan file dataset ada di path yang benar.")
         return
     
-    # Eksplorasi data
-    preprocessor.explore_data()
-    
-    # Handle missing values
-    preprocessor.handle_missing_values(strategy='mean')
-    
-    # Encode categorical
-    preprocessor.encode_categorical()
-    
-    # Simpan data yang sudah diproses
-    preprocessor.save_processed_data(PROCESSED_DATA_PATH)
-    
-    # Step 2: Training Model Mortalitas
-    print("\n" + "=" * 70)
-    print("STEP 2: TRAINING MODEL PREDIKSI MORTALITAS")
-    print("=" * 70)
+    # Mode inkremental: hanya baris baru/berubah yang diproses dan ditambahkan
+    counts = None
+    if config.incremental_preprocessing:
+        counts = preprocessor.update_processed_data(PROCESSED_DATA_PATH,
+                                                    strategy=config.missing_value_strategy)
     
-    try:
-        # Train LightGBM untuk mortalitas
-        mortality_model, mortality_pred = train_mortality_model(
-            data_path=PROCESSED_DATA_PATH,
-            target_col='Mortality',
-            test_size=0.2
-        )
+    if counts is not None:
+        print(f"Preprocessing inkremental: {counts['new']} baris baru, {counts['changed']} berubah, "
+              f"{counts['removed']} dihapus, {counts['unchanged']} tidak berubah")
+    else:
+        # Eksplorasi data (profil streaming untuk data besar, lihat EDA_MODE)
+        preprocessor.explore_data(mode=config.eda_mode, sample_size=config.eda_sample_size)
         
-        # Train Extra Tree untuk mortalitas
-        et_mortality_model = train_extra_tree_model(
-            data_path=PROCESSED_DATA_PATH,
-            target_col='Mortality',
-            test_size=0.2
-        )
+        # Dtype ringkas sesuai skema fitur klinis (flag Yes/No -> uint8, lab -> float32)
+        if config.optimize_dtypes:
+            preprocessor.optimize_dtypes()
         
-        print("\n✓ Model mortalitas berhasil ditraining!")
-    except Exception as e:
-        print(f"\n✗ Error training model mortalitas: {str(e)}")
-        print("Pastikan kolom 'Mortality' ada di dataset")
+        # Handle missing values
+        preprocessor.handle_missing_values(strategy=config.missing_value_strategy)
+        
+        # Encode categorical
+        preprocessor.encode_categorical()
+        
+        # Simpan data yang sudah diproses
+        preprocessor.save_processed_data(PROCESSED_DATA_PATH)
     
-    # Step 3: Training Model LOS
-    print("\n" + "=" * 70)
-    print("STEP 3: TRAINING MODEL PREDIKSI LENGTH OF STAY (LOS)")
-    print("=" * 70)
+    if clear_leaderboard_cache:
+        from leaderboard_cache import LeaderboardCache
+        removed = LeaderboardCache().clear()
+        print(f"\nCache leaderboard dihapus ({removed} entri)")
     
-    try:
-        # Train LightGBM untuk LOS
-        los_model, los_pred = train_los_model(
-            data_path=PROCESSED_DATA_PATH,
-            target_col='LOS_days',
-            test_size=0.2
-        )
+    if config.parallel_training:
+        # Step 2-3: Training kedua task bersamaan, satu proses per task
+        print("\n" + "=" * 70)
+        print("STEP 2-3: TRAINING MODEL MORTALITAS DAN LOS (PARALEL)")
+        print("=" * 70)
         
-        # Train Extra Tree Regressor untuk LOS
-        et_los_model = train_extra_tree_regressor(
-            data_path=PROCESSED_DATA_PATH,
-            target_col='LOS_days',
-            test_size=0.2
-        )
+        from parallel_training import train_tasks, print_summary
+        results = train_tasks(PROCESSED_DATA_PATH, config=config, parallel=True)
+        for name, result in results['tasks'].items():
+            # Log setiap task ditampilkan utuh setelah worker selesai
+            if result['log']:
+                print(result['log'])
+            if result['error'] is None:
+                print(f"\n✓ Model {name} berhasil ditraining!")
+            else:
+                print(f"\n✗ Error training model {name}: {result['error']}")
+        print_summary(results)
+    else:
+        from train_mortality import train_mortality_model, train_extra_tree_model
+        from train_los import train_los_model, train_extra_tree_regressor
+        from training_session import TrainingSession
         
-        print("\n✓ Model LOS berhasil ditraining!")
-    except Exception as e:
-        print(f"\n✗ Error training model LOS: {str(e)}")
-        print("Pastikan kolom 'LOS_days' ada di dataset")
+        # Step 2: Training Model Mortalitas
+        print("\n" + "=" * 70)
+        print("STEP 2: TRAINING MODEL PREDIKSI MORTALITAS")
+        print("=" * 70)
+        
+        try:
+            # Data dan setup PyCaret dipakai bersama oleh LightGBM dan Extra Tree
+            mortality_session = TrainingSession(
+                PROCESSED_DATA_PATH, config.mortality_target_col, task='classification', config=config
+            )
+        
+            # Train LightGBM untuk mortalitas
+            mortality_model, mortality_pred = train_mortality_model(
+                data_path=PROCESSED_DATA_PATH,
+                session=mortality_session
+            )
+        
+            # Train Extra Tree untuk mortalitas
+            et_mortality_model = train_extra_tree_model(
+                data_path=PROCESSED_DATA_PATH,
+                session=mortality_session
+            )
+        
+            print("\n✓ Model mortalitas berhasil ditraining!")
+        except Exception as e:
+            print(f"\n✗ Error training model mortalitas: {str(e)}")
+            print(f"Pastikan kolom '{config.mortality_target_col}' ada di dataset")
+        
+        # Step 3: Training Model LOS
+        print("\n" + "=" * 70)
+        print("STEP 3: TRAINING MODEL PREDIKSI LENGTH OF STAY (LOS)")
+        print("=" * 70)
+        
+        try:
+            # Data dan setup PyCaret dipakai bersama oleh LightGBM dan Extra Tree
+            los_session = TrainingSession(
+                PROCESSED_DATA_PATH, config.los_target_col, task='regression', config=config
+            )
+        
+            # Train LightGBM untuk LOS
+            los_model, los_pred = train_los_model(
+                data_path=PROCESSED_DATA_PATH,
+                session=los_session
+            )
+        
+            # Train Extra Tree Regressor untuk LOS
+            et_los_model = train_extra_tree_regressor(
+                data_path=PROCESSED_DATA_PATH,
+                session=los_session
+            )
+        
+            print("\n✓ Model LOS berhasil ditraining!")
+        except Exception as e:
+            print(f"\n✗ Error training model LOS: {str(e)}")
+            print(f"Pastikan kolom '{config.los_target_col}' ada di dataset")
     
     # Step 4: Prediksi (contoh)
     print("\n" + "=" * 70)
@@ -139,12 +203,12 @@ def main():
     try:
         results = predict_both(
             new_data=sample_data,
-            mortality_model='models/mortality_model',
-            los_model='models/los_model'
+            mortality_model=config.mortality_model_path,
+            los_model=config.los_model_path
         )
         
         if results is not None:
-            output_path = 'results/predictions.csv'
+            output_path = config.results_path
             results.to_csv(output_path, index=False)
             print(f"\n✓ Hasil prediksi disimpan ke: {output_path}")
     except Exception as e:
@@ -159,6 +223,125 @@ def main():
     print("\nUntuk melakukan prediksi pada data baru, gunakan script predict.py")
 
 
-if __name__ == "__main__":
-    main()
+def score_stream(args, config):
+    """Prediksi streaming untuk file pasien yang besar (subcommand `score-stream`)"""
+    from predict import predict_stream
+    predict_stream(
+        input_path=args.input,
+        output_path=args.output,
+        chunk_size=args.chunk_size,
+        mortality_model=args.mortality_model or config.mortality_model_path,
+        los_model=args.los_model or config.los_model_path,
+        include_input=args.include_input,
+        workers=args.workers if args.workers is not None else config.scoring_workers
+    )
+
+
+def serve_command(args, config):
+    """Jalankan HTTP scoring service (subcommand `serve`)"""
+    from server import serve
+    serve(
+        args.host, args.port,
+        mortality_model=args.mortality_model or config.mortality_model_path,
+        los_model=args.los_model or config.los_model_path,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms
+    )
+
+
+def run_profiled(trace_path, name, func):
+    """Jalankan command dengan instrumentasi tahap, lalu tampilkan ringkasan dan tulis trace"""
+    import instrumentation
+    instrumentation.enable()
+    try:
+        with instrumentation.stage(name):
+            return func()
+    finally:
+        instrumentation.disable()
+        print("\n" + "=" * 70)
+        print("PROFIL TAHAP (wall time, CPU time, peak RSS)")
+        print("=" * 70)
+        instrumentation.print_summary()
+        instrumentation.write_trace(trace_path, metadata={'command': name, 'argv': sys.argv})
+        print(f"\nTrace disimpan ke: {trace_path} (buka di ui.perfetto.dev atau chrome://tracing)")
 
+
+def load_run_config(args):
+    """RunConfig dari config.py, environment `PNEUMONIA_*`, `--set` lalu opsi CLI khusus"""
+    from run_config import load_config, parse_assignments
+    overrides = parse_assignments(getattr(args, 'set', None))
+    overrides.update({
+        'parallel_training': True if getattr(args, 'parallel', False) else None,
+        'incremental_preprocessing': True if getattr(args, 'incremental', False) else None,
+        'n_jobs': getattr(args, 'n_jobs', None),
+        'cv_folds': getattr(args, 'cv_folds', None),
+        'tuning_engine': getattr(args, 'tuning', None),
+        'tuning_n_iter': getattr(args, 'n_iter', None),
+    })
+    return load_config(args.config, overrides={k: v for k, v in overrides.items() if v is not None})
+
+
+def parse_args(argv=None):
+    """Parse argumen command line"""
+    parser = argparse.ArgumentParser(
+        description="Prediksi mortalitas dan rawat inap pasien pneumonia"
+    )
+    parser.add_argument('--quiet', action='store_true',
+                        help='Hanya tampilkan warning/error dari preprocessing dan prediksi')
+    parser.add_argument('--config', default=None,
+                        help='File konfigurasi Python (default config.py di project root)')
+    parser.add_argument('--profile', metavar='TRACE_JSON', default=None,
+                        help='Catat wall/CPU/peak RSS per tahap, tampilkan ringkasan dan tulis trace JSON')
+    subparsers = parser.add_subparsers(dest='command')
+    
+    run_parser = subparsers.add_parser('run', help='Jalankan seluruh pipeline (default)')
+    run_parser.add_argument('--parallel', action='store_true',
+                            help='Latih task mortalitas dan LOS bersamaan di proses terpisah')
+    run_parser.add_argument('--incremental', action='store_true',
+                            help='Hanya proses baris data mentah yang baru/berubah sejak run sebelumnya')
+    run_parser.add_argument('--n-jobs', type=int, default=None,
+                            help='Core per task (default config; saat --parallel core dibagi rata)')
+    run_parser.add_argument('--cv-folds', type=int, default=None, help='Jumlah fold cross-validation')
+    run_parser.add_argument('--tuning', choices=['random', 'halving'], default=None,
+                            help='Engine tuning: random search PyCaret atau successive halving')
+    run_parser.add_argument('--n-iter', type=int, default=None, help='Jumlah konfigurasi random search')
+    run_parser.add_argument('--set', action='append', metavar='NAMA=NILAI',
+                            help='Override field config apa pun, mis. --set regression_models=rf,et')
+    run_parser.add_argument('--clear-leaderboard-cache', action='store_true',
+                            help='Hapus cache leaderboard compare_models (hitung ulang semua model)')
+    
+    stream_parser = subparsers.add_parser(
+        'score-stream', help='Prediksi streaming per chunk untuk file pasien yang besar'
+    )
+    stream_parser.add_argument('--input', required=True, help='File input (.csv, .parquet, .feather atau .xlsx)')
+    stream_parser.add_argument('--output', required=True, help='File output (.csv atau .parquet)')
+    stream_parser.add_argument('--chunk-size', type=int, default=50_000, help='Jumlah baris per chunk')
+    stream_parser.add_argument('--mortality-model', default=None, help='Default: path di config')
+    stream_parser.add_argument('--los-model', default=None, help='Default: path di config')
+    stream_parser.add_argument('--include-input', action='store_true',
+                               help='Tulis semua kolom input bersama hasil prediksi')
+    stream_parser.add_argument('--workers', type=int, default=None,
+                               help='Proses worker untuk scoring per chunk (default config SCORING_WORKERS)')
+    
+    serve_parser = subparsers.add_parser('serve', help='Jalankan HTTP scoring service lokal')
+    from server import add_arguments
+    add_arguments(serve_parser)
+    
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    # CLI tetap verbose: tampilkan log INFO modul library ke stdout
+    configure_logging('WARNING' if args.quiet else 'INFO')
+    config = load_run_config(args)
+    commands = {
+        'run': lambda: main(config, clear_leaderboard_cache=getattr(args, 'clear_leaderboard_cache', False)),
+        'score-stream': lambda: score_stream(args, config),
+        'serve': lambda: serve_command(args, config),
+    }
+    command = args.command or 'run'
+    if args.profile:
+        run_profiled(args.profile, f'main.{command}', commands[command])
+    else:
+        commands[command]()
@@ -8,8 +8,12 @@ import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import os
+import sys
 from pathlib import Path
 
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+from data_io import read_table
+
 # Set style untuk visualisasi akademik
 plt.style.use('seaborn-v0_8-paper')
 sns.set_palette("husl")
@@ -28,8 +32,8 @@ data_path = Path(__file__).parent.parent / 'pneumonia-prediction' / 'data' / 'da
 processed_path = Path(__file__).parent.parent / 'pneumonia-prediction' / 'data' / 'processed_pneumonia_data.csv'
 
 print("Loading data...")
-df_raw = pd.read_excel(data_path)
-df_processed = pd.read_csv(processed_path)
+df_raw = read_table(str(data_path), ingest_cache=True)  # Excel dikonversi sekali ke cache Parquet
+df_processed = read_table(str(processed_path))
 
 # 1. Distribusi Jenis Kelamin
 print("1. Membuat visualisasi distribusi jenis kelamin...")
@@ -0,0 +1,211 @@
+"""
+Encoder Kategorikal untuk Dataset Pneumonia
+Vocabulary dipelajari sekali saat training, lalu disimpan bersama model dan
+dipakai ulang saat prediksi sehingga kode kategori selalu konsisten
+"""
+
+import os
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+ENCODER_SUFFIX = '.encoder.json'
+ENCODER_VERSION = 1
+
+
+class CategoricalEncoder:
+    """
+    Encoder kategorikal yang di-fit sekali dan transform secara vectorized
+
+    Kolom dengan 2 kategori di-encode seperti LabelEncoder (kategori diurutkan,
+    kode 0/1). Kolom multi-kategori di-encode one-hot dengan nama kolom
+    `<kolom>_<kategori>` seperti `pd.get_dummies`. Nilai yang tidak dikenal saat
+    transform dipetakan ke kode kategori terbanyak (binary) atau semua-nol
+    (one-hot).
+    """
+
+    def __init__(self):
+        self.binary = {}
+        self.onehot = {}
+        self.binary_defaults = {}
+        self._indexes = {}
+
+    @property
+    def columns(self):
+        """Kolom kategorikal yang dikenal encoder (urutan saat fit)"""
+        return list(self.binary) + list(self.onehot)
+
+    @staticmethod
+    def _categorical_columns(df):
+        return df.select_dtypes(include=['object', 'category']).columns.tolist()
+
+    def fit(self, df, columns=None):
+        """
+        Pelajari vocabulary dari data training
+
+        Parameters:
+        -----------
+        df : pd.DataFrame
+            Data training
+        columns : list atau None
+            Kolom yang di-encode. Jika None, semua kolom object/category.
+        """
+        if columns is None:
+            columns = self._categorical_columns(df)
+
+        self.binary = {}
+        self.onehot = {}
+        self.binary_defaults = {}
+        self._indexes = {}
+        for col in columns:
+            counts = df[col].value_counts(dropna=True)
+            vocabulary = sorted(counts.index.tolist())
+            if len(vocabulary) == 2:  # Binary
+                self.binary[col] = vocabulary
+                self.binary_defaults[col] = vocabulary.index(counts.idxmax())
+            else:  # Multi-class, gunakan one-hot encoding
+                self.onehot[col] = vocabulary
+        return self
+
+    def _lookup(self, col, vocabulary):
+        """Index vocabulary (hash table) untuk kolom, dibuat sekali lalu di-cache"""
+        index = self._indexes.get(col)
+        if index is None:
+            index = self._indexes[col] = pd.Index(vocabulary)
+        return index
+
+    def transform(self, df):
+        """
+        Encode DataFrame dengan vocabulary hasil fit
+
+        Hanya kolom yang masih bertipe object/category yang di-encode; kolom
+        yang sudah numerik dibiarkan apa adanya.
+
+        Parameters:
+        -----------
+        df : pd.DataFrame
+            Data yang akan di-encode
+
+        Returns:
+        --------
+        encoded : pd.DataFrame
+            Data dengan kolom binary berisi kode 0/1 dan kolom multi-kategori
+            diganti kolom one-hot (ditambahkan di akhir)
+        """
+        columns = {}
+        dummies = {}
+        for col in df.columns:
+            series = df[col]
+            is_categorical = series.dtype == object or isinstance(series.dtype, pd.CategoricalDtype)
+            if is_categorical and col in self.binary:
+                codes = self._lookup(col, self.binary[col]).get_indexer(series)
+                codes[codes < 0] = self.binary_defaults[col]
+                columns[col] = codes.astype(np.int64, copy=False)
+            elif is_categorical and col in self.onehot:
+                vocabulary = self.onehot[col]
+                codes = self._lookup(col, vocabulary).get_indexer(series)
+                # Lookup table: baris terakhir (kode -1) = kategori tidak dikenal
+                table = np.eye(len(vocabulary) + 1, len(vocabulary), dtype=bool)
+                matrix = table[codes]
+                for i, value in enumerate(vocabulary):
+                    dummies[f"{col}_{value}"] = matrix[:, i]
+            else:
+                columns[col] = series
+        columns.update(dummies)
+        return pd.DataFrame(columns, index=df.index)
+
+    def fit_transform(self, df, columns=None):
+        """Fit lalu transform data training"""
+        return self.fit(df, columns=columns).transform(df)
+
+    def to_dict(self):
+        """Konversi encoder ke dict yang bisa diserialisasi ke JSON"""
+        return {
+            'version': ENCODER_VERSION,
+            'binary': self.binary,
+            'onehot': self.onehot,
+            'binary_defaults': self.binary_defaults,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Bangun encoder dari dict hasil `to_dict`"""
+        encoder = cls()
+        encoder.binary = {k: list(v) for k, v in data.get('binary', {}).items()}
+        encoder.onehot = {k: list(v) for k, v in data.get('onehot', {}).items()}
+        encoder.binary_defaults = dict(data.get('binary_defaults', {}))
+        return encoder
+
+    def save(self, path):
+        """Simpan encoder ke file JSON"""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+
+    @classmethod
+    def load(cls, path):
+        """Muat encoder dari file JSON"""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def encoder_path_for(path):
+    """
+    Path artifact encoder untuk sebuah model atau file data
+
+    `models/mortality_model` -> `models/mortality_model.encoder.json`
+    `data/processed.csv` -> `data/processed.encoder.json`
+    """
+    root, ext = os.path.splitext(path)
+    if ext in ('.pkl', '.csv', '.xlsx', '.parquet', '.feather'):
+        path = root
+    return path + ENCODER_SUFFIX
+
+
+def save_encoder_for_model(data_path, model_path):
+    """
+    Salin encoder data training ke samping model
+
+    Parameters:
+    -----------
+    data_path : str
+        Path data training yang sudah diproses (encoder disimpan di sampingnya
+        oleh `DataPreprocessor.save_processed_data`)
+    model_path : str
+        Path model yang disimpan (tanpa ekstensi .pkl)
+
+    Returns:
+    --------
+    encoder_path : str atau None
+        Path file encoder yang ditulis, None jika data training tidak memiliki
+        encoder
+    """
+    source = encoder_path_for(data_path)
+    if not os.path.exists(source):
+        return None
+    target = encoder_path_for(model_path)
+    CategoricalEncoder.load(source).save(target)
+    return target
+
+
+_encoder_cache = {}
+_encoder_lock = threading.Lock()
+
+
+def load_encoder_for_model(model_path, refresh=False):
+    """
+    Ambil encoder untuk model dari cache in-memory
+
+    File encoder hanya dibaca sekali per proses (atau saat `refresh=True`,
+    mis. ketika model dimuat ulang). Mengembalikan None jika model tidak
+    memiliki artifact encoder.
+    """
+    key = encoder_path_for(model_path)
+    if not refresh and key in _encoder_cache:
+        return _encoder_cache[key]
+    with _encoder_lock:
+        encoder = CategoricalEncoder.load(key) if os.path.exists(key) else None
+        _encoder_cache[key] = encoder
+    return encoder
@@ -0,0 +1,165 @@
+"""
+Baca/Tulis Dataset Pneumonia
+Satu pintu untuk semua format data (Excel, CSV, Parquet, Feather) yang
+dipakai preprocessing, training dan prediksi
+
+Parquet dan Feather (Arrow) menyimpan dtype apa adanya (termasuk kategori dan
+integer nullable), mendukung proyeksi kolom tanpa mem-parse kolom lain, dan
+dibaca lewat memory map. Keduanya membutuhkan `pyarrow` (diimpor saat dipakai).
+"""
+
+import os
+
+import pandas as pd
+
+
+EXCEL_FORMATS = ('.xlsx', '.xls')
+COLUMNAR_FORMATS = ('.parquet', '.feather')
+FORMATS = ('.csv',) + EXCEL_FORMATS + COLUMNAR_FORMATS
+
+
+def data_format(path):
+    """
+    Ekstensi format file data ('.csv', '.xlsx', '.parquet', ...)
+
+    Raises:
+    -------
+    ValueError
+        Jika ekstensi tidak didukung
+    """
+    ext = os.path.splitext(str(path))[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"Format file tidak didukung: {path}. Gunakan {', '.join(FORMATS)}")
+    return ext
+
+
+def is_columnar(path):
+    """True jika path adalah file Parquet atau Feather"""
+    return str(path).lower().endswith(COLUMNAR_FORMATS)
+
+
+def read_table(path, columns=None, memory_map=True, ingest_cache=False, excel_engine='auto'):
+    """
+    Baca file data ke DataFrame
+
+    Parameters:
+    -----------
+    path : str
+        File .csv, .xlsx/.xls, .parquet atau .feather
+    columns : list atau None
+        Proyeksi kolom. Parquet/Feather (dan Excel yang sudah di-cache) hanya
+        membaca kolom ini dari disk; CSV tetap mem-parse seluruh baris tetapi
+        hanya menyimpan kolom ini.
+    memory_map : bool
+        Buka file Parquet/Feather lewat memory map (Feather tanpa kompresi
+        dibaca zero-copy dari page cache)
+    ingest_cache : bool atau IngestCache
+        Excel: True (atau IngestCache) mengonversi sekali ke Parquet di
+        cache/ingest/ lalu membaca dari sana (lihat modul ingest_cache).
+        False (default) membaca workbook langsung tanpa menulis cache.
+    excel_engine : str
+        Engine Excel: 'auto' (calamine jika terpasang), 'openpyxl' atau 'calamine'
+
+    Returns:
+    --------
+    df : pd.DataFrame
+    """
+    ext = data_format(path)
+    columns = list(columns) if columns is not None else None
+    if ext == '.parquet':
+        return pd.read_parquet(path, columns=columns, engine='pyarrow', memory_map=memory_map)
+    if ext == '.feather':
+        import pyarrow.feather as feather
+        return feather.read_table(path, columns=columns, memory_map=memory_map).to_pandas()
+    if ext == '.csv':
+        return pd.read_csv(path, usecols=columns)
+    from ingest_cache import read_excel_cached
+    return read_excel_cached(path, columns=columns, cache=ingest_cache, engine=excel_engine)
+
+
+def read_header(path):
+    """
+    DataFrame kosong dengan kolom dan dtype file data
+
+    Parquet/Feather hanya membaca metadata skema (dtype asli, termasuk
+    kategori); CSV/Excel membaca satu baris dan dtype-nya ditebak pandas.
+    """
+    ext = data_format(path)
+    if ext == '.parquet':
+        import pyarrow.parquet as pq
+        return pq.read_schema(path).empty_table().to_pandas()
+    if ext == '.feather':
+        import pyarrow as pa
+        with pa.memory_map(path) as source:
+            return pa.ipc.open_file(source).schema.empty_table().to_pandas()
+    if ext == '.csv':
+        return pd.read_csv(path, nrows=1).iloc[:0]
+    return pd.read_excel(path, nrows=1).iloc[:0]
+
+
+def output_path_for(path):
+    """
+    Path file yang benar-benar ditulis `write_table` untuk path tujuan
+
+    Path tanpa ekstensi yang dikenali (atau .xls, yang tidak bisa ditulis
+    pandas 2) menjadi `path + '.csv'`.
+    """
+    ext = os.path.splitext(str(path))[1].lower()
+    if ext not in FORMATS or ext == '.xls':
+        return path + '.csv'
+    return path
+
+
+def write_table(df, path, compression=None):
+    """
+    Tulis DataFrame ke file data sesuai ekstensi
+
+    Path tanpa ekstensi yang dikenali ditulis sebagai CSV (`path + '.csv'`),
+    seperti perilaku lama `save_processed_data`.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Data yang akan ditulis (index tidak ikut disimpan)
+    path : str
+        File tujuan
+    compression : str atau None
+        Kompresi Parquet/Feather. None: 'snappy' untuk Parquet dan
+        'uncompressed' untuk Feather (agar bisa dibaca zero-copy lewat memory map)
+
+    Returns:
+    --------
+    path : str
+        Path file yang ditulis
+    """
+    path = output_path_for(path)
+    ext = data_format(path)
+    if ext == '.parquet':
+        df.to_parquet(path, index=False, engine='pyarrow', compression=compression or 'snappy')
+    elif ext == '.feather':
+        df.reset_index(drop=True).to_feather(path, compression=compression or 'uncompressed')
+    elif ext == '.csv':
+        df.to_csv(path, index=False)
+    else:
+        df.to_excel(path, index=False)
+    return path
+
+
+def append_table(df, path):
+    """
+    Tambahkan baris ke file data yang sudah ada
+
+    CSV ditambahkan langsung di akhir file tanpa membaca isi lama; format lain
+    dibaca, digabung lalu ditulis ulang. Kolom `df` harus sama (dan berurutan
+    sama) dengan file.
+
+    Returns:
+    --------
+    path : str
+        Path file yang ditulis
+    """
+    path = output_path_for(path)
+    if data_format(path) == '.csv':
+        df.to_csv(path, mode='a', header=False, index=False)
+        return path
+    return write_table(pd.concat([read_table(path), df], ignore_index=True), path)
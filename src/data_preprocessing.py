@@ -3,148 +3,306 @@ Data Preprocessing untuk Dataset Pneumonia
 Mempersiapkan data untuk model machine learning
 """
 
+import io
+import os
+import logging
 import pandas as pd
 import numpy as np
 from pathlib import Path
+from categorical_encoder import CategoricalEncoder, encoder_path_for
+from missing_value_imputer import MissingValueImputer, imputer_path_for
+from data_io import read_table, read_header, write_table, append_table, output_path_for
+from dtype_optimizer import optimize_dtypes, memory_report, format_memory_report
+from data_profile import DEFAULT_SAMPLE_SIZE, cached_profile, describe_profile
+from incremental import KEY_COLUMN, manifest_path_for, row_keys, diff_rows
+from log_config import get_logger, verbose_method
+from instrumentation import instrumented
+
+
+logger = get_logger('data_preprocessing')
+
+EDA_MODES = ('auto', 'full', 'profile', 'skip')
+# Mode 'auto': EDA penuh sampai jumlah baris ini, profil streaming di atasnya
+EDA_FULL_MAX_ROWS = 100_000
 
 
 class DataPreprocessor:
     """Class untuk preprocessing data pneumonia"""
     
-    def __init__(self, data_path):
+    def __init__(self, data_path, verbose=False, columns=None, ingest_cache=False, excel_engine='auto',
+                 track_rows=False):
         """
         Initialize DataPreprocessor
         
         Parameters:
         -----------
         data_path : str
-            Path ke file dataset
+            Path ke file dataset (.xlsx, .xls, .csv, .parquet atau .feather)
+        verbose : bool
+            Jika True, progres dan ringkasan data ditampilkan ke stdout. Jika
+            False, output mengikuti konfigurasi logger `pneumonia` (default diam).
+        columns : list atau None
+            Hanya muat kolom ini (None: semua kolom)
+        ingest_cache : bool
+            Jika True, workbook Excel dikonversi sekali ke Parquet
+            (cache/ingest/) dan pembacaan berikutnya memakai hasil konversi
+            tersebut. Default False: workbook dibaca langsung.
+        excel_engine : str
+            'auto' (calamine jika terpasang), 'openpyxl' atau 'calamine'
+        track_rows : bool
+            Catat key dan hash setiap baris mentah saat load (`self.row_keys`)
+            sehingga `save_processed_data` menulis manifest baris untuk
+            preprocessing inkremental (`update_processed_data`)
         """
         self.data_path = data_path
+        self.columns = columns
+        self.ingest_cache = ingest_cache
+        self.excel_engine = excel_engine
+        self.track_rows = track_rows
+        self.verbose = verbose
         self.df = None
-        
+        self.encoder = None
+        self.imputer = None
+        self.binary_vocabularies = {}
+        self.memory_report = None
+        self.profile = None
+        self.row_keys = None
+        
+    @instrumented()
+    @verbose_method
     def load_data(self):
-        """Load data dari file Excel atau CSV"""
+        """Load data dari file Excel, CSV, Parquet atau Feather"""
         try:
-            if self.data_path.endswith('.xlsx') or self.data_path.endswith('.xls'):
-                self.df = pd.read_excel(self.data_path)
-            elif self.data_path.endswith('.csv'):
-                self.df = pd.read_csv(self.data_path)
-            else:
-                raise ValueError("Format file tidak didukung. Gunakan .xlsx, .xls, atau .csv")
+            self.df = read_table(self.data_path, columns=self.columns,
+                                 ingest_cache=self.ingest_cache, excel_engine=self.excel_engine)
+            if self.track_rows:
+                self.row_keys = row_keys(self.df)
             
-            print(f"Data berhasil dimuat: {self.df.shape[0]} baris, {self.df.shape[1]} kolom")
+            logger.info("Data berhasil dimuat: %d baris, %d kolom", self.df.shape[0], self.df.shape[1])
             return self.df
         except Exception as e:
-            print(f"Error loading data: {str(e)}")
+            logger.error("Error loading data: %s", e)
             return None
     
-    def explore_data(self):
-        """Eksplorasi data dasar (EDA)"""
+    @instrumented()
+    @verbose_method
+    def explore_data(self, mode='auto', sample_size=DEFAULT_SAMPLE_SIZE, cache=True):
+        """
+        Eksplorasi data dasar (EDA), hanya dihitung jika level INFO aktif
+        
+        Parameters:
+        -----------
+        mode : str
+            'full' (info/describe/duplicated/value_counts atas seluruh data),
+            'profile' (profil streaming satu pass, lihat modul data_profile),
+            'skip', atau 'auto' (full sampai EDA_FULL_MAX_ROWS baris, profile
+            untuk data yang lebih besar)
+        sample_size : int
+            Ukuran sampel reservoir untuk kuartil pada mode profile
+        cache : bool
+            Mode profile: pakai profil dari cache/profile/ jika fingerprint
+            data sama
+        """
+        if mode not in EDA_MODES:
+            raise ValueError(f"mode harus salah satu dari {EDA_MODES}")
         if self.df is None:
-            print("Data belum dimuat. Jalankan load_data() terlebih dahulu.")
+            logger.warning("Data belum dimuat. Jalankan load_data() terlebih dahulu.")
+            return
+        
+        # info(), describe() dan value_counts() mahal untuk data besar:
+        # lewati semuanya jika output tidak ditampilkan
+        if mode == 'skip' or not logger.isEnabledFor(logging.INFO):
+            return
+        
+        if mode == 'auto':
+            mode = 'full' if len(self.df) <= EDA_FULL_MAX_ROWS else 'profile'
+        if mode == 'profile':
+            self._explore_profile(sample_size, cache)
             return
         
-        print("=" * 50)
-        print("EKSPLORASI DATA (EDA)")
-        print("=" * 50)
-        print(f"\n1. Shape: {self.df.shape}")
-        print(f"   - Jumlah baris: {self.df.shape[0]}")
-        print(f"   - Jumlah kolom: {self.df.shape[1]}")
+        logger.info("=" * 50)
+        logger.info("EKSPLORASI DATA (EDA)")
+        logger.info("=" * 50)
+        logger.info(f"\n1. Shape: {self.df.shape}")
+        logger.info(f"   - Jumlah baris: {self.df.shape[0]}")
+        logger.info(f"   - Jumlah kolom: {self.df.shape[1]}")
         
-        print(f"\n2. Kolom: {list(self.df.columns)}")
+        logger.info(f"\n2. Kolom: {list(self.df.columns)}")
         
-        print(f"\n3. Info Data:")
-        print(self.df.info())
+        logger.info(f"\n3. Info Data:")
+        buffer = io.StringIO()
+        self.df.info(buf=buffer)
+        logger.info(buffer.getvalue())
         
-        print(f"\n4. Statistik Deskriptif:")
-        print(self.df.describe())
+        logger.info(f"\n4. Statistik Deskriptif:")
+        logger.info(self.df.describe())
         
-        print(f"\n5. Missing Values:")
+        logger.info(f"\n5. Missing Values:")
         missing = self.df.isnull().sum()
         if missing.sum() > 0:
-            print(missing[missing > 0])
+            logger.info(missing[missing > 0])
         else:
-            print("Tidak ada missing values")
+            logger.info("Tidak ada missing values")
         
-        print(f"\n6. Duplikat: {self.df.duplicated().sum()}")
+        logger.info(f"\n6. Duplikat: {self.df.duplicated().sum()}")
         
-        print(f"\n7. Distribusi Variabel Kategorikal:")
+        logger.info(f"\n7. Distribusi Variabel Kategorikal:")
         categorical_cols = self.df.select_dtypes(include=['object']).columns
         for col in categorical_cols[:5]:  # Tampilkan 5 pertama
-            print(f"\n   {col}:")
-            print(f"   {self.df[col].value_counts().head()}")
+            logger.info(f"\n   {col}:")
+            logger.info(f"   {self.df[col].value_counts().head()}")
         
-        print(f"\n8. Distribusi Variabel Numerik (Target):")
+        logger.info(f"\n8. Distribusi Variabel Numerik (Target):")
         if 'Mortality' in self.df.columns:
-            print(f"   Mortality: {self.df['Mortality'].value_counts().to_dict()}")
+            logger.info(f"   Mortality: {self.df['Mortality'].value_counts().to_dict()}")
         if 'LOS_days' in self.df.columns:
-            print(f"   LOS_days: Min={self.df['LOS_days'].min()}, Max={self.df['LOS_days'].max()}, Mean={self.df['LOS_days'].mean():.2f}")
+            logger.info(f"   LOS_days: Min={self.df['LOS_days'].min()}, Max={self.df['LOS_days'].max()}, Mean={self.df['LOS_days'].mean():.2f}")
+        
+    def _explore_profile(self, sample_size, cache):
+        """EDA dari profil streaming (statistik satu pass, sampel dan hash)"""
+        self.profile = cached_profile(self.df, cache=cache, sample_size=sample_size)
+        profile = self.profile
+        stats = profile['columns_stats']
+        
+        logger.info("=" * 50)
+        logger.info("EKSPLORASI DATA (PROFIL STREAMING%s)", ", DARI CACHE" if profile['cached'] else "")
+        logger.info("=" * 50)
+        logger.info(f"\n1. Shape: ({profile['rows']}, {len(profile['columns'])})")
+        logger.info(f"   - Jumlah baris: {profile['rows']}")
+        logger.info(f"   - Jumlah kolom: {len(profile['columns'])}")
+        
+        logger.info(f"\n2. Kolom: {profile['columns']}")
+        
+        logger.info(f"\n3. Info Data (memori {profile['memory_bytes'] / 1e6:.1f} MB):")
+        for col, col_stats in stats.items():
+            logger.info(f"   {col:<20} {col_stats['count']:>10} non-null  {col_stats['dtype']:<10} "
+                        f"~{col_stats['distinct_approx']} unik")
+        
+        logger.info(f"\n4. Statistik Deskriptif (kuartil dari sampel {profile['sample_size']} baris):")
+        logger.info(describe_profile(profile))
+        
+        logger.info(f"\n5. Missing Values:")
+        missing = {col: col_stats['missing'] for col, col_stats in stats.items() if col_stats['missing']}
+        logger.info(pd.Series(missing) if missing else "Tidak ada missing values")
+        
+        logger.info(f"\n6. Duplikat (hash baris): {profile['duplicates']}")
+        
+        logger.info(f"\n7. Distribusi Variabel Kategorikal:")
+        categorical = [col for col, col_stats in stats.items() if 'top_values' in col_stats]
+        for col in categorical[:5]:  # Tampilkan 5 pertama
+            logger.info(f"\n   {col}:")
+            logger.info(f"   {dict(list(stats[col]['top_values'].items())[:5])}")
+        
+        logger.info(f"\n8. Distribusi Variabel Numerik (Target):")
+        if 'Mortality' in stats:
+            mortality = stats['Mortality']
+            logger.info(f"   Mortality: {mortality.get('top_values', {'mean': mortality.get('mean')})}")
+        if 'LOS_days' in stats:
+            los = stats['LOS_days']
+            logger.info(f"   LOS_days: Min={los.get('min')}, Max={los.get('max')}, Mean={los.get('mean', 0):.2f}")
+    
+    @instrumented()
+    @verbose_method
+    def optimize_dtypes(self, schema=None, report=None):
+        """
+        Turunkan dtype sesuai skema fitur klinis (lihat modul dtype_optimizer)
         
+        Flag Yes/No menjadi uint8 (kode sama dengan hasil encoding), tanda
+        vital dan skor menjadi integer kecil, hasil lab float32 dan kategori
+        string Categorical. Vocabulary flag disimpan ke encoder saat
+        `encode_categorical` sehingga data prediksi mentah tetap di-encode.
+        
+        Parameters:
+        -----------
+        schema : dict atau None
+            Override skema {kolom: 'id'|'binary'|'int'|'float'|'category'}
+        report : bool atau None
+            Hitung laporan memori per kolom (`self.memory_report`). None:
+            hanya jika level INFO aktif (memory_usage deep mahal untuk data besar).
+        """
+        if self.df is None:
+            logger.warning("Data belum dimuat.")
+            return
+        
+        before = self.df
+        self.df, self.binary_vocabularies = optimize_dtypes(before, schema=schema)
+        if report or (report is None and logger.isEnabledFor(logging.INFO)):
+            self.memory_report = memory_report(before, self.df)
+            total = self.memory_report.loc['TOTAL']
+            logger.info("Memori data: %.2f MB -> %.2f MB (hemat %.1f%%)",
+                        total['bytes_before'] / 1e6, total['bytes_after'] / 1e6, total['saving_pct'])
+            logger.info("\n%s", format_memory_report(self.memory_report))
+    
+    @instrumented()
+    @verbose_method
     def handle_missing_values(self, strategy='mean'):
         """
         Menangani missing values
         
+        Statistik pengisian dihitung sekali untuk semua kolom lalu diisi dalam
+        satu operasi. Imputer disimpan di `self.imputer` (dan di samping data
+        yang diproses) agar prediksi memakai statistik data training.
+        
         Parameters:
         -----------
         strategy : str
             'mean', 'median', 'mode', atau 'drop'
         """
         if self.df is None:
-            print("Data belum dimuat.")
+            logger.warning("Data belum dimuat.")
             return
         
-        missing_count = self.df.isnull().sum()
-        if missing_count.sum() == 0:
-            print("Tidak ada missing values.")
+        self.imputer = MissingValueImputer(strategy)
+        missing_total = int(self.df.isna().to_numpy().sum())
+        if missing_total == 0:
+            self.imputer.fit(self.df)
+            logger.info("Tidak ada missing values.")
             return
         
-        print(f"Missing values sebelum handling: {missing_count.sum()}")
-        
-        for col in self.df.columns:
-            if self.df[col].isnull().sum() > 0:
-                if strategy == 'mean' and self.df[col].dtype in ['int64', 'float64']:
-                    self.df[col].fillna(self.df[col].mean(), inplace=True)
-                elif strategy == 'median' and self.df[col].dtype in ['int64', 'float64']:
-                    self.df[col].fillna(self.df[col].median(), inplace=True)
-                elif strategy == 'mode':
-                    self.df[col].fillna(self.df[col].mode()[0], inplace=True)
-                elif strategy == 'drop':
-                    self.df.dropna(subset=[col], inplace=True)
-        
-        print(f"Missing values setelah handling: {self.df.isnull().sum().sum()}")
+        logger.info("Missing values sebelum handling: %d", missing_total)
+        self.df = self.imputer.fit_transform(self.df)
+        logger.info("Missing values setelah handling: %d", self.df.isna().to_numpy().sum())
     
+    @instrumented()
+    @verbose_method
     def encode_categorical(self):
         """Encode variabel kategorikal menjadi numerik"""
         if self.df is None:
-            print("Data belum dimuat.")
+            logger.warning("Data belum dimuat.")
             return
         
         # Drop Patient_ID karena itu identifier, bukan feature
         if 'Patient_ID' in self.df.columns:
             self.df = self.df.drop(columns=['Patient_ID'])
-            print("Patient_ID dihapus (identifier, bukan feature)")
+            logger.info("Patient_ID dihapus (identifier, bukan feature)")
         
-        categorical_cols = self.df.select_dtypes(include=['object']).columns
+        categorical_cols = self.df.select_dtypes(include=['object', 'category']).columns
+        # Flag yang sudah dikonversi optimize_dtypes (uint8) tetap dicatat di encoder
+        binary_vocabularies = {col: vocabulary for col, vocabulary in self.binary_vocabularies.items()
+                               if col in self.df.columns}
         
-        if len(categorical_cols) == 0:
-            print("Tidak ada kolom kategorikal yang perlu di-encode.")
+        if len(categorical_cols) == 0 and not binary_vocabularies:
+            logger.info("Tidak ada kolom kategorikal yang perlu di-encode.")
             return
         
-        print(f"Kolom kategorikal yang akan di-encode: {list(categorical_cols)}")
+        logger.info("Kolom kategorikal yang akan di-encode: %s", list(categorical_cols))
         
-        # Label encoding untuk kolom binary
-        from sklearn.preprocessing import LabelEncoder
-        le = LabelEncoder()
+        # Fit encoder sekali pada data training. Vocabulary disimpan bersama
+        # data yang diproses (dan model) sehingga prediksi memakai kode yang sama
+        self.encoder = CategoricalEncoder().fit(self.df, columns=list(categorical_cols))
+        for col, vocabulary in binary_vocabularies.items():
+            self.encoder.binary[col] = vocabulary
+            self.encoder.binary_defaults[col] = int(self.df[col].mean() >= 0.5)
+        self.df = self.encoder.transform(self.df)
         
         for col in categorical_cols:
-            if self.df[col].nunique() == 2:  # Binary
-                self.df[col] = le.fit_transform(self.df[col])
-                print(f"{col}: Binary encoding")
+            if col in self.encoder.binary:  # Binary
+                logger.info("%s: Binary encoding", col)
             else:  # Multi-class, gunakan one-hot encoding
-                self.df = pd.get_dummies(self.df, columns=[col], prefix=col)
-                print(f"{col}: One-hot encoding")
+                logger.info("%s: One-hot encoding", col)
     
+    @instrumented()
+    @verbose_method
     def prepare_mortality_data(self, target_col='mortality'):
         """
         Siapkan data untuk prediksi mortalitas (klasifikasi)
@@ -155,23 +313,26 @@ class DataPreprocessor:
             Nama kolom target untuk mortalitas
         """
         if self.df is None:
-            print("Data belum dimuat.")
+            logger.warning("Data belum dimuat.")
             return None
         
         if target_col not in self.df.columns:
-            print(f"Kolom '{target_col}' tidak ditemukan.")
-            print(f"Kolom yang tersedia: {list(self.df.columns)}")
+            logger.warning("Kolom '%s' tidak ditemukan.", target_col)
+            logger.warning("Kolom yang tersedia: %s", list(self.df.columns))
             return None
         
         # Pastikan target adalah binary (Yes/No atau 1/0)
         if self.df[target_col].dtype == 'object':
             self.df[target_col] = self.df[target_col].map({'Yes': 1, 'No': 0, 'Y': 1, 'N': 0})
         
-        print(f"Data mortalitas siap: {self.df.shape[0]} sampel")
-        print(f"Distribusi target: {self.df[target_col].value_counts().to_dict()}")
+        logger.info("Data mortalitas siap: %d sampel", self.df.shape[0])
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Distribusi target: %s", self.df[target_col].value_counts().to_dict())
         
         return self.df
     
+    @instrumented()
+    @verbose_method
     def prepare_los_data(self, target_col='LOS'):
         """
         Siapkan data untuk prediksi Length of Stay (regresi)
@@ -182,36 +343,141 @@ class DataPreprocessor:
             Nama kolom target untuk LOS
         """
         if self.df is None:
-            print("Data belum dimuat.")
+            logger.warning("Data belum dimuat.")
             return None
         
         if target_col not in self.df.columns:
-            print(f"Kolom '{target_col}' tidak ditemukan.")
-            print(f"Kolom yang tersedia: {list(self.df.columns)}")
+            logger.warning("Kolom '%s' tidak ditemukan.", target_col)
+            logger.warning("Kolom yang tersedia: %s", list(self.df.columns))
             return None
         
         # Pastikan target adalah numerik
         self.df[target_col] = pd.to_numeric(self.df[target_col], errors='coerce')
         
-        print(f"Data LOS siap: {self.df.shape[0]} sampel")
-        print(f"Statistik LOS: Min={self.df[target_col].min()}, Max={self.df[target_col].max()}, Mean={self.df[target_col].mean():.2f}")
+        logger.info("Data LOS siap: %d sampel", self.df.shape[0])
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Statistik LOS: Min={self.df[target_col].min()}, Max={self.df[target_col].max()}, Mean={self.df[target_col].mean():.2f}")
         
         return self.df
     
+    @instrumented()
+    @verbose_method
     def save_processed_data(self, output_path):
-        """Simpan data yang sudah diproses"""
+        """
+        Simpan data yang sudah diproses
+        
+        Format mengikuti ekstensi: .parquet/.feather menyimpan dtype apa adanya
+        dan dibaca jauh lebih cepat daripada .csv; .xlsx; selain itu CSV.
+        
+        Parameters:
+        -----------
+        output_path : str
+            File tujuan
+        """
         if self.df is None:
-            print("Data belum dimuat.")
+            logger.warning("Data belum dimuat.")
             return
         
-        if output_path.endswith('.csv'):
-            self.df.to_csv(output_path, index=False)
-        elif output_path.endswith('.xlsx'):
-            self.df.to_excel(output_path, index=False)
+        output_path = write_table(self.df, output_path)
+        
+        # Simpan encoder kategorikal dan imputer di samping data untuk disalin ke model
+        if self.encoder is not None:
+            self.encoder.save(encoder_path_for(output_path))
+        if self.imputer is not None:
+            self.imputer.save(imputer_path_for(output_path))
+        
+        # Manifest baris mengikuti baris yang tersimpan (baris yang di-drop tidak tercatat).
+        # Tanpa row_keys manifest lama tidak lagi cocok dengan data sehingga dihapus.
+        manifest_path = manifest_path_for(output_path)
+        if self.row_keys is not None:
+            write_table(self.row_keys.loc[self.df.index].reset_index(drop=True), manifest_path)
+        elif os.path.exists(manifest_path):
+            os.remove(manifest_path)
+        
+        logger.info("Data berhasil disimpan ke: %s", output_path)
+    
+    @instrumented()
+    @verbose_method
+    def update_processed_data(self, output_path, strategy=None):
+        """
+        Preprocessing inkremental: proses hanya baris sumber yang baru atau berubah
+        
+        Baris mentah dibandingkan dengan manifest baris di samping data hasil
+        preprocessing (key Patient_ID atau hash baris, lihat modul
+        incremental). Baris baru/berubah diisi dan di-encode dengan imputer
+        dan encoder yang tersimpan (tanpa fit ulang: kategori yang belum
+        pernah dilihat menjadi kolom one-hot nol), lalu ditambahkan ke data.
+        CSV ditambahkan di akhir file; jika ada baris yang berubah atau
+        dihapus dari sumber, data ditulis ulang tanpa baris lama tersebut.
+        
+        Panggil setelah `load_data` (data mentah, tanpa optimize_dtypes).
+        
+        Parameters:
+        -----------
+        output_path : str
+            File data hasil preprocessing (sama dengan `save_processed_data`)
+        strategy : str atau None
+            Strategi missing value yang diminta; jika berbeda dari imputer
+            tersimpan, preprocessing penuh diperlukan
+        
+        Returns:
+        --------
+        counts : dict atau None
+            Jumlah baris 'new', 'changed', 'unchanged' dan 'removed'. None
+            jika data, manifest atau imputer belum ada, strategi berbeda, atau
+            kolom hasil tidak cocok dengan data: lakukan preprocessing penuh.
+        """
+        if self.df is None:
+            logger.warning("Data belum dimuat.")
+            return None
+        
+        output_path = output_path_for(output_path)
+        manifest_path = manifest_path_for(output_path)
+        imputer_path = imputer_path_for(output_path)
+        if not all(os.path.exists(path) for path in (output_path, manifest_path, imputer_path)):
+            logger.info("Data hasil preprocessing atau manifest baris belum ada: preprocessing penuh.")
+            return None
+        imputer = MissingValueImputer.load(imputer_path)
+        if strategy is not None and imputer.strategy != strategy:
+            logger.info("Strategi missing value berubah (%s -> %s): preprocessing penuh.",
+                        imputer.strategy, strategy)
+            return None
+        encoder_path = encoder_path_for(output_path)
+        encoder = CategoricalEncoder.load(encoder_path) if os.path.exists(encoder_path) else None
+        
+        if self.row_keys is None:
+            self.row_keys = row_keys(self.df)
+        manifest = read_table(manifest_path)
+        pending, keep, counts = diff_rows(self.row_keys, manifest)
+        logger.info("Baris sumber: %d baru, %d berubah, %d tidak berubah, %d dihapus",
+                    counts['new'], counts['changed'], counts['unchanged'], counts['removed'])
+        self.imputer, self.encoder = imputer, encoder
+        if not pending.any() and keep.all():
+            logger.info("Data hasil preprocessing sudah up to date.")
+            return counts
+        
+        rows = self.df[pending]
+        rows = rows.dropna() if imputer.strategy == 'drop' else imputer.transform(rows)
+        rows = rows.drop(columns=[KEY_COLUMN], errors='ignore')
+        if encoder is not None:
+            rows = encoder.transform(rows)
+        header = read_header(output_path)
+        if set(rows.columns) != set(header.columns):
+            logger.info("Kolom baris baru tidak cocok dengan data hasil preprocessing: preprocessing penuh.")
+            return None
+        rows = rows[list(header.columns)].astype(header.dtypes.to_dict())
+        new_keys = self.row_keys.loc[rows.index]
+        
+        if keep.all():
+            append_table(rows, output_path)
+            append_table(new_keys, manifest_path)
         else:
-            self.df.to_csv(output_path + '.csv', index=False)
+            stored = read_table(output_path)[keep]
+            write_table(pd.concat([stored, rows], ignore_index=True), output_path)
+            write_table(pd.concat([manifest[keep], new_keys], ignore_index=True), manifest_path)
         
-        print(f"Data berhasil disimpan ke: {output_path}")
+        logger.info("%d baris ditambahkan ke: %s", len(rows), output_path)
+        return counts
 
 
 if __name__ == "__main__":
@@ -222,7 +488,7 @@ if __name__ == "__main__":
     # Ganti dengan path dataset Anda
     data_path = "../data/pneumonia_dataset.xlsx"
     
-    preprocessor = DataPreprocessor(data_path)
+    preprocessor = DataPreprocessor(data_path, verbose=True)
     df = preprocessor.load_data()
     
     if df is not None:
@@ -0,0 +1,308 @@
+"""
+Profil Data (EDA) Streaming untuk Dataset Pneumonia
+Statistik profil dihitung dalam satu pass per chunk baris: jumlah nilai dan
+missing, mean/std/min/max (digabung antar chunk), jumlah nilai unik perkiraan
+(sketch K-minimum values), frekuensi kategori, sampel reservoir untuk kuartil,
+dan jumlah duplikat dari hash 64-bit per baris. Hasilnya di-cache per
+fingerprint isi data sehingga run berikutnya dengan data yang sama tidak
+menghitung ulang.
+"""
+
+import os
+import json
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+
+PROFILE_VERSION = 1
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'profile'
+)
+DEFAULT_CHUNK_SIZE = 100_000
+DEFAULT_SAMPLE_SIZE = 10_000
+# Ukuran sketch KMV: error relatif perkiraan nilai unik ~ 1/sqrt(k) (~3%)
+SKETCH_SIZE = 1024
+# Kolom dengan nilai unik lebih dari ini tidak dihitung frekuensinya
+MAX_TRACKED_VALUES = 1000
+_HASH_SPACE = float(2 ** 64)
+
+
+def row_hashes(df):
+    """Hash 64-bit per baris (nilai dan nama kolom, tanpa index)"""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def frame_fingerprint(df, hashes=None):
+    """
+    Fingerprint isi DataFrame: nama/dtype kolom dan hash setiap baris
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+    hashes : np.ndarray atau None
+        Hasil `row_hashes(df)` jika sudah dihitung
+    """
+    hashes = row_hashes(df) if hashes is None else hashes
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[str(col), str(dtype)] for col, dtype in df.dtypes.items()]).encode())
+    digest.update(hashes.tobytes())
+    return digest.hexdigest()
+
+
+class _DistinctSketch:
+    """Sketch K-minimum values: perkiraan jumlah nilai unik dari k hash terkecil"""
+
+    def __init__(self, k=SKETCH_SIZE):
+        self.k = k
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+    def update(self, hashes):
+        if len(self.hashes) >= self.k:
+            # Hanya hash di bawah ambang (hash ke-k saat ini) yang bisa masuk sketch
+            hashes = hashes[hashes < self.hashes[-1]]
+        if len(hashes):
+            merged = np.sort(pd.unique(np.concatenate([self.hashes, hashes])))
+            self.hashes = merged[:self.k]
+
+    def estimate(self):
+        if len(self.hashes) < self.k:
+            return len(self.hashes)  # Semua nilai unik ada di sketch: tepat
+        return int(round((self.k - 1) / ((float(self.hashes[-1]) + 1) / _HASH_SPACE)))
+
+
+class _ColumnProfile:
+    """Akumulator statistik satu kolom"""
+
+    def __init__(self, name, dtype):
+        self.name = name
+        self.dtype = str(dtype)
+        self.numeric = dtype.kind in 'iuf'
+        self.count = 0
+        self.missing = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+        self.sketch = _DistinctSketch()
+        self.value_counts = None if self.numeric else pd.Series(dtype=np.int64)
+
+    def update(self, series):
+        if self.value_counts is not None:
+            self._update_counts(series)
+            return
+        valid = series.dropna()
+        n = len(valid)
+        self.missing += len(series) - n
+        if self.numeric and n:
+            values = valid.to_numpy(dtype=np.float64)
+            mean = values.mean()
+            m2 = ((values - mean) ** 2).sum()
+            # Penggabungan mean/varians antar chunk (Chan et al.)
+            total = self.count + n
+            delta = mean - self.mean
+            self.m2 += m2 + delta ** 2 * self.count * n / total
+            self.mean += delta * n / total
+            low, high = values.min(), values.max()
+            self.min = low if self.min is None else min(self.min, low)
+            self.max = high if self.max is None else max(self.max, high)
+        self.count += n
+        if not n:
+            return
+        values = valid.to_numpy()
+        hashes = pd.util.hash_array(values) if values.dtype.kind in 'iuf' else \
+            pd.util.hash_pandas_object(valid, index=False).to_numpy()
+        self.sketch.update(hashes)
+
+    def _update_counts(self, series):
+        """Kolom non-numerik: missing, jumlah dan nilai unik dari satu value_counts"""
+        counts = series.value_counts(dropna=False)
+        na = counts.index.isna()
+        missing = int(counts[na].sum())
+        counts = counts[~na]
+        self.missing += missing
+        self.count += len(series) - missing
+        # Selama frekuensi dihitung, jumlah nilai unik tepat dari value_counts
+        counts = self.value_counts.add(counts, fill_value=0)
+        if len(counts) <= MAX_TRACKED_VALUES:
+            self.value_counts = counts
+            return
+        # Terlalu banyak nilai unik: lanjutkan dengan sketch dari semua nilai yang sudah terlihat
+        self.value_counts = None
+        self.sketch.update(pd.util.hash_array(counts.index.to_numpy()))
+
+    def to_dict(self, sample):
+        stats = {
+            'dtype': self.dtype,
+            'count': int(self.count),
+            'missing': int(self.missing),
+            'distinct_approx': len(self.value_counts) if self.value_counts is not None else self.sketch.estimate(),
+        }
+        if self.numeric and self.count:
+            stats.update({
+                'mean': float(self.mean),
+                'std': float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else float('nan'),
+                'min': float(self.min),
+                'max': float(self.max),
+            })
+            values = sample[self.name].dropna() if sample is not None else pd.Series(dtype=float)
+            if len(values):
+                quantiles = values.astype(np.float64).quantile([0.25, 0.5, 0.75])
+                stats.update({'25%': float(quantiles[0.25]), '50%': float(quantiles[0.5]),
+                              '75%': float(quantiles[0.75])})
+        if self.value_counts is not None:
+            top = self.value_counts.sort_values(ascending=False, kind='stable')
+            stats['top_values'] = {str(k): int(v) for k, v in top.items()}
+        return stats
+
+
+class _Reservoir:
+    """Sampel acak seragam tanpa pengembalian (bottom-k dari kunci acak per baris)"""
+
+    def __init__(self, size, seed):
+        self.size = size
+        self.rng = np.random.default_rng(seed)
+        self.keys = np.empty(0)
+        self.rows = None
+
+    def update(self, chunk):
+        keys = self.rng.random(len(chunk))
+        if len(self.keys) >= self.size:
+            mask = keys < self.keys.max()
+            chunk, keys = chunk[mask], keys[mask]
+        if not len(chunk):
+            return
+        rows = chunk if self.rows is None else pd.concat([self.rows, chunk])
+        keys = np.concatenate([self.keys, keys])
+        if len(keys) > self.size:
+            keep = np.argpartition(keys, self.size)[:self.size]
+            rows, keys = rows.iloc[keep], keys[keep]
+        self.rows, self.keys = rows, keys
+
+
+def profile_frame(df, sample_size=DEFAULT_SAMPLE_SIZE, chunk_size=DEFAULT_CHUNK_SIZE, seed=0, hashes=None):
+    """
+    Profil DataFrame dalam satu pass per chunk baris
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Data yang diprofilkan
+    sample_size : int atau None
+        Ukuran sampel reservoir untuk kuartil (None/0: tanpa sampel, kuartil
+        tidak dihitung)
+    chunk_size : int
+        Jumlah baris per chunk
+    seed : int
+        Seed sampel reservoir
+    hashes : np.ndarray atau None
+        Hash per baris (`row_hashes(df)`) jika sudah dihitung
+
+    Returns:
+    --------
+    profile : dict
+        rows, columns, memory_bytes, duplicates (dari hash baris), columns_stats
+        (per kolom: dtype, count, missing, distinct_approx, mean/std/min/max,
+        kuartil dari sampel, top_values untuk kolom non-numerik) dan
+        sample_size
+    """
+    columns = [_ColumnProfile(col, dtype) for col, dtype in df.dtypes.items()]
+    reservoir = _Reservoir(sample_size, seed) if sample_size else None
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size]
+        for column in columns:
+            column.update(chunk[column.name])
+        if reservoir is not None:
+            reservoir.update(chunk)
+
+    hashes = row_hashes(df) if hashes is None else hashes
+    sample = reservoir.rows if reservoir is not None else None
+    return {
+        'version': PROFILE_VERSION,
+        'rows': int(len(df)),
+        'columns': [str(col) for col in df.columns],
+        'memory_bytes': int(df.memory_usage(index=False).sum()),
+        'duplicates': int(len(hashes) - len(pd.unique(hashes))),
+        'sample_size': 0 if sample is None else int(len(sample)),
+        'columns_stats': {column.name: column.to_dict(sample) for column in columns},
+    }
+
+
+def describe_profile(profile):
+    """Tabel mirip `df.describe()` untuk kolom numerik dari profil"""
+    rows = {col: {key: stats.get(key) for key in ('count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max')}
+            for col, stats in profile['columns_stats'].items() if 'mean' in stats}
+    return pd.DataFrame(rows)
+
+
+class ProfileCache:
+    """Cache profil di disk, satu file JSON per fingerprint data dan parameter profil"""
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.json')
+
+    @staticmethod
+    def key(fingerprint, sample_size, seed):
+        payload = json.dumps([PROFILE_VERSION, fingerprint, sample_size, seed])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key):
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, profile):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(profile, f, indent=1, default=str)
+        os.replace(tmp_path, path)
+
+    def clear(self):
+        """Hapus semua profil, kembalikan jumlah yang dihapus"""
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        names = [name for name in os.listdir(self.cache_dir) if name.endswith('.json')]
+        for name in names:
+            os.remove(os.path.join(self.cache_dir, name))
+        return len(names)
+
+
+def cached_profile(df, cache=True, sample_size=DEFAULT_SAMPLE_SIZE, chunk_size=DEFAULT_CHUNK_SIZE, seed=0):
+    """
+    Profil DataFrame, diambil dari cache jika fingerprint data sama
+
+    Fingerprint dihitung dari hash setiap baris; hash yang sama dipakai
+    untuk jumlah duplikat jika profil perlu dihitung.
+
+    Parameters:
+    -----------
+    cache : bool atau ProfileCache
+        True memakai cache default (cache/profile/), False tanpa cache
+
+    Returns:
+    --------
+    profile : dict
+        Lihat `profile_frame`; key `cached` True jika diambil dari cache
+    """
+    if cache is False or cache is None:
+        return dict(profile_frame(df, sample_size, chunk_size, seed), cached=False)
+    cache = ProfileCache() if cache is True else cache
+    hashes = row_hashes(df)
+    key = cache.key(frame_fingerprint(df, hashes), sample_size, seed)
+    profile = cache.get(key)
+    if profile is not None:
+        return dict(profile, cached=True)
+    profile = profile_frame(df, sample_size, chunk_size, seed, hashes=hashes)
+    try:
+        cache.put(key, profile)
+    except OSError:
+        pass  # Folder cache tidak bisa ditulis: profil tetap dikembalikan
+    return dict(profile, cached=False)
@@ -0,0 +1,207 @@
+"""
+Optimasi Dtype Fitur Klinis Pneumonia
+Setelah load, semua kolom numerik bertipe int64/float64 dan flag Yes/No masih
+string Python (object). Modul ini menurunkan dtype berdasarkan skema yang
+dideklarasikan untuk fitur klinis: flag binary -> uint8 (0/1), skor dan tanda
+vital -> integer kecil, hasil lab -> float32, kategori string -> Categorical.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Jenis dtype yang dikenal skema
+KINDS = ('id', 'binary', 'int', 'float', 'category')
+
+# Skema dtype per kolom dataset
+FEATURE_DTYPES = {
+    'Patient_ID': 'id',
+    'Age': 'int',
+    'Sex': 'binary',
+    'BMI': 'float',
+    'Heart_rate': 'int',
+    'Respiration_rate': 'int',
+    'Temperature': 'float',
+    'Systolic_BP': 'int',
+    'Oxygen_need': 'binary',
+    'Shock_vital': 'binary',
+    'WBC': 'float',
+    'Hemoglobin': 'float',
+    'Platelet': 'float',
+    'Total_protein': 'float',
+    'Albumin': 'float',
+    'Sodium': 'float',
+    'BUN': 'float',
+    'CRP': 'float',
+    'LOC': 'binary',
+    'Bedsore': 'binary',
+    'Aspiration': 'binary',
+    'ADL_category': 'category',
+    'CCI': 'int',
+    'Nursing_insurance': 'binary',
+    'Key_person': 'category',
+    'Mortality': 'binary',
+    'LOS_days': 'int',
+}
+
+# Nama fitur di config.FEATURES -> nama kolom dataset
+FEATURE_ALIASES = {
+    'Respiration': 'Respiration_rate',
+    'Oxygen': 'Oxygen_need',
+    'T': 'Temperature',
+    'Hgb': 'Hemoglobin',
+    'Na': 'Sodium',
+    'ADL': 'ADL_category',
+    'Insecure': 'Nursing_insurance',
+}
+
+
+def declared_dtypes(schema=None):
+    """
+    Skema dtype lengkap (nama kolom dataset dan alias config.FEATURES)
+
+    Parameters:
+    -----------
+    schema : dict atau None
+        Override/tambahan {kolom: jenis}. Jenis: 'id', 'binary', 'int',
+        'float' atau 'category'.
+    """
+    dtypes = dict(FEATURE_DTYPES)
+    dtypes.update({alias: dtypes[name] for alias, name in FEATURE_ALIASES.items()})
+    dtypes.update(schema or {})
+    unknown = {kind for kind in dtypes.values() if kind not in KINDS}
+    if unknown:
+        raise ValueError(f"Jenis dtype tidak dikenal: {', '.join(sorted(unknown))}. Gunakan {KINDS}")
+    return dtypes
+
+
+def _is_integral(series):
+    """True jika kolom numerik tanpa missing value dan semua nilainya bulat"""
+    if series.dtype.kind in 'iub':
+        return True
+    values = series.to_numpy()
+    return not np.isnan(values).any() and bool((values == np.round(values)).all())
+
+
+def _small_int(series):
+    """Integer terkecil yang muat, atau float32 jika ada missing/pecahan"""
+    if _is_integral(series):
+        return pd.to_numeric(series, downcast='integer')
+    return series.astype(np.float32)
+
+
+def _binary(series):
+    """
+    Flag dengan tepat dua nilai -> uint8
+
+    Kode mengikuti urutan nilai yang diurutkan (sama seperti
+    CategoricalEncoder/LabelEncoder: 'No'=0, 'Yes'=1; 'F'=0, 'M'=1).
+    Flag dengan missing value atau jumlah nilai selain dua menjadi
+    Categorical dan tetap di-encode oleh CategoricalEncoder.
+
+    Returns:
+    --------
+    converted : pd.Series
+    vocabulary : list atau None
+        Nilai asli per kode (None jika kolom sudah numerik atau tidak dikonversi)
+    """
+    if series.isna().any():
+        return (series.astype('category') if series.dtype == object else series.astype(np.float32)), None
+    values = series.unique()
+    if len(values) != 2:
+        return (series.astype('category') if series.dtype == object else _small_int(series)), None
+    if series.dtype != object:
+        return series.astype(np.uint8), None
+    vocabulary = sorted(values.tolist())
+    codes = pd.Index(vocabulary).get_indexer(series)
+    return pd.Series(codes.astype(np.uint8), index=series.index, name=series.name), vocabulary
+
+
+def optimize_dtypes(df, schema=None):
+    """
+    Turunkan dtype kolom sesuai skema yang dideklarasikan
+
+    Kolom yang tidak ada di skema, atau yang isinya tidak cocok dengan
+    jenisnya (mis. string di kolom 'float'), dibiarkan apa adanya.
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Data mentah hasil load
+    schema : dict atau None
+        Override skema {kolom: jenis} (lihat `declared_dtypes`)
+
+    Returns:
+    --------
+    optimized : pd.DataFrame
+        DataFrame baru dengan dtype yang lebih ringkas
+    binary_vocabularies : dict
+        {kolom: [nilai kode 0, nilai kode 1]} untuk flag string yang
+        dikonversi ke uint8
+    """
+    dtypes = declared_dtypes(schema)
+    columns = {}
+    binary_vocabularies = {}
+    for col in df.columns:
+        series = df[col]
+        kind = dtypes.get(col)
+        numeric = series.dtype.kind in 'iufb'
+        if kind == 'binary':
+            series, vocabulary = _binary(series)
+            if vocabulary is not None:
+                binary_vocabularies[col] = vocabulary
+        elif kind in ('id', 'int') and numeric:
+            series = _small_int(series)
+        elif kind == 'float' and numeric:
+            series = series.astype(np.float32)
+        elif kind == 'category':
+            if series.dtype == object:
+                series = series.astype('category')
+            elif numeric:
+                series = _small_int(series)
+        columns[col] = series
+    return pd.DataFrame(columns, index=df.index), binary_vocabularies
+
+
+def memory_report(before, after):
+    """
+    Pemakaian memori per kolom sebelum dan sesudah optimasi
+
+    Parameters:
+    -----------
+    before, after : pd.DataFrame
+        Data sebelum dan sesudah `optimize_dtypes`
+
+    Returns:
+    --------
+    report : pd.DataFrame
+        Per kolom: dtype dan byte sebelum/sesudah serta penghematan (%),
+        baris terakhir 'TOTAL'
+    """
+    bytes_before = before.memory_usage(deep=True, index=False)
+    bytes_after = after.memory_usage(deep=True, index=False)
+    report = pd.DataFrame({
+        'dtype_before': before.dtypes.astype(str),
+        'dtype_after': after.dtypes.astype(str),
+        'bytes_before': bytes_before,
+        'bytes_after': bytes_after,
+    })
+    report.loc['TOTAL'] = ['', '', bytes_before.sum(), bytes_after.sum()]
+    report[['bytes_before', 'bytes_after']] = report[['bytes_before', 'bytes_after']].astype(np.int64)
+    report['saving_pct'] = (100 * (1 - report['bytes_after'] / report['bytes_before'])).round(1)
+    return report
+
+
+def format_memory_report(report):
+    """Tabel laporan memori sebagai string (MB)"""
+    lines = [
+        f"{'Kolom':<20} | {'Dtype lama':>10} | {'Dtype baru':>10} | {'MB lama':>9} | {'MB baru':>9} | {'Hemat':>6}",
+        "-" * 80,
+    ]
+    for col, row in report.iterrows():
+        if col == 'TOTAL':
+            lines.append("-" * 80)
+        lines.append(f"{str(col):<20} | {row['dtype_before']:>10} | {row['dtype_after']:>10} | "
+                     f"{row['bytes_before'] / 1e6:>9.2f} | {row['bytes_after'] / 1e6:>9.2f} | "
+                     f"{row['saving_pct']:>5.1f}%")
+    return '\n'.join(lines)
@@ -0,0 +1,225 @@
+"""
+Skema Fitur Training untuk Prediksi Pneumonia
+Menyimpan urutan kolom, dtype, vocabulary kategori dan nilai default dari data
+training sebagai artifact kecil di samping setiap model yang disimpan
+"""
+
+import os
+import json
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+
+SCHEMA_SUFFIX = '.schema.json'
+SCHEMA_VERSION = 1
+
+# Batas jumlah nilai unik agar kolom dianggap kategorikal
+MAX_VOCABULARY_SIZE = 20
+
+
+@dataclass(frozen=True)
+class FeatureSchema:
+    """
+    Skema fitur training yang immutable
+
+    Attributes:
+    -----------
+    columns : tuple of str
+        Urutan kolom data training (termasuk kolom target)
+    dtypes : Mapping[str, str]
+        Dtype setiap kolom
+    categories : Mapping[str, tuple]
+        Vocabulary untuk kolom kategorikal/hasil encoding
+    defaults : Mapping[str, object]
+        Nilai default untuk kolom yang tidak ada di data baru
+    """
+    columns: tuple
+    dtypes: MappingProxyType
+    categories: MappingProxyType
+    defaults: MappingProxyType
+    _columns_cache: dict = field(default_factory=dict, repr=False, compare=False)
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        Bangun skema dari DataFrame training (sudah diproses)
+
+        Parameters:
+        -----------
+        df : pd.DataFrame
+            Data training yang sudah di-encode
+        """
+        dtypes = {col: str(df[col].dtype) for col in df.columns}
+        categories = {}
+        defaults = {}
+        for col in df.columns:
+            series = df[col]
+            if series.dtype.kind in 'biuO':
+                values = series.dropna().unique()
+                if len(values) <= MAX_VOCABULARY_SIZE:
+                    categories[col] = tuple(sorted(v.item() if hasattr(v, 'item') else v for v in values))
+            if col == 'LOS_days':
+                # Default LOS = rata-rata LOS data training
+                defaults[col] = round(float(series.mean()), 2) if len(series) else 20
+            else:
+                defaults[col] = 0
+        return cls.from_dict({
+            'columns': list(df.columns),
+            'dtypes': dtypes,
+            'categories': categories,
+            'defaults': defaults,
+        })
+
+    @classmethod
+    def from_dict(cls, data):
+        """Bangun skema dari dict (hasil `to_dict` atau file JSON)"""
+        return cls(
+            columns=tuple(data['columns']),
+            dtypes=MappingProxyType(dict(data.get('dtypes', {}))),
+            categories=MappingProxyType({k: tuple(v) for k, v in data.get('categories', {}).items()}),
+            defaults=MappingProxyType(dict(data.get('defaults', {}))),
+        )
+
+    def to_dict(self):
+        """Konversi skema ke dict yang bisa diserialisasi ke JSON"""
+        return {
+            'version': SCHEMA_VERSION,
+            'columns': list(self.columns),
+            'dtypes': dict(self.dtypes),
+            'categories': {k: list(v) for k, v in self.categories.items()},
+            'defaults': dict(self.defaults),
+        }
+
+    def save(self, path):
+        """Simpan skema ke file JSON"""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        """Muat skema dari file JSON"""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+    def feature_columns(self, exclude_target=None):
+        """
+        Urutan kolom yang diharapkan model (tuple, dibagi semua caller)
+
+        Parameters:
+        -----------
+        exclude_target : str atau None
+            Target yang dikecualikan ('Mortality' atau 'LOS_days')
+        """
+        cols = self._columns_cache.get(exclude_target)
+        if cols is None:
+            cols = tuple(c for c in self.columns if c != exclude_target)
+            self._columns_cache[exclude_target] = cols
+        return cols
+
+    def align(self, df, exclude_target=None):
+        """
+        Samakan kolom DataFrame dengan skema training (reindex di memory)
+
+        Kolom yang hilang diisi dengan nilai default skema, kolom yang tidak
+        dikenal dibuang, dan urutan kolom mengikuti data training.
+
+        Parameters:
+        -----------
+        df : pd.DataFrame
+            Data yang sudah di-encode
+        exclude_target : str atau None
+            Target yang dikecualikan ('Mortality' atau 'LOS_days')
+        """
+        cols = self.feature_columns(exclude_target)
+        missing_cols = [c for c in cols if c not in df.columns]
+        df = df.reindex(columns=cols, fill_value=0)
+        for col in missing_cols:
+            default = self.defaults.get(col, 0)
+            if default != 0:
+                df[col] = default
+        return df
+
+
+def schema_path_for_model(model_path):
+    """Path artifact skema untuk sebuah model (`<model_path>.schema.json`)"""
+    if model_path.endswith('.pkl'):
+        model_path = model_path[:-len('.pkl')]
+    return model_path + SCHEMA_SUFFIX
+
+
+def save_feature_schema(df, model_path):
+    """
+    Simpan skema fitur dari data training di samping model
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Data training (sudah diproses, termasuk kolom target)
+    model_path : str
+        Path model yang disimpan (tanpa ekstensi .pkl)
+
+    Returns:
+    --------
+    schema_path : str
+        Path file skema yang ditulis
+    """
+    schema_path = schema_path_for_model(model_path)
+    FeatureSchema.from_frame(df).save(schema_path)
+    return schema_path
+
+
+_schema_cache = {}
+_schema_lock = threading.Lock()
+
+
+def load_schema_for_model(model_path, refresh=False):
+    """
+    Ambil skema untuk model dari cache in-memory
+
+    File skema hanya dibaca sekali per proses (atau saat `refresh=True`,
+    mis. ketika model dimuat ulang). Mengembalikan None jika model tidak
+    memiliki artifact skema.
+
+    Parameters:
+    -----------
+    model_path : str
+        Path absolut ke model (dengan atau tanpa ekstensi .pkl)
+    refresh : bool
+        Paksa membaca ulang file skema
+    """
+    key = schema_path_for_model(model_path)
+    if not refresh and key in _schema_cache:
+        return _schema_cache[key]
+    with _schema_lock:
+        schema = FeatureSchema.load(key) if os.path.exists(key) else None
+        _schema_cache[key] = schema
+    return schema
+
+
+def load_schema_from_data(data_path):
+    """
+    Bangun skema dari header data training (fallback untuk model lama)
+
+    Parquet/Feather hanya dibaca metadata skemanya (dtype asli), CSV/Excel
+    satu baris. Hasilnya di-cache per path sehingga file hanya dibaca sekali
+    per proses. Mengembalikan None jika file tidak ada (tidak di-cache, file
+    yang ditulis kemudian tetap terbaca).
+    """
+    key = os.path.abspath(data_path)
+    if key in _schema_cache:
+        return _schema_cache[key]
+    if not os.path.exists(key):
+        return None
+    with _schema_lock:
+        from data_io import read_header
+        header = read_header(key)
+        # Header saja tidak cukup untuk vocabulary dan rata-rata LOS,
+        # gunakan default lama
+        schema = FeatureSchema.from_dict({
+            'columns': list(header.columns),
+            'dtypes': {col: str(header[col].dtype) for col in header.columns},
+            'defaults': {col: 20 if col == 'LOS_days' else 0 for col in header.columns},
+        })
+        _schema_cache[key] = schema
+    return schema
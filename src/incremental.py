@@ -0,0 +1,89 @@
+"""
+Pelacakan Baris untuk Preprocessing Inkremental
+Setiap baris data hasil preprocessing dicatat di manifest (key pasien dan hash
+isi baris mentah) di samping file data. Run berikutnya hanya memproses baris
+sumber yang baru atau berubah dibandingkan manifest.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+
+MANIFEST_INFIX = '.rows'
+KEY_COLUMN = 'Patient_ID'
+
+
+def manifest_path_for(data_path):
+    """
+    Path manifest baris untuk file data hasil preprocessing
+
+    `data/processed.csv` -> `data/processed.rows.csv`
+    `data/processed.parquet` -> `data/processed.rows.parquet`
+    """
+    root, ext = os.path.splitext(data_path)
+    return root + MANIFEST_INFIX + (ext or '.csv')
+
+
+def row_keys(df, key_column=KEY_COLUMN):
+    """
+    Key dan hash isi setiap baris mentah
+
+    Key adalah `key_column` (Patient_ID) jika kolom ada, tanpa missing dan
+    unik; selain itu key adalah hash baris itu sendiri (baris yang berubah
+    terdeteksi sebagai baris baru + baris yang dihapus, dan baris yang
+    identik dengan baris yang sudah diproses dianggap sudah diproses).
+
+    Returns:
+    --------
+    keys : pd.DataFrame
+        Kolom 'key' dan 'row_hash' (int64), index sama dengan `df`
+    """
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy().view(np.int64)
+    key = None
+    if key_column in df.columns:
+        ids = df[key_column]
+        if not ids.isna().any() and ids.is_unique:
+            key = ids.to_numpy()
+    return pd.DataFrame({'key': hashes if key is None else key, 'row_hash': hashes}, index=df.index)
+
+
+def _pair_hashes(keys):
+    """Satu hash 64-bit per pasangan (key, row_hash) agar dibandingkan dengan satu isin"""
+    return pd.util.hash_pandas_object(keys[['key', 'row_hash']], index=False).to_numpy()
+
+
+def diff_rows(keys, manifest):
+    """
+    Bandingkan baris sumber dengan manifest baris yang sudah diproses
+
+    Parameters:
+    -----------
+    keys : pd.DataFrame
+        Hasil `row_keys` untuk data sumber saat ini
+    manifest : pd.DataFrame
+        Manifest tersimpan (kolom 'key', 'row_hash'), urut sama dengan baris
+        data hasil preprocessing
+
+    Returns:
+    --------
+    pending : np.ndarray of bool
+        Per baris sumber: True jika baru atau berubah (perlu diproses)
+    keep : np.ndarray of bool
+        Per baris manifest: True jika baris tersimpan masih valid
+    counts : dict
+        Jumlah baris 'new', 'changed', 'unchanged' dan 'removed'
+    """
+    stored = _pair_hashes(manifest)
+    current = _pair_hashes(keys)
+    known = keys['key'].isin(manifest['key']).to_numpy()
+    same = pd.Series(current).isin(stored).to_numpy()
+    keep = pd.Series(stored).isin(current).to_numpy()
+    counts = {
+        'new': int((~known).sum()),
+        'changed': int((known & ~same).sum()),
+        'unchanged': int(same.sum()),
+        'removed': int((~manifest['key'].isin(keys['key'])).sum()),
+    }
+    return ~same, keep, counts
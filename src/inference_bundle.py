@@ -0,0 +1,339 @@
+"""
+Inference Bundle Ringan untuk Model Pneumonia
+Pipeline final PyCaret (imputasi, multikolinearitas, normalisasi, seleksi fitur
+dan estimator) diekspor menjadi bundle minimal yang bisa dipakai untuk prediksi
+hanya dengan numpy/sklearn/lightgbm, tanpa mengimpor PyCaret
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from log_config import get_logger
+
+
+logger = get_logger('inference_bundle')
+
+BUNDLE_SUFFIX = '.bundle.joblib'
+BUNDLE_VERSION = 1
+
+# Step yang bekerja per kolom dengan transformasi affine: (x - offset) / scale
+_SCALERS = ('StandardScaler', 'MinMaxScaler', 'RobustScaler', 'MaxAbsScaler')
+# Step yang hanya memilih atau mengganti nama kolom
+_SELECTORS = ('VarianceThreshold', 'RemoveMulticollinearity', 'SelectFromModel', 'CleanColumnNames')
+
+
+def bundle_path_for(model_path):
+    """
+    Path inference bundle untuk sebuah model
+
+    `models/mortality_model` -> `models/mortality_model.bundle.joblib`
+    """
+    if model_path.endswith('.pkl'):
+        model_path = model_path[:-len('.pkl')]
+    return model_path + BUNDLE_SUFFIX
+
+
+def model_path_for_bundle(bundle_path):
+    """Kebalikan `bundle_path_for`: path model (tanpa .pkl) untuk sebuah bundle"""
+    if bundle_path.endswith(BUNDLE_SUFFIX):
+        return bundle_path[:-len(BUNDLE_SUFFIX)]
+    return bundle_path
+
+
+def _scaler_params(scaler):
+    """Offset dan scale per kolom sehingga hasil scaler = (x - offset) / scale"""
+    name = type(scaler).__name__
+    n_features = len(scaler.feature_names_in_)
+    if name == 'StandardScaler':
+        offset = scaler.mean_ if scaler.with_mean else np.zeros(n_features)
+        scale = scaler.scale_ if scaler.with_std else np.ones(n_features)
+    elif name == 'MinMaxScaler':
+        # x * scale_ + min_ = (x - (-min_ / scale_)) / (1 / scale_)
+        offset = -scaler.min_ / scaler.scale_
+        scale = 1.0 / scaler.scale_
+    elif name == 'RobustScaler':
+        offset = scaler.center_ if scaler.with_centering else np.zeros(n_features)
+        scale = scaler.scale_ if scaler.with_scaling else np.ones(n_features)
+    else:  # MaxAbsScaler
+        offset = np.zeros(n_features)
+        scale = scaler.scale_
+    return np.asarray(offset, dtype=np.float64), np.asarray(scale, dtype=np.float64)
+
+
+class InferenceBundle:
+    """
+    Pipeline inference minimal: isi missing value, scaling affine per kolom,
+    lalu estimator
+
+    Semua step seleksi fitur sudah diselesaikan saat export sehingga bundle
+    hanya membaca kolom yang benar-benar dipakai estimator.
+    """
+
+    def __init__(self, task, input_columns, fill_values, offset, scale, estimator,
+                 feature_names=None, classes=None, labels=None, metadata=None):
+        """
+        Initialize InferenceBundle
+
+        Parameters:
+        -----------
+        task : str
+            'classification' atau 'regression'
+        input_columns : list
+            Kolom input (nama kolom data training) yang dipakai estimator, urut
+        fill_values : np.ndarray
+            Nilai pengganti missing value per kolom (NaN = tidak diisi)
+        offset, scale : np.ndarray
+            Parameter scaling per kolom: x' = (x - offset) / scale
+        estimator : object
+            Estimator hasil training (sklearn API)
+        feature_names : list atau None
+            Nama kolom yang dilihat estimator saat fit (setelah clean_column_names)
+        classes, labels : np.ndarray atau None
+            Kelas output estimator dan label target aslinya (klasifikasi)
+        metadata : dict atau None
+            Informasi tambahan (versi library, nama model, dll)
+        """
+        self.task = task
+        self.input_columns = list(input_columns)
+        self.fill_values = np.asarray(fill_values, dtype=np.float64)
+        self.offset = np.asarray(offset, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.estimator = estimator
+        self.feature_names = list(feature_names) if feature_names is not None else None
+        self.classes = np.asarray(classes) if classes is not None else None
+        self.labels = np.asarray(labels) if labels is not None else None
+        self.metadata = dict(metadata or {})
+        self._fill_mask = ~np.isnan(self.fill_values)
+
+    def transform(self, X):
+        """
+        Ubah data (kolom hasil encoding/align) menjadi input estimator
+
+        Parameters:
+        -----------
+        X : pd.DataFrame
+            Data dengan kolom `input_columns` (kolom lain diabaikan)
+        """
+        values = X[self.input_columns].to_numpy(dtype=np.float64, copy=True)
+        if self._fill_mask.any():
+            missing = np.isnan(values) & self._fill_mask
+            if missing.any():
+                rows, cols = np.nonzero(missing)
+                values[rows, cols] = self.fill_values[cols]
+        values -= self.offset
+        values /= self.scale
+        if self.feature_names is not None:
+            # Estimator di-fit dengan DataFrame: pakai nama kolom yang sama
+            return pd.DataFrame(values, columns=self.feature_names, index=X.index, copy=False)
+        return values
+
+    def _decode(self, label):
+        if self.labels is None:
+            return label
+        return self.labels[np.searchsorted(self.classes, label)]
+
+    def predict(self, X):
+        """Prediksi label (klasifikasi, dalam nilai target asli) atau nilai (regresi)"""
+        return self._decode(self.estimator.predict(self.transform(X)))
+
+    def predict_proba(self, X):
+        """Probabilitas per kelas (klasifikasi)"""
+        return self.estimator.predict_proba(self.transform(X))
+
+    def predict_with_score(self, X):
+        """
+        Prediksi dan skor dengan satu kali transformasi
+
+        Returns:
+        --------
+        label : np.ndarray
+            Hasil prediksi
+        score : np.ndarray atau None
+            Probabilitas kelas terpilih dibulatkan 4 desimal (seperti
+            `prediction_score` PyCaret); None untuk regresi
+        """
+        Xt = self.transform(X)
+        if self.task == 'classification' and hasattr(self.estimator, 'predict_with_proba'):
+            # Estimator yang menghitung label dari probabilitas (mis. SharedTreeEnsemble)
+            label, proba = self.estimator.predict_with_proba(Xt)
+            return self._decode(label), proba.max(axis=1).round(4)
+        label = self._decode(self.estimator.predict(Xt))
+        if self.task != 'classification':
+            return label, None
+        return label, self.estimator.predict_proba(Xt).max(axis=1).round(4)
+
+    def to_dict(self):
+        """Isi bundle sebagai dict (format yang disimpan ke file)"""
+        return {
+            'version': BUNDLE_VERSION,
+            'task': self.task,
+            'input_columns': self.input_columns,
+            'fill_values': self.fill_values,
+            'offset': self.offset,
+            'scale': self.scale,
+            'estimator': self.estimator,
+            'feature_names': self.feature_names,
+            'classes': self.classes,
+            'labels': self.labels,
+            'metadata': self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Bangun bundle dari dict hasil `to_dict`"""
+        if data.get('version') != BUNDLE_VERSION:
+            raise ValueError(f"Versi inference bundle tidak didukung: {data.get('version')}")
+        return cls(
+            task=data['task'],
+            input_columns=data['input_columns'],
+            fill_values=data['fill_values'],
+            offset=data['offset'],
+            scale=data['scale'],
+            estimator=data['estimator'],
+            feature_names=data.get('feature_names'),
+            classes=data.get('classes'),
+            labels=data.get('labels'),
+            metadata=data.get('metadata'),
+        )
+
+    def save(self, path):
+        """Simpan bundle ke file joblib"""
+        import joblib
+        joblib.dump(self.to_dict(), path)
+
+    @classmethod
+    def load(cls, path):
+        """Muat bundle dari file joblib (hanya butuh numpy/sklearn/lightgbm)"""
+        import joblib
+        return cls.from_dict(joblib.load(path))
+
+
+def build_inference_bundle(pipeline, X, task):
+    """
+    Bangun InferenceBundle dari pipeline final PyCaret
+
+    Parameters:
+    -----------
+    pipeline : Pipeline
+        Pipeline hasil `finalize_model`
+    X : pd.DataFrame
+        Contoh data input (fitur training tanpa target), dipakai untuk
+        menelusuri kolom setiap step dan memvalidasi hasil bundle
+    task : str
+        'classification' atau 'regression'
+
+    Returns:
+    --------
+    bundle : InferenceBundle
+
+    Raises:
+    -------
+    ValueError
+        Jika pipeline berisi step yang tidak bisa diekspor atau prediksi bundle
+        berbeda dengan pipeline
+    """
+    fill = {}
+    affine = {}
+    # Nama kolom saat ini -> nama kolom input asli
+    original = {col: col for col in X.columns}
+    Xt = X
+    for name, step in pipeline.steps[:-1]:
+        transformer = getattr(step, 'transformer', step)
+        kind = type(transformer).__name__
+        if kind == 'SimpleImputer':
+            if getattr(transformer, 'add_indicator', False):
+                raise ValueError(f"Step '{name}': SimpleImputer dengan add_indicator tidak didukung")
+            if hasattr(transformer, 'statistics_'):
+                for col, value in zip(transformer.feature_names_in_, transformer.statistics_):
+                    if original[col] in affine:
+                        raise ValueError(f"Step '{name}': imputasi setelah scaling tidak didukung")
+                    fill[original[col]] = value
+        elif kind in _SCALERS:
+            for col, offset, scale in zip(transformer.feature_names_in_, *_scaler_params(transformer)):
+                if original[col] in affine:
+                    raise ValueError(f"Step '{name}': scaling ganda tidak didukung")
+                affine[original[col]] = (offset, scale)
+        elif kind not in _SELECTORS:
+            raise ValueError(f"Step '{name}' ({kind}) tidak didukung untuk inference bundle")
+
+        columns_before = list(Xt.columns)
+        Xt = step.transform(Xt)
+        if kind == 'CleanColumnNames':
+            original = {new: original[old] for old, new in zip(columns_before, Xt.columns)}
+        elif not set(Xt.columns) <= set(columns_before):
+            raise ValueError(f"Step '{name}' ({kind}) menambah kolom baru")
+
+    estimator = pipeline.steps[-1][1]
+    input_columns = [original[col] for col in Xt.columns]
+    classes = labels = None
+    if task == 'classification':
+        classes = np.asarray(estimator.classes_)
+        labels = np.asarray(pipeline.inverse_transform(classes))
+
+    import sklearn
+    metadata = {'estimator': type(estimator).__name__, 'sklearn': sklearn.__version__}
+    try:
+        import lightgbm
+        metadata['lightgbm'] = lightgbm.__version__
+    except ImportError:
+        pass
+
+    bundle = InferenceBundle(
+        task=task,
+        input_columns=input_columns,
+        fill_values=[fill.get(col, np.nan) for col in input_columns],
+        offset=[affine.get(col, (0.0, 1.0))[0] for col in input_columns],
+        scale=[affine.get(col, (0.0, 1.0))[1] for col in input_columns],
+        estimator=estimator,
+        feature_names=list(getattr(estimator, 'feature_names_in_', Xt.columns)),
+        classes=classes,
+        labels=labels,
+        metadata=metadata,
+    )
+
+    # Validasi: bundle harus menghasilkan prediksi yang sama dengan pipeline
+    expected = estimator.predict(Xt)
+    if task == 'classification':
+        expected = pipeline.inverse_transform(expected)
+        matches = np.array_equal(np.asarray(bundle.predict(X)), np.asarray(expected))
+    else:
+        matches = np.allclose(bundle.predict(X), expected, rtol=1e-6, atol=1e-6)
+    if not matches:
+        raise ValueError("Prediksi inference bundle berbeda dengan pipeline PyCaret")
+    return bundle
+
+
+def export_inference_bundle(pipeline, X, model_path, task):
+    """
+    Ekspor pipeline final ke `<model_path>.bundle.joblib`
+
+    Parameters:
+    -----------
+    pipeline : Pipeline
+        Pipeline hasil `finalize_model`
+    X : pd.DataFrame
+        Fitur training (tanpa target)
+    model_path : str
+        Path model yang disimpan (tanpa ekstensi .pkl)
+    task : str
+        'classification' atau 'regression'
+
+    Returns:
+    --------
+    bundle_path : str atau None
+        Path bundle yang ditulis, None jika pipeline tidak bisa diekspor
+    """
+    try:
+        bundle = build_inference_bundle(pipeline, X, task)
+    except (ValueError, AttributeError, KeyError) as e:
+        logger.warning("Inference bundle tidak dibuat: %s", e)
+        # Hapus bundle lama agar prediksi tidak memakai model yang usang
+        stale = bundle_path_for(model_path)
+        if os.path.exists(stale):
+            os.remove(stale)
+        return None
+    bundle_path = bundle_path_for(model_path)
+    bundle.save(bundle_path)
+    return bundle_path
@@ -0,0 +1,322 @@
+"""
+Cache Ingest Data Mentah Excel
+Workbook (.xlsx/.xls) dikonversi sekali ke Parquet saat pertama dibaca, lalu
+pembacaan berikutnya dilayani dari file Parquet tersebut. Entri cache
+divalidasi dengan ukuran dan mtime file sumber, dan jika berbeda dengan hash
+isinya, sehingga workbook yang diedit otomatis dikonversi ulang.
+"""
+
+import os
+import json
+import time
+import hashlib
+import datetime
+import threading
+
+import pandas as pd
+
+from log_config import get_logger
+
+
+logger = get_logger('ingest_cache')
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'ingest'
+)
+DEFAULT_MAX_ENTRIES = 16
+CACHE_VERSION = 1
+EXCEL_ENGINES = ('auto', 'openpyxl', 'calamine')
+
+
+def calamine_available():
+    """True jika python-calamine (parser Excel berbasis Rust) terpasang"""
+    try:
+        import python_calamine  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def resolve_excel_engine(engine='auto'):
+    """
+    Engine Excel yang dipakai: 'auto' memilih calamine jika terpasang
+
+    Raises:
+    -------
+    ValueError
+        Jika engine tidak dikenal
+    ImportError
+        Jika 'calamine' diminta tetapi python-calamine tidak terpasang
+    """
+    if engine not in EXCEL_ENGINES:
+        raise ValueError(f"excel_engine harus salah satu dari {EXCEL_ENGINES}")
+    if engine == 'auto':
+        return 'calamine' if calamine_available() else 'openpyxl'
+    if engine == 'calamine' and not calamine_available():
+        raise ImportError("excel_engine='calamine' membutuhkan python-calamine (pip install python-calamine)")
+    return engine
+
+
+def _calamine_cell(value):
+    """Nilai sel calamine seperti konversi engine pandas: float bulat -> int"""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _read_excel_calamine(path, columns=None):
+    """Baca sheet pertama dengan python-calamine (untuk pandas yang belum punya engine calamine)"""
+    from python_calamine import CalamineWorkbook
+    from pandas.io.parsers import TextParser
+
+    rows = CalamineWorkbook.from_path(path).get_sheet_by_index(0).to_python(skip_empty_area=False)
+    if not rows:
+        return pd.DataFrame()
+    # TextParser sama seperti pd.read_excel: inferensi tipe dan nilai NA ('None', 'NA', ...)
+    data = [[_calamine_cell(value) for value in row] for row in rows]
+    df = TextParser(data, header=0).read()
+    return df[list(columns)] if columns is not None else df
+
+
+def read_excel(path, columns=None, engine='auto'):
+    """
+    Baca sheet pertama workbook dengan engine yang dipilih
+
+    Parameters:
+    -----------
+    path : str
+        File .xlsx/.xls
+    columns : list atau None
+        Kolom yang disimpan (None: semua)
+    engine : str
+        'auto', 'openpyxl' atau 'calamine'
+    """
+    engine = resolve_excel_engine(engine)
+    if engine == 'calamine':
+        # Engine calamine bawaan pandas baru ada sejak pandas 2.2
+        if tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2):
+            return pd.read_excel(path, usecols=columns, engine='calamine')
+        return _read_excel_calamine(path, columns)
+    return pd.read_excel(path, usecols=columns)
+
+
+def file_digest(path, chunk_size=1 << 20):
+    """SHA-256 isi file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _columnar_available():
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class IngestCache:
+    """
+    Cache konversi Excel -> Parquet di disk
+
+    Satu entri per path sumber: `<key>.parquet` (data) dan `<key>.json`
+    (path, ukuran, mtime dan SHA-256 sumber). Eviction: entri yang paling
+    lama tidak dipakai dihapus sampai tersisa `max_entries`.
+    """
+
+    def __init__(self, cache_dir=None, max_entries=DEFAULT_MAX_ENTRIES):
+        """
+        Initialize IngestCache
+
+        Parameters:
+        -----------
+        cache_dir : str atau None
+            Folder cache (default cache/ingest/ di project root)
+        max_entries : int
+            Jumlah maksimum workbook yang disimpan
+        """
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def _paths(self, source):
+        key = hashlib.sha256(os.path.abspath(source).encode()).hexdigest()[:24]
+        base = os.path.join(self.cache_dir, key)
+        return base + '.parquet', base + '.json'
+
+    def _read_meta(self, meta_path):
+        try:
+            with open(meta_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, meta_path, meta):
+        tmp_path = f"{meta_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_path, meta_path)
+
+    def lookup(self, source):
+        """
+        Path Parquet untuk workbook jika entri cache masih valid, None jika tidak
+
+        Ukuran dan mtime yang sama dianggap valid tanpa membaca isi file. Jika
+        berbeda (mis. file disalin ulang), hash isi dibandingkan.
+        """
+        data_path, meta_path = self._paths(source)
+        meta = self._read_meta(meta_path)
+        if meta is None or meta.get('version') != CACHE_VERSION or not os.path.exists(data_path):
+            return None
+        stat = os.stat(source)
+        if stat.st_size == meta['size'] and stat.st_mtime_ns == meta['mtime_ns']:
+            return data_path
+        if stat.st_size == meta['size'] and file_digest(source) == meta['sha256']:
+            # Isi sama, hanya mtime berubah: perbarui metadata
+            meta['mtime_ns'] = stat.st_mtime_ns
+            self._write_meta(meta_path, meta)
+            return data_path
+        return None
+
+    def convert(self, source, engine='auto'):
+        """
+        Konversi workbook ke Parquet (selalu, tanpa memeriksa cache)
+
+        Returns:
+        --------
+        df : pd.DataFrame
+            Isi workbook
+        """
+        data_path, meta_path = self._paths(source)
+        stat = os.stat(source)
+        engine = resolve_excel_engine(engine)
+        start = time.perf_counter()
+        df = read_excel(source, engine=engine)
+        parse_seconds = time.perf_counter() - start
+
+        import pyarrow as pa
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Tulis ke file sementara lalu rename agar proses lain tidak membaca file setengah jadi
+        tmp_path = f"{data_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            df.to_parquet(tmp_path, index=False, engine='pyarrow')
+        except (pa.ArrowException, ValueError, TypeError) as e:
+            # Mis. kolom object bertipe campuran ('<0.3' di antara angka): tidak di-cache,
+            # workbook yang sudah di-parse tetap dipakai
+            self._remove(tmp_path)
+            logger.warning("Workbook %s tidak bisa di-cache sebagai Parquet (%s), dibaca tanpa cache",
+                           source, e)
+            return df
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        os.replace(tmp_path, data_path)
+        self._write_meta(meta_path, {
+            'version': CACHE_VERSION,
+            'source': os.path.abspath(source),
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': file_digest(source),
+            'engine': engine,
+            'parse_seconds': parse_seconds,
+            'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        })
+        logger.info("Workbook %s dikonversi ke cache %s (%.2f detik, engine %s)",
+                    source, data_path, parse_seconds, engine)
+        self._evict()
+        return df
+
+    def read(self, source, columns=None, engine='auto'):
+        """
+        Baca workbook lewat cache (konversi dulu jika belum ada atau basi)
+
+        Parameters:
+        -----------
+        source : str
+            File .xlsx/.xls
+        columns : list atau None
+            Proyeksi kolom (hanya kolom ini yang dibaca dari Parquet)
+        engine : str
+            Engine Excel untuk konversi: 'auto', 'openpyxl' atau 'calamine'
+
+        Returns:
+        --------
+        df : pd.DataFrame
+        """
+        with self._lock:
+            data_path = self.lookup(source)
+            if data_path is None:
+                df = self.convert(source, engine)
+                return df[list(columns)] if columns is not None else df
+        os.utime(data_path)  # Tandai dipakai (untuk eviction)
+        return pd.read_parquet(data_path, columns=list(columns) if columns is not None else None,
+                               engine='pyarrow', memory_map=True)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _evict(self):
+        entries = sorted(
+            (os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+             if name.endswith('.parquet')),
+            key=os.path.getmtime,
+        )
+        for data_path in entries[:max(len(entries) - self.max_entries, 0)]:
+            for path in (data_path, data_path[:-len('.parquet')] + '.json'):
+                self._remove(path)
+
+    def clear(self):
+        """Hapus semua entri cache, kembalikan jumlah workbook yang dihapus"""
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(('.parquet', '.json')):
+                os.remove(os.path.join(self.cache_dir, name))
+                removed += name.endswith('.parquet')
+        return removed
+
+
+_default_cache = None
+
+
+def default_cache():
+    """IngestCache bersama di folder default"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = IngestCache()
+    return _default_cache
+
+
+def read_excel_cached(path, columns=None, cache=False, engine='auto'):
+    """
+    Baca workbook, dilayani dari cache Parquet jika memungkinkan
+
+    Parameters:
+    -----------
+    path : str
+        File .xlsx/.xls
+    columns : list atau None
+        Proyeksi kolom
+    cache : bool atau IngestCache
+        True memakai cache default (cache/ingest/), False (default) membaca
+        workbook langsung. Tanpa pyarrow cache dilewati.
+    engine : str
+        'auto', 'openpyxl' atau 'calamine'
+    """
+    if cache is False or cache is None or not _columnar_available():
+        return read_excel(path, columns=columns, engine=engine)
+    cache = default_cache() if cache is True else cache
+    try:
+        return cache.read(path, columns=columns, engine=engine)
+    except OSError as e:
+        # Folder cache tidak bisa ditulis (read-only, disk penuh): baca langsung
+        logger.warning("Cache ingest tidak bisa dipakai (%s), membaca workbook langsung", e)
+        return read_excel(path, columns=columns, engine=engine)
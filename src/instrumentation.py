@@ -0,0 +1,332 @@
+"""
+Instrumentasi Tahap Pipeline Pneumonia
+Mencatat wall time, CPU time dan peak RSS per tahap (preprocessing, training,
+prediksi) beserta sub-langkahnya, lalu menampilkan tabel ringkasan dan menulis
+file trace JSON yang bisa dibuka di Perfetto (ui.perfetto.dev) atau
+chrome://tracing
+
+Nonaktif secara default: fungsi yang diberi `@instrumented` hanya memeriksa
+satu flag. Aktifkan dengan `enable()` atau `python main.py --profile trace.json`.
+"""
+
+import os
+import json
+import time
+import threading
+import functools
+import contextlib
+
+
+_lock = threading.Lock()
+_local = threading.local()
+_enabled = False
+_records = []
+_active = {}
+_rss_samples = []
+_sampler = None
+_origin = time.perf_counter()
+
+# Interval sampling RSS (detik) dan perubahan minimum agar sampel dicatat di trace
+SAMPLE_INTERVAL = 0.01
+SAMPLE_MIN_CHANGE = 1 << 20
+
+
+def _rss_reader():
+    """Fungsi pembaca RSS proses (byte), atau None jika platform tidak didukung"""
+    try:
+        import psutil
+        process = psutil.Process()
+        return lambda: process.memory_info().rss
+    except ImportError:
+        pass
+    if os.path.exists('/proc/self/statm'):
+        page_size = os.sysconf('SC_PAGE_SIZE')
+
+        def read_statm():
+            with open('/proc/self/statm') as f:
+                return int(f.read().split()[1]) * page_size
+        return read_statm
+    return None
+
+
+_read_rss = _rss_reader()
+
+
+def current_rss():
+    """RSS proses saat ini dalam byte (None jika tidak bisa dibaca)"""
+    return _read_rss() if _read_rss is not None else None
+
+
+class _RssSampler(threading.Thread):
+    """Thread latar yang memperbarui peak RSS semua tahap yang sedang berjalan"""
+
+    def __init__(self, interval):
+        super().__init__(name='instrumentation-rss', daemon=True)
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        last = None
+        while not self.stopped.wait(self.interval):
+            rss = _sample()
+            if rss is not None and (last is None or abs(rss - last) >= SAMPLE_MIN_CHANGE):
+                with _lock:
+                    _rss_samples.append((time.perf_counter(), rss))
+                last = rss
+
+
+def _sample():
+    """Baca RSS dan perbarui peak tahap yang aktif"""
+    rss = current_rss()
+    if rss is not None:
+        with _lock:
+            for record in _active.values():
+                if rss > record['peak_rss']:
+                    record['peak_rss'] = rss
+    return rss
+
+
+def enable(sample_interval=SAMPLE_INTERVAL):
+    """
+    Aktifkan pencatatan tahap (dan thread sampling RSS)
+
+    Parameters:
+    -----------
+    sample_interval : float
+        Interval sampling RSS dalam detik. Peak RSS tahap yang lebih singkat
+        dari interval ini hanya diukur di awal dan akhir tahap.
+    """
+    global _enabled, _sampler
+    with _lock:
+        _enabled = True
+        if _sampler is None and _read_rss is not None:
+            _sampler = _RssSampler(sample_interval)
+            _sampler.start()
+
+
+def disable():
+    """Hentikan pencatatan (rekaman yang sudah ada tetap disimpan)"""
+    global _enabled, _sampler
+    with _lock:
+        _enabled = False
+        sampler, _sampler = _sampler, None
+    if sampler is not None:
+        sampler.stopped.set()
+        sampler.join()
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """Hapus semua rekaman tahap dan sampel RSS"""
+    with _lock:
+        _records.clear()
+        _rss_samples.clear()
+
+
+def records():
+    """Salinan rekaman tahap yang sudah selesai, urut waktu mulai"""
+    with _lock:
+        return sorted((dict(r) for r in _records), key=lambda r: r['start'])
+
+
+@contextlib.contextmanager
+def recording(sample_interval=SAMPLE_INTERVAL):
+    """Aktifkan instrumentasi selama blok (rekaman sebelumnya dihapus)"""
+    reset()
+    enable(sample_interval)
+    try:
+        yield
+    finally:
+        disable()
+
+
+@contextlib.contextmanager
+def stage(name, **metadata):
+    """
+    Catat satu tahap (bisa bersarang)
+
+    Parameters:
+    -----------
+    name : str
+        Nama tahap, mis. 'TrainingSession.compare_models'
+    **metadata
+        Info tambahan yang ikut disimpan (mis. jumlah baris)
+
+    CPU time adalah CPU seluruh proses selama tahap (termasuk thread native
+    LightGBM/BLAS); worker proses terpisah (joblib, parallel_training) tidak
+    ikut terhitung.
+    """
+    if not _enabled:
+        yield
+        return
+
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    rss = current_rss()
+    record = {
+        'name': name,
+        'path': f"{stack[-1]['path']}/{name}" if stack else name,
+        'depth': len(stack),
+        'thread': threading.get_ident(),
+        'start': time.perf_counter(),
+        'rss_start': rss,
+        'peak_rss': rss or 0,
+        'metadata': metadata,
+    }
+    cpu_start = time.process_time()
+    key = id(record)
+    with _lock:
+        _active[key] = record
+    stack.append(record)
+    error = None
+    try:
+        yield record
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        stack.pop()
+        _sample()
+        end = time.perf_counter()
+        record['cpu_seconds'] = time.process_time() - cpu_start
+        record['wall_seconds'] = end - record['start']
+        record['rss_end'] = current_rss()
+        if error is not None:
+            record['error'] = error
+        with _lock:
+            _active.pop(key, None)
+            _records.append(record)
+
+
+def instrumented(name=None):
+    """
+    Dekorator: catat setiap panggilan fungsi sebagai tahap
+
+    Parameters:
+    -----------
+    name : str atau None
+        Nama tahap (default `__qualname__` fungsi, mis. 'DataPreprocessor.load_data')
+    """
+    def decorator(func):
+        stage_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with stage(stage_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _mb(value):
+    return None if value is None else value / 1e6
+
+
+def summary():
+    """
+    Agregat per tahap (urut kemunculan pertama)
+
+    Tahap dikelompokkan per path (nama tahap induk/.../nama), sehingga
+    sub-langkah yang sama di trainer berbeda tetap terpisah.
+
+    Returns:
+    --------
+    rows : list of dict
+        path, name, depth, calls, wall_seconds, cpu_seconds, peak_rss_mb dan
+        peak_delta_mb (kenaikan RSS tertinggi dari awal tahap)
+    """
+    rows = {}
+    for record in records():
+        row = rows.setdefault(record['path'], {
+            'path': record['path'], 'name': record['name'], 'depth': record['depth'], 'calls': 0,
+            'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'peak_rss_mb': None, 'peak_delta_mb': None,
+        })
+        row['calls'] += 1
+        row['wall_seconds'] += record['wall_seconds']
+        row['cpu_seconds'] += record['cpu_seconds']
+        if record['rss_start'] is not None:
+            peak = _mb(record['peak_rss'])
+            delta = _mb(record['peak_rss'] - record['rss_start'])
+            row['peak_rss_mb'] = max(row['peak_rss_mb'] or 0, peak)
+            row['peak_delta_mb'] = max(row['peak_delta_mb'] or 0, delta)
+    return list(rows.values())
+
+
+def format_summary(rows=None):
+    """Tabel ringkasan tahap sebagai string (nama diindentasi sesuai kedalaman)"""
+    rows = summary() if rows is None else rows
+    lines = [
+        f"{'Tahap':<48} | {'Panggil':>7} | {'Wall (s)':>9} | {'CPU (s)':>9} | "
+        f"{'Peak RSS (MB)':>13} | {'Naik (MB)':>9}",
+        "-" * 110,
+    ]
+    for row in rows:
+        peak = '-' if row['peak_rss_mb'] is None else f"{row['peak_rss_mb']:.0f}"
+        delta = '-' if row['peak_delta_mb'] is None else f"{row['peak_delta_mb']:.0f}"
+        name = ('  ' * row['depth'] + row['name'])[:48]
+        lines.append(f"{name:<48} | {row['calls']:>7} | {row['wall_seconds']:>9.2f} | "
+                     f"{row['cpu_seconds']:>9.2f} | {peak:>13} | {delta:>9}")
+    return '\n'.join(lines)
+
+
+def print_summary():
+    print(format_summary())
+
+
+def trace_events():
+    """Rekaman sebagai event Chrome Trace Event Format (durasi + counter RSS)"""
+    pid = os.getpid()
+    events = []
+    for record in records():
+        args = {
+            'path': record['path'],
+            'cpu_ms': round(1000 * record['cpu_seconds'], 3),
+            'peak_rss_mb': round(_mb(record['peak_rss']), 1) if record['rss_start'] is not None else None,
+            **record['metadata'],
+        }
+        if 'error' in record:
+            args['error'] = record['error']
+        events.append({
+            'name': record['name'], 'cat': 'stage', 'ph': 'X', 'pid': pid, 'tid': record['thread'],
+            'ts': round(1e6 * (record['start'] - _origin), 3),
+            'dur': round(1e6 * record['wall_seconds'], 3),
+            'args': args,
+        })
+    with _lock:
+        samples = list(_rss_samples)
+    for timestamp, rss in samples:
+        events.append({
+            'name': 'RSS', 'ph': 'C', 'pid': pid, 'ts': round(1e6 * (timestamp - _origin), 3),
+            'args': {'MB': round(rss / 1e6, 1)},
+        })
+    return events
+
+
+def write_trace(path, metadata=None):
+    """
+    Tulis trace JSON (Chrome Trace Event Format) beserta tabel ringkasan
+
+    File bisa dibuka di Perfetto/chrome://tracing; key `summary` dan
+    `stages` berisi agregat dan rekaman mentah untuk dibaca script lain.
+
+    Returns:
+    --------
+    path : str
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    payload = {
+        'traceEvents': trace_events(),
+        'displayTimeUnit': 'ms',
+        'metadata': dict(metadata or {}, pid=os.getpid()),
+        'summary': summary(),
+        'stages': records(),
+    }
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=1, default=str)
+    return path
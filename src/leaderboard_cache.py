@@ -0,0 +1,170 @@
+"""
+Cache Leaderboard compare_models
+Hasil `compare_models` (leaderboard CV dan model terbaik yang sudah di-fit)
+disimpan per kombinasi data, parameter setup/compare dan versi library,
+sehingga run dengan data dan konfigurasi yang sama langsung lanjut ke tuning
+"""
+
+import os
+import json
+import time
+import hashlib
+
+import pandas as pd
+
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cache', 'leaderboard'
+)
+DEFAULT_MAX_ENTRIES = 8
+DEFAULT_MAX_AGE_DAYS = 30
+CACHE_SUFFIX = '.joblib'
+
+# Library yang memengaruhi hasil compare_models
+_VERSIONED_PACKAGES = ('pycaret', 'sklearn', 'lightgbm', 'xgboost', 'pandas', 'numpy')
+# Parameter setup yang tidak memengaruhi hasil (hanya kecepatan)
+_IGNORED_SETUP_PARAMS = ('n_jobs', 'verbose')
+
+
+def library_versions():
+    """Versi library yang ikut menentukan key cache (None jika tidak terpasang)"""
+    import importlib
+    versions = {}
+    for name in _VERSIONED_PACKAGES:
+        try:
+            versions[name] = importlib.import_module(name).__version__
+        except ImportError:
+            versions[name] = None
+    return versions
+
+
+def dataset_fingerprint(df):
+    """Hash isi DataFrame (nilai, index, nama dan tipe kolom)"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[str(col), str(dtype)] for col, dtype in df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def cache_key(df, setup_params, compare_params):
+    """
+    Key cache untuk satu panggilan compare_models
+
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Data training (hasil preprocessing)
+    setup_params : dict
+        Parameter `setup()` (target, test_size, session_id, normalize, dll)
+    compare_params : dict
+        Parameter `compare_models()` (include, sort, n_select, dll)
+    """
+    payload = {
+        'data': dataset_fingerprint(df),
+        'setup': {key: value for key, value in setup_params.items() if key not in _IGNORED_SETUP_PARAMS},
+        'compare': compare_params,
+        'versions': library_versions(),
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class LeaderboardCache:
+    """
+    Cache leaderboard di disk (satu file joblib per key)
+
+    Eviction: entri yang lebih tua dari `max_age_days` dihapus, lalu entri yang
+    paling lama tidak dipakai dihapus sampai tersisa `max_entries`.
+    """
+
+    def __init__(self, cache_dir=None, max_entries=DEFAULT_MAX_ENTRIES, max_age_days=DEFAULT_MAX_AGE_DAYS):
+        """
+        Initialize LeaderboardCache
+
+        Parameters:
+        -----------
+        cache_dir : str atau None
+            Folder cache (default cache/leaderboard/ di project root)
+        max_entries : int
+            Jumlah entri maksimal yang disimpan
+        max_age_days : float
+            Umur maksimal entri (hari sejak terakhir dipakai)
+        """
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + CACHE_SUFFIX)
+
+    def _entries(self):
+        """Path entri cache, urut dari yang paling baru dipakai"""
+        if not os.path.isdir(self.cache_dir):
+            return []
+        paths = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                 if name.endswith(CACHE_SUFFIX)]
+        return sorted(paths, key=lambda path: -os.path.getmtime(path))
+
+    def get(self, key):
+        """
+        Ambil entri cache
+
+        Returns:
+        --------
+        entry : dict atau None
+            'leaderboard' (pd.DataFrame), 'models' dan 'metadata'; None jika
+            tidak ada atau tidak bisa dibaca
+        """
+        import joblib
+        path = self._path(key)
+        try:
+            entry = joblib.load(path)
+            os.utime(path)  # tandai baru dipakai (urutan eviction)
+        except (OSError, EOFError, ValueError, KeyError, AttributeError, ImportError):
+            return None
+        return entry
+
+    def put(self, key, leaderboard, models, metadata=None):
+        """Simpan leaderboard dan model hasil compare_models, lalu jalankan eviction"""
+        import joblib
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry = {
+            'leaderboard': leaderboard,
+            'models': models,
+            'metadata': dict(metadata or {}, created=time.time(), versions=library_versions()),
+        }
+        # Tulis ke file sementara dulu agar proses lain tidak membaca file setengah jadi
+        tmp_path = f"{self._path(key)}.{os.getpid()}.tmp"
+        joblib.dump(entry, tmp_path)
+        os.replace(tmp_path, self._path(key))
+        self.evict()
+
+    def evict(self):
+        """
+        Hapus entri kedaluwarsa dan entri berlebih
+
+        Returns:
+        --------
+        removed : list
+            Path entri yang dihapus
+        """
+        removed = []
+        cutoff = time.time() - self.max_age_days * 86400
+        for index, path in enumerate(self._entries()):
+            try:
+                if index >= self.max_entries or os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed.append(path)
+            except FileNotFoundError:  # sudah dihapus proses lain
+                pass
+        return removed
+
+    def clear(self):
+        """Hapus semua entri cache, kembalikan jumlah entri yang dihapus"""
+        removed = 0
+        for path in self._entries():
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
@@ -0,0 +1,139 @@
+"""
+Konfigurasi Logging untuk Pipeline Pneumonia
+Modul library (prediksi, preprocessing) menulis ke logger `pneumonia.*` dan
+diam secara default (hanya WARNING/ERROR yang tampil). Aplikasi (main.py)
+memanggil `configure_logging()`, atau caller memberikan `verbose=True`, untuk
+menampilkan output ke stdout
+"""
+
+import sys
+import logging
+import functools
+import threading
+import contextlib
+import contextvars
+
+
+LOGGER_NAME = 'pneumonia'
+
+_root_logger = logging.getLogger(LOGGER_NAME)
+
+_lock = threading.Lock()
+_configured_handler = None
+# True di dalam blok `verbose_logging(True)`; per thread/task, sehingga caller
+# lain yang berjalan bersamaan tetap diam
+_verbose = contextvars.ContextVar('pneumonia_verbose', default=False)
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler ke `sys.stdout` saat ini (ikut `contextlib.redirect_stdout`)"""
+
+    def __init__(self, fmt='%(message)s'):
+        super().__init__()
+        self.setFormatter(logging.Formatter(fmt))
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+
+class _ContextLogger(logging.Logger):
+    """Logger yang mengaktifkan INFO di dalam blok `verbose_logging` caller saat ini"""
+
+    def isEnabledFor(self, level):
+        if level >= logging.INFO and _verbose.get() and self.manager.disable < level:
+            return True
+        return super().isEnabledFor(level)
+
+
+class _DefaultHandler(logging.Handler):
+    """
+    Handler logger `pneumonia` selama `configure_logging` belum dipanggil
+
+    Pesan dari blok verbose ditulis ke stdout (sekali saja); pesan lain
+    diteruskan ke handler root seperti propagasi biasa (WARNING/ERROR tampil,
+    atau mengikuti konfigurasi logging aplikasi host).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._stdout = _StdoutHandler()
+
+    def emit(self, record):
+        if _configured_handler is not None:
+            return
+        if _verbose.get():
+            self._stdout.handle(record)
+        else:
+            logging.getLogger().callHandlers(record)
+
+
+# Propagasi ke root diganti _DefaultHandler agar pesan verbose tidak tercetak dua kali
+_root_logger.addHandler(_DefaultHandler())
+_root_logger.propagate = False
+
+
+def get_logger(name):
+    """Logger modul di bawah namespace `pneumonia`"""
+    logger = logging.getLogger(f'{LOGGER_NAME}.{name}')
+    if type(logger) is logging.Logger:
+        # Level efektif tetap global; hanya blok verbose caller ini yang melihat INFO
+        logger.__class__ = _ContextLogger
+    return logger
+
+
+def configure_logging(level=logging.INFO, fmt='%(message)s', handler=None):
+    """
+    Aktifkan output logger pneumonia (dipanggil oleh aplikasi/CLI)
+
+    Parameters:
+    -----------
+    level : int atau str
+        Level logging minimum (mis. logging.INFO, 'WARNING')
+    fmt : str
+        Format pesan (default hanya pesan, seperti output print sebelumnya)
+    handler : logging.Handler atau None
+        Handler tujuan. Jika None, output ditulis ke stdout.
+    """
+    global _configured_handler
+    with _lock:
+        if _configured_handler is not None:
+            _root_logger.removeHandler(_configured_handler)
+        _configured_handler = handler if handler is not None else _StdoutHandler(fmt)
+        _root_logger.addHandler(_configured_handler)
+        _root_logger.setLevel(level)
+        _root_logger.propagate = False
+    return _root_logger
+
+
+@contextlib.contextmanager
+def verbose_logging(verbose=True):
+    """
+    Tampilkan pesan INFO ke stdout selama blok jika `verbose=True`
+
+    Hanya berlaku untuk thread/task yang menjalankan blok: level logger dan
+    handler tidak diubah, sehingga caller lain yang berjalan bersamaan tetap
+    mengikuti konfigurasi logging. Jika `verbose=False`, output mengikuti
+    `configure_logging` (default diam).
+    """
+    if not verbose:
+        yield
+        return
+    token = _verbose.set(True)
+    try:
+        yield
+    finally:
+        _verbose.reset(token)
+
+
+def verbose_method(method):
+    """Dekorator method: jalankan method dengan `verbose_logging(self.verbose)`"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with verbose_logging(self.verbose):
+            return method(self, *args, **kwargs)
+    return wrapper
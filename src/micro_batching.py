@@ -0,0 +1,234 @@
+"""
+Dynamic Micro-Batching untuk Prediksi Satu Pasien
+Mengumpulkan request yang datang bersamaan (maksimum N baris atau T milidetik),
+menjalankan satu prediksi vectorized, lalu membagikan hasilnya kembali ke
+setiap request yang menunggu. Jika prediksi batch gagal, setiap request
+diprediksi ulang sendiri-sendiri sehingga hanya request penyebab error yang gagal.
+"""
+
+import time
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+
+class MicroBatcher:
+    """
+    Scheduler micro-batching berbasis asyncio
+
+    Dipakai langsung dari coroutine (`await batcher.submit(df)`) atau dari
+    thread biasa (`batcher.submit_threadsafe(df).result()`), mis. handler HTTP.
+    Prediksi dijalankan di thread executor sehingga event loop tetap menerima
+    request baru selama batch sebelumnya diproses; request yang menumpuk pada
+    saat itu otomatis masuk ke batch berikutnya.
+    """
+
+    def __init__(self, predict_fn, max_batch_size=64, max_wait_ms=5.0, name='batcher'):
+        """
+        Initialize MicroBatcher
+
+        Parameters:
+        -----------
+        predict_fn : callable
+            Fungsi prediksi `predict_fn(df) -> pd.DataFrame` dengan jumlah baris
+            hasil sama dengan input
+        max_batch_size : int
+            Jumlah baris maksimum per batch
+        max_wait_ms : float
+            Waktu tunggu maksimum (ms) sejak request pertama sebelum batch
+            dijalankan
+        name : str
+            Nama batcher (untuk metrik dan nama thread)
+        """
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.name = name
+
+        self._loop = None
+        self._background_loop = None
+        self._thread = None
+        self._task = None
+        self._items = deque()
+        self._has_items = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f'{name}-predict')
+        self._start_lock = threading.Lock()
+
+        self._pending_rows = 0
+        self._max_queue_depth = 0
+        self._batches = 0
+        self._requests = 0
+        self._rows = 0
+        self._errors = 0
+        self._split_batches = 0
+        self._last_batch_rows = 0
+        self._predict_seconds = 0.0
+        self._queue_wait_seconds = 0.0
+
+    def _attach(self):
+        """Pasang batcher ke event loop yang sedang berjalan"""
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+            self._has_items = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        elif self._loop is not loop:
+            raise RuntimeError(f"MicroBatcher '{self.name}' sudah terpasang di event loop lain")
+
+    async def submit(self, df):
+        """
+        Masukkan data ke antrian dan tunggu hasil prediksinya
+
+        Parameters:
+        -----------
+        df : pd.DataFrame
+            Data satu atau beberapa pasien
+
+        Returns:
+        --------
+        predictions : pd.DataFrame
+            Hasil prediksi untuk baris `df` (urutan sama)
+        """
+        self._attach()
+        future = self._loop.create_future()
+        self._items.append((df, future, time.perf_counter()))
+        self._pending_rows += len(df)
+        self._max_queue_depth = max(self._max_queue_depth, len(self._items))
+        self._has_items.set()
+        return await future
+
+    def start(self):
+        """Jalankan event loop batcher di background thread (untuk caller sinkron)"""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=loop.run_forever, name=f'{self.name}-loop', daemon=True)
+            self._thread.start()
+            self._background_loop = loop
+
+    def submit_threadsafe(self, df):
+        """
+        Versi `submit` untuk dipanggil dari thread biasa
+
+        Returns:
+        --------
+        future : concurrent.futures.Future
+            Future berisi hasil prediksi
+        """
+        if self._thread is None:
+            self.start()
+        return asyncio.run_coroutine_threadsafe(self.submit(df), self._background_loop)
+
+    def stop(self):
+        """Hentikan background loop (jika ada) dan executor prediksi"""
+        if self._task is not None and self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._task.cancel)
+        if self._background_loop is not None:
+            self._background_loop.call_soon_threadsafe(self._background_loop.stop)
+            self._thread.join(timeout=1.0)
+        self._executor.shutdown(wait=False)
+
+    def _take_batch(self):
+        """Ambil request dari antrian sampai max_batch_size baris (minimal satu request)"""
+        batch = []
+        n_rows = 0
+        while self._items and (not batch or n_rows + len(self._items[0][0]) <= self.max_batch_size):
+            item = self._items.popleft()
+            batch.append(item)
+            n_rows += len(item[0])
+        self._pending_rows -= n_rows
+        if not self._items:
+            self._has_items.clear()
+        return batch, n_rows
+
+    def _predict(self, frames):
+        start = time.perf_counter()
+        predictions = self.predict_fn(pd.concat(frames, ignore_index=True))
+        return predictions, time.perf_counter() - start
+
+    def _predict_each(self, frames):
+        """Prediksi setiap request terpisah; hasil berupa DataFrame atau exception per request"""
+        start = time.perf_counter()
+        results = []
+        for df in frames:
+            try:
+                results.append(self.predict_fn(df.reset_index(drop=True)))
+            except Exception as e:
+                results.append(e)
+        return results, time.perf_counter() - start
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._has_items.wait()
+
+            # Tunggu sampai batch penuh atau batas waktu dari request pertama habis
+            deadline = self._items[0][2] + self.max_wait
+            while self._pending_rows < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._has_items.clear()
+                try:
+                    await asyncio.wait_for(self._has_items.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            self._has_items.set()
+
+            batch, n_rows = self._take_batch()
+            frames = [df for df, _, _ in batch]
+            started = time.perf_counter()
+            try:
+                predictions, seconds = await loop.run_in_executor(self._executor, self._predict, frames)
+                offset = 0
+                results = []
+                for df in frames:
+                    results.append(predictions.iloc[offset:offset + len(df)])
+                    offset += len(df)
+            except Exception as e:
+                if len(batch) == 1:
+                    results, seconds = [e], time.perf_counter() - started
+                else:
+                    # Satu request dengan data bermasalah tidak boleh menggagalkan request
+                    # lain di batch yang sama: ulangi per request
+                    self._split_batches += 1
+                    results, seconds = await loop.run_in_executor(self._executor, self._predict_each, frames)
+
+            self._batches += 1
+            self._last_batch_rows = n_rows
+            self._predict_seconds += seconds
+            for (df, future, enqueued), result in zip(batch, results):
+                if isinstance(result, Exception):
+                    self._errors += 1
+                    if not future.done():
+                        future.set_exception(result)
+                    continue
+                self._requests += 1
+                self._rows += len(df)
+                self._queue_wait_seconds += started - enqueued
+                if not future.done():
+                    future.set_result(result)
+
+    def metrics(self):
+        """Metrik antrian dan batch (kedalaman antrian, ukuran batch, waktu tunggu)"""
+        return {
+            'name': self.name,
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000,
+            'queue_depth': len(self._items),
+            'queue_rows': self._pending_rows,
+            'max_queue_depth': self._max_queue_depth,
+            'batches': self._batches,
+            'requests': self._requests,
+            'rows': self._rows,
+            'errors': self._errors,
+            'split_batches': self._split_batches,
+            'last_batch_rows': self._last_batch_rows,
+            'avg_batch_rows': self._rows / self._batches if self._batches else 0.0,
+            'avg_predict_ms': 1000 * self._predict_seconds / self._batches if self._batches else 0.0,
+            'avg_queue_wait_ms': 1000 * self._queue_wait_seconds / self._requests if self._requests else 0.0,
+        }
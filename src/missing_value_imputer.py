@@ -0,0 +1,188 @@
+"""
+Imputer Missing Value untuk Dataset Pneumonia
+Statistik pengisian (mean, median atau modus) dihitung sekali dari data
+training, disimpan bersama data yang diproses dan model, lalu dipakai ulang
+saat prediksi sehingga data baru diisi dengan statistik training, bukan
+statistik batch
+"""
+
+import os
+import json
+import threading
+
+import numpy as np
+import pandas as pd
+
+
+IMPUTER_SUFFIX = '.imputer.json'
+IMPUTER_VERSION = 1
+STRATEGIES = ('mean', 'median', 'mode', 'drop')
+
+
+def _to_python(value):
+    """Nilai numpy/pandas ke tipe Python agar bisa diserialisasi ke JSON"""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+class MissingValueImputer:
+    """
+    Imputer missing value yang di-fit sekali dan transform dalam satu operasi
+
+    Strategi 'mean' dan 'median' mengisi kolom numerik, 'mode' mengisi kolom
+    dengan modus (nilai terkecil jika modus lebih dari satu). Mean/median
+    dihitung untuk semua kolom numerik, termasuk kolom yang lengkap di data
+    training, sehingga data baru dengan nilai kosong tetap diisi statistik
+    training. Modus hanya dihitung untuk kolom yang memiliki missing value
+    (modus kolom kontinu mahal; nilai kategorikal kosong lainnya ditangani
+    CategoricalEncoder). Strategi 'drop' membuang baris dengan missing value
+    di data training dan tidak mengubah data baru.
+    """
+
+    def __init__(self, strategy='mean'):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy harus salah satu dari {STRATEGIES}")
+        self.strategy = strategy
+        self.fill_values = {}
+
+    @staticmethod
+    def _numeric_columns(df):
+        return [col for col in df.columns if df[col].dtype.kind in 'iuf']
+
+    @staticmethod
+    def _missing_columns(df):
+        missing = df.isna().any()
+        return missing.index[missing.to_numpy()].tolist()
+
+    def fit(self, df):
+        """
+        Hitung statistik pengisian dari data training (satu pass per strategi)
+
+        Parameters:
+        -----------
+        df : pd.DataFrame
+            Data training (sebelum encoding)
+        """
+        if self.strategy == 'mean':
+            statistics = df[self._numeric_columns(df)].mean()
+        elif self.strategy == 'median':
+            statistics = df[self._numeric_columns(df)].median()
+        elif self.strategy == 'mode':
+            # Per kolom: DataFrame.mode menyimpan semua modus (kolom kontinu
+            # bisa berisi ribuan nilai seri), cukup modus terkecil
+            statistics = pd.Series({col: df[col].mode(dropna=True).iloc[0]
+                                    for col in self._missing_columns(df) if df[col].notna().any()},
+                                   dtype=object)
+        else:
+            statistics = pd.Series(dtype=object)
+        self.fill_values = {col: _to_python(value) for col, value in statistics.items() if pd.notna(value)}
+        return self
+
+    def transform(self, df):
+        """
+        Isi missing value dengan statistik hasil fit dalam satu `fillna`
+
+        DataFrame input tidak diubah.
+
+        Parameters:
+        -----------
+        df : pd.DataFrame
+            Data yang akan diisi
+
+        Returns:
+        --------
+        filled : pd.DataFrame
+        """
+        values = {col: value for col, value in self.fill_values.items() if col in df.columns}
+        if not values:
+            return df
+        return df.fillna(value=values)
+
+    def fit_transform(self, df):
+        """
+        Fit lalu terapkan pada data training
+
+        Untuk strategi 'drop', baris dengan missing value di kolom mana pun
+        dibuang.
+        """
+        self.fit(df)
+        if self.strategy == 'drop':
+            return df.dropna()
+        return self.transform(df)
+
+    def to_dict(self):
+        """Konversi imputer ke dict yang bisa diserialisasi ke JSON"""
+        return {
+            'version': IMPUTER_VERSION,
+            'strategy': self.strategy,
+            'fill_values': self.fill_values,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Bangun imputer dari dict hasil `to_dict`"""
+        imputer = cls(data.get('strategy', 'mean'))
+        imputer.fill_values = dict(data.get('fill_values', {}))
+        return imputer
+
+    def save(self, path):
+        """Simpan imputer ke file JSON"""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+
+    @classmethod
+    def load(cls, path):
+        """Muat imputer dari file JSON"""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def imputer_path_for(path):
+    """
+    Path artifact imputer untuk sebuah model atau file data
+
+    `models/mortality_model` -> `models/mortality_model.imputer.json`
+    `data/processed.csv` -> `data/processed.imputer.json`
+    """
+    root, ext = os.path.splitext(path)
+    if ext in ('.pkl', '.csv', '.xlsx', '.parquet', '.feather'):
+        path = root
+    return path + IMPUTER_SUFFIX
+
+
+def save_imputer_for_model(data_path, model_path):
+    """
+    Salin imputer data training ke samping model
+
+    Returns:
+    --------
+    imputer_path : str atau None
+        Path file imputer yang ditulis, None jika data training tidak memiliki
+        imputer
+    """
+    source = imputer_path_for(data_path)
+    if not os.path.exists(source):
+        return None
+    target = imputer_path_for(model_path)
+    MissingValueImputer.load(source).save(target)
+    return target
+
+
+_imputer_cache = {}
+_imputer_lock = threading.Lock()
+
+
+def load_imputer_for_model(model_path, refresh=False):
+    """
+    Ambil imputer untuk model dari cache in-memory
+
+    File imputer hanya dibaca sekali per proses (atau saat `refresh=True`).
+    Mengembalikan None jika model tidak memiliki artifact imputer (model lama:
+    missing value diisi oleh pipeline model).
+    """
+    key = imputer_path_for(model_path)
+    if not refresh and key in _imputer_cache:
+        return _imputer_cache[key]
+    with _imputer_lock:
+        imputer = MissingValueImputer.load(key) if os.path.exists(key) else None
+        _imputer_cache[key] = imputer
+    return imputer
@@ -0,0 +1,202 @@
+"""
+Registry Model In-Process untuk Prediksi Pneumonia
+Memuat setiap model sekali per proses dan memuat ulang jika file model berubah
+"""
+
+import os
+import time
+import hashlib
+import threading
+
+
+def _file_sha256(path, chunk_size=1024 * 1024):
+    """Hitung hash SHA-256 dari sebuah file secara bertahap"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ModelRegistry:
+    """
+    Cache model yang sudah dimuat, dikunci dengan path absolut file model.
+
+    Setiap entry menyimpan fingerprint file (mtime dan ukuran). Pada setiap
+    `get()` hanya dilakukan `os.stat` - jika fingerprint berubah, hash file
+    dibandingkan (jika `verify_hash=True`) dan model dimuat ulang hanya jika
+    isinya memang berbeda.
+    """
+
+    def __init__(self, verify_hash=True):
+        """
+        Initialize ModelRegistry
+
+        Parameters:
+        -----------
+        verify_hash : bool
+            Jika True, hash SHA-256 file dipakai untuk memastikan file benar-benar
+            berubah sebelum model dimuat ulang (mis. file hanya di-touch)
+        """
+        self.verify_hash = verify_hash
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._path_locks = {}
+        self._hits = 0
+        self._misses = 0
+        self._reloads = 0
+        self._evictions = 0
+
+    @staticmethod
+    def resolve_path(model_path):
+        """
+        Resolve path model menjadi path absolut ke file model
+
+        PyCaret menyimpan model sebagai `<model_path>.pkl`, sehingga path tanpa
+        ekstensi ditambahkan `.pkl` (path inference bundle `.joblib` dan file
+        pohon bersama `.trees` dipakai apa adanya). Path relatif dicoba dari current dir, lalu dari project
+        root.
+        """
+        file_path = model_path if model_path.endswith(('.pkl', '.joblib', '.trees')) else model_path + '.pkl'
+        if not os.path.isabs(file_path) and not os.path.exists(file_path):
+            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            file_path = os.path.join(project_root, file_path)
+        return os.path.abspath(file_path)
+
+    def _path_lock(self, key):
+        with self._lock:
+            lock = self._path_locks.get(key)
+            if lock is None:
+                lock = self._path_locks[key] = threading.Lock()
+            return lock
+
+    def get(self, model_path, loader):
+        """
+        Ambil model dari cache, muat dari disk jika belum ada atau berubah
+
+        Parameters:
+        -----------
+        model_path : str
+            Path ke model (dengan atau tanpa ekstensi .pkl) atau inference bundle
+        loader : callable
+            Fungsi untuk memuat model, dipanggil dengan path tanpa ekstensi .pkl
+            (sama seperti `load_model` PyCaret); path bundle diberikan utuh
+
+        Returns:
+        --------
+        model : object
+            Model yang sudah dimuat
+        """
+        key = self.resolve_path(model_path)
+        stat = os.stat(key)
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry['fingerprint'] == fingerprint:
+            with self._lock:
+                self._hits += 1
+                entry['hits'] += 1
+            return entry['model']
+
+        with self._path_lock(key):
+            # Cek ulang: thread lain mungkin sudah memuat model ini
+            entry = self._entries.get(key)
+            if entry is not None and entry['fingerprint'] == fingerprint:
+                with self._lock:
+                    self._hits += 1
+                    entry['hits'] += 1
+                return entry['model']
+
+            file_hash = _file_sha256(key) if self.verify_hash else None
+            if entry is not None and file_hash is not None and entry['sha256'] == file_hash:
+                # Hanya metadata yang berubah, isi file sama
+                with self._lock:
+                    entry['fingerprint'] = fingerprint
+                    self._hits += 1
+                    entry['hits'] += 1
+                return entry['model']
+
+            start = time.perf_counter()
+            model = loader(key[:-len('.pkl')] if key.endswith('.pkl') else key)
+            load_seconds = time.perf_counter() - start
+
+            with self._lock:
+                if entry is None:
+                    self._misses += 1
+                else:
+                    self._reloads += 1
+                self._entries[key] = {
+                    'model': model,
+                    'fingerprint': fingerprint,
+                    'sha256': file_hash,
+                    'loaded_at': time.time(),
+                    'load_seconds': load_seconds,
+                    'hits': 0,
+                }
+            return model
+
+    def warm_up(self, model_paths, loader):
+        """
+        Muat beberapa model sekaligus (mis. saat startup service)
+
+        Parameters:
+        -----------
+        model_paths : list of str
+            Daftar path model
+        loader : callable
+            Fungsi untuk memuat model
+
+        Returns:
+        --------
+        loaded : dict
+            Mapping path absolut -> model
+        """
+        return {self.resolve_path(p): self.get(p, loader) for p in model_paths}
+
+    def evict(self, model_path=None):
+        """
+        Hapus model dari cache
+
+        Parameters:
+        -----------
+        model_path : str atau None
+            Path model yang dihapus. Jika None, semua model dihapus.
+
+        Returns:
+        --------
+        n_evicted : int
+            Jumlah model yang dihapus dari cache
+        """
+        with self._lock:
+            if model_path is None:
+                n_evicted = len(self._entries)
+                self._entries.clear()
+            else:
+                n_evicted = int(self._entries.pop(self.resolve_path(model_path), None) is not None)
+            self._evictions += n_evicted
+        return n_evicted
+
+    def stats(self):
+        """Statistik cache: hits, misses, reloads, evictions dan detail per model"""
+        with self._lock:
+            return {
+                'hits': self._hits,
+                'misses': self._misses,
+                'reloads': self._reloads,
+                'evictions': self._evictions,
+                'models': {
+                    key: {
+                        'loaded_at': entry['loaded_at'],
+                        'load_seconds': entry['load_seconds'],
+                        'hits': entry['hits'],
+                        'mtime_ns': entry['fingerprint'][0],
+                        'size_bytes': entry['fingerprint'][1],
+                        'sha256': entry['sha256'],
+                    }
+                    for key, entry in self._entries.items()
+                },
+            }
+
+
+# Registry default yang dipakai oleh predict.py
+default_registry = ModelRegistry()
@@ -0,0 +1,205 @@
+"""
+Training Paralel Model Mortalitas dan LOS
+Task klasifikasi (Mortality) dan regresi (LOS_days) hanya berbagi file data,
+sehingga keduanya bisa dilatih di proses worker terpisah. Setiap worker
+mendapat jatah core (n_jobs) agar tidak saling berebut CPU.
+"""
+
+import io
+import os
+import time
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Nama task -> field target di RunConfig, jenis task, trainer (modul, fungsi)
+# dan field path model di RunConfig
+TASK_SPECS = {
+    'mortality': {
+        'target_field': 'mortality_target_col',
+        'task': 'classification',
+        'trainers': {
+            'lightgbm': ('train_mortality', 'train_mortality_model', 'mortality_model_path'),
+            'et': ('train_mortality', 'train_extra_tree_model', 'mortality_et_model_path'),
+        },
+    },
+    'los': {
+        'target_field': 'los_target_col',
+        'task': 'regression',
+        'trainers': {
+            'lightgbm': ('train_los', 'train_los_model', 'los_model_path'),
+            'et': ('train_los', 'train_extra_tree_regressor', 'los_et_model_path'),
+        },
+    },
+}
+
+# Variabel environment pool thread native (OpenMP LightGBM, BLAS numpy)
+_THREAD_ENV_VARS = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS')
+
+
+def split_n_jobs(n_tasks, n_cpus=None):
+    """
+    Bagi core yang tersedia rata ke setiap task (minimal 1 core per task)
+
+    Parameters:
+    -----------
+    n_tasks : int
+        Jumlah task yang berjalan bersamaan
+    n_cpus : int atau None
+        Jumlah core; default `os.cpu_count()`
+    """
+    n_cpus = n_cpus or os.cpu_count() or 1
+    return max(1, n_cpus // max(1, n_tasks))
+
+
+def _init_worker(n_jobs):
+    """Batasi thread native sebelum worker mengimpor numpy/LightGBM"""
+    for name in _THREAD_ENV_VARS:
+        os.environ[name] = str(n_jobs)
+
+
+def _cv_metrics(tuning_history, start):
+    """
+    Rata-rata metrik cross-validation (baris 'Mean') dari tuning terakhir trainer
+
+    Model hasil `finalize_model` sudah dilatih ulang dengan test set sehingga
+    skornya di test set tidak bermakna; yang dilaporkan adalah skor CV model
+    ter-tuning yang sudah dihitung saat tuning (tanpa CV ulang). Kosong jika
+    trainer tidak melakukan tuning (record ditambahkan mulai index `start`).
+    """
+    records = tuning_history[start:]
+    return dict(records[-1].get('cv_metrics', {})) if records else {}
+
+
+def train_task(name, data_path, config=None, model_dir=None, capture_output=True):
+    """
+    Latih LightGBM dan Extra Tree untuk satu task dengan satu TrainingSession
+
+    Parameters:
+    -----------
+    name : str
+        'mortality' atau 'los'
+    data_path : str
+        Path ke dataset yang sudah diproses
+    config : RunConfig atau None
+        Konfigurasi run (test_size, n_jobs, fold, tuning, ...); default config.py
+    model_dir : str atau None
+        Folder penyimpanan model (default path model di config)
+    capture_output : bool
+        Tampung output trainer dan kembalikan di hasil (agar log task yang
+        berjalan paralel tidak bercampur)
+
+    Returns:
+    --------
+    result : dict
+        Path model, metrik CV, timing (detik) dan log per task
+    """
+    import importlib
+    from run_config import load_config
+    from training_session import TrainingSession
+
+    config = config or load_config()
+    spec = TASK_SPECS[name]
+    target_col = getattr(config, spec['target_field'])
+    session = TrainingSession(data_path, target_col, task=spec['task'], model_dir=model_dir, config=config)
+
+    result = {'task': name, 'target_col': target_col, 'n_jobs': config.n_jobs,
+              'models': {}, 'metrics': {}, 'timing': {}, 'log': None, 'error': None}
+    buffer = io.StringIO()
+    redirect = contextlib.redirect_stdout(buffer) if capture_output else contextlib.nullcontext()
+    start = time.perf_counter()
+    with redirect:
+        try:
+            for model_name, (module_name, function_name, path_field) in spec['trainers'].items():
+                trainer = getattr(importlib.import_module(module_name), function_name)
+                model_start = time.perf_counter()
+                n_tuned = len(session.tuning_history)
+                trainer(data_path=data_path, session=session)
+                result['timing'][model_name] = time.perf_counter() - model_start
+                result['models'][model_name] = session.model_path(getattr(config, path_field))
+                result['metrics'][model_name] = _cv_metrics(session.tuning_history, n_tuned)
+        except Exception as e:
+            result['error'] = f"{type(e).__name__}: {str(e)}"
+    result['tuning'] = session.tuning_history
+    result['timing']['setup'] = session.setup_seconds
+    result['timing']['total'] = time.perf_counter() - start
+    if capture_output:
+        result['log'] = buffer.getvalue()
+    return result
+
+
+def train_tasks(data_path, tasks=None, config=None, parallel=True, model_dir=None, capture_output=True):
+    """
+    Latih semua task, paralel (satu proses per task) atau berurutan
+
+    Parameters:
+    -----------
+    data_path : str
+        Path ke dataset yang sudah diproses
+    tasks : list atau None
+        Nama task (default semua task di TASK_SPECS)
+    config : RunConfig atau None
+        Konfigurasi run; default config.py. Jika paralel dan `config.n_jobs`
+        None, core dibagi rata antar task. Jika berurutan, `config.n_jobs`
+        None berarti semua core per task.
+    parallel : bool
+        True: setiap task di proses worker sendiri. False: berurutan di proses ini.
+    model_dir : str atau None
+        Folder penyimpanan model (default path model di config)
+    capture_output : bool
+        Tampung output trainer per task (lihat `train_task`)
+
+    Returns:
+    --------
+    results : dict
+        'tasks' (nama task -> hasil `train_task`) dan 'wall_seconds'
+    """
+    from run_config import load_config
+
+    config = config or load_config()
+    tasks = list(tasks or TASK_SPECS)
+    start = time.perf_counter()
+    if not parallel:
+        results = {name: train_task(name, data_path, config, model_dir, capture_output)
+                   for name in tasks}
+    else:
+        if config.n_jobs is None:
+            config = config.with_overrides({'n_jobs': split_n_jobs(len(tasks))})
+        # spawn: worker mulai bersih, tanpa state OpenMP/thread dari proses induk
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=len(tasks), mp_context=context,
+                                 initializer=_init_worker, initargs=(config.n_jobs,)) as pool:
+            futures = {name: pool.submit(train_task, name, data_path, config, model_dir, capture_output)
+                       for name in tasks}
+            results = {}
+            for name, future in futures.items():
+                try:
+                    results[name] = future.result()
+                except Exception as e:  # worker mati (mis. kehabisan memori)
+                    results[name] = {'task': name, 'n_jobs': config.n_jobs, 'models': {}, 'metrics': {},
+                                     'timing': {}, 'tuning': [], 'log': None,
+                                     'error': f"{type(e).__name__}: {str(e)}"}
+    return {'tasks': results, 'wall_seconds': time.perf_counter() - start}
+
+
+def print_summary(results):
+    """Tampilkan timing dan metrik utama per task"""
+    print(f"\n{'Task':>10} | {'n_jobs':>6} | {'Setup (s)':>9} | {'LightGBM (s)':>12} | "
+          f"{'ExtraTree (s)':>13} | {'Total (s)':>9} | Status")
+    print("-" * 90)
+    task_seconds = 0.0
+    for name, result in results['tasks'].items():
+        timing = result['timing']
+        task_seconds += timing.get('total') or 0.0
+        cells = [f"{timing[key]:>{width}.1f}" if timing.get(key) is not None else f"{'-':>{width}}"
+                 for key, width in (('setup', 9), ('lightgbm', 12), ('et', 13), ('total', 9))]
+        status = 'OK' if result['error'] is None else f"Error: {result['error']}"
+        print(f"{name:>10} | {str(result['n_jobs'] or '-'):>6} | " + ' | '.join(cells) + f" | {status}")
+
+    print(f"\nWall clock: {results['wall_seconds']:.1f} s (jumlah waktu per task: {task_seconds:.1f} s)")
+    for name, result in results['tasks'].items():
+        for model_name, metrics in result['metrics'].items():
+            summary = ', '.join(f"{key}={value:.4f}" for key, value in metrics.items()
+                                if isinstance(value, float))
+            print(f"   {name}/{model_name}: {summary}")
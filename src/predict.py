@@ -5,44 +5,109 @@ Script untuk melakukan prediksi menggunakan model yang sudah ditraining
 import pandas as pd
 import numpy as np
 import os
-from pycaret.classification import load_model, predict_model
-from pycaret.regression import load_model as load_reg_model, predict_model as predict_reg_model
+import time
+import logging
+from model_registry import default_registry
+from feature_schema import load_schema_for_model, load_schema_from_data
+from categorical_encoder import load_encoder_for_model
+from missing_value_imputer import load_imputer_for_model
+from data_io import read_table
+from inference_bundle import InferenceBundle, BUNDLE_SUFFIX, bundle_path_for, model_path_for_bundle
+from shared_trees import TREES_SUFFIX, trees_path_for, model_path_for_trees, load_shared_bundle
+from log_config import get_logger, verbose_logging
+from instrumentation import instrumented
 import warnings
 warnings.filterwarnings('ignore')
 
 
-def preprocess_data_for_prediction(df, reference_data_path='data/processed_pneumonia_data.csv', exclude_target=None):
+logger = get_logger('predict')
+
+
+# Kolom hasil prediksi gabungan
+PREDICTION_COLUMNS = ['Predicted_Mortality', 'Mortality_Probability', 'Predicted_LOS']
+
+# Pakai inference bundle (tanpa PyCaret) jika tersedia. Set
+# PNEUMONIA_INFERENCE_BUNDLE=0 untuk selalu memakai pipeline PyCaret (.pkl)
+USE_INFERENCE_BUNDLE = os.environ.get('PNEUMONIA_INFERENCE_BUNDLE', '1') != '0'
+
+# Pakai file pohon bersama (`<model>.trees`, memory map read-only) untuk model
+# ensemble pohon jika tersedia: worker di satu host berbagi satu salinan model
+# di page cache. Set PNEUMONIA_SHARED_TREES=1 (diwarisi proses worker).
+USE_SHARED_TREES = os.environ.get('PNEUMONIA_SHARED_TREES', '0') == '1'
+
+
+def _load_classifier(model_path):
+    """Muat model klasifikasi beserta skema, encoder dan imputer-nya (dipanggil oleh registry)"""
+    if model_path.endswith(TREES_SUFFIX):
+        model = load_shared_bundle(model_path)
+        model_path = model_path_for_trees(model_path)
+    elif model_path.endswith(BUNDLE_SUFFIX):
+        model = InferenceBundle.load(model_path)
+        model_path = model_path_for_bundle(model_path)
+    else:
+        # PyCaret hanya diimpor jika model belum memiliki inference bundle
+        from pycaret.classification import load_model
+        model = load_model(model_path, verbose=logger.isEnabledFor(logging.INFO))
+    load_schema_for_model(model_path, refresh=True)
+    load_encoder_for_model(model_path, refresh=True)
+    load_imputer_for_model(model_path, refresh=True)
+    return model
+
+
+def _load_regressor(model_path):
+    """Muat model regresi beserta skema, encoder dan imputer-nya (dipanggil oleh registry)"""
+    if model_path.endswith(TREES_SUFFIX):
+        model = load_shared_bundle(model_path)
+        model_path = model_path_for_trees(model_path)
+    elif model_path.endswith(BUNDLE_SUFFIX):
+        model = InferenceBundle.load(model_path)
+        model_path = model_path_for_bundle(model_path)
+    else:
+        from pycaret.regression import load_model
+        model = load_model(model_path, verbose=logger.isEnabledFor(logging.INFO))
+    load_schema_for_model(model_path, refresh=True)
+    load_encoder_for_model(model_path, refresh=True)
+    load_imputer_for_model(model_path, refresh=True)
+    return model
+
+
+def _artifact_path(model_path):
     """
-    Preprocess data baru agar formatnya sama dengan data training
-    
-    Parameters:
-    -----------
-    df : pd.DataFrame
-        Data yang akan diproses
-    reference_data_path : str
-        Path ke data reference untuk mendapatkan semua kolom
-    exclude_target : str atau None
-        Target yang akan dikecualikan ('Mortality' atau 'LOS_days')
+    File model yang dimuat registry: file pohon bersama (jika USE_SHARED_TREES)
+    atau inference bundle jika ada dan tidak lebih lama dari file .pkl
+    PyCaret, selain itu file .pkl
     """
+    if not USE_INFERENCE_BUNDLE:
+        return model_path
+    bundle_file = default_registry.resolve_path(bundle_path_for(model_path))
+    if not os.path.exists(bundle_file):
+        return model_path
+    model_file = default_registry.resolve_path(model_path)
+    if os.path.exists(model_file) and os.path.getmtime(model_file) > os.path.getmtime(bundle_file):
+        # Model dilatih ulang tanpa bundle baru: bundle sudah usang
+        return model_path
+    if USE_SHARED_TREES:
+        trees_file = default_registry.resolve_path(trees_path_for(model_path))
+        if os.path.exists(trees_file) and os.path.getmtime(trees_file) >= os.path.getmtime(bundle_file):
+            return trees_file
+    return bundle_file
+
+
+def _encode_categorical_legacy(df):
+    """Encoding per batch untuk model lama yang belum memiliki encoder tersimpan"""
     df = df.copy()
-    
-    # Drop Patient_ID jika ada
-    if 'Patient_ID' in df.columns:
-        df = df.drop(columns=['Patient_ID'])
-    
-    # Encode categorical variables seperti saat training
     from sklearn.preprocessing import LabelEncoder
     le = LabelEncoder()
-    
+
     categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
-    
+
     # Hapus target dari categorical jika ada (untuk prediksi)
     if 'Mortality' in categorical_cols:
         categorical_cols.remove('Mortality')
     if 'LOS_days' in df.columns:
         # LOS_days harus tetap ada, tapi tidak perlu di-encode
         pass
-    
+
     for col in categorical_cols:
         if col in df.columns:
             if df[col].nunique() == 2:  # Binary
@@ -50,46 +115,105 @@ def preprocess_data_for_prediction(df, reference_data_path='data/processed_pneum
             else:  # Multi-class, gunakan one-hot encoding
                 df = pd.get_dummies(df, columns=[col], prefix=col)
     
-    # Pastikan semua kolom dari data training ada (tambahkan dengan nilai 0 jika tidak ada)
+    return df
+
+
+@instrumented()
+def _load_input(new_data):
+    """Load data input dari path file (Excel/CSV/Parquet/Feather) atau pakai DataFrame apa adanya"""
+    if isinstance(new_data, str):
+        return read_table(new_data)
+    return new_data
+
+
+@instrumented()
+def _model_artifacts(model_path, loader):
+    """Ambil model, skema fitur, encoder dan imputer dari registry/cache in-memory"""
+    model = default_registry.get(_artifact_path(model_path), loader)
+    model_file = default_registry.resolve_path(model_path)
+    return (model, load_schema_for_model(model_file), load_encoder_for_model(model_file),
+            load_imputer_for_model(model_file))
+
+
+@instrumented()
+def _encode_for_prediction(df, encoder=None, imputer=None):
+    """Drop Patient_ID, isi missing value dan encode kolom kategorikal seperti saat training"""
+    # Drop Patient_ID jika ada
+    if 'Patient_ID' in df.columns:
+        df = df.drop(columns=['Patient_ID'])
+    
+    # Isi missing value dengan statistik data training (bukan statistik batch)
+    if imputer is not None:
+        df = imputer.transform(df)
+    
+    # Encode categorical variables seperti saat training
+    if encoder is not None:
+        return encoder.transform(df)
+    return _encode_categorical_legacy(df)
+
+
+def _resolve_schema(schema, reference_data_path='data/processed_pneumonia_data.csv'):
+    """Skema model, atau fallback ke header data reference untuk model lama"""
+    if schema is not None:
+        return schema
+    # Fallback untuk model tanpa artifact skema: header data reference
+    # (dibaca sekali per proses lalu di-cache)
+    project_root = os.path.dirname(os.path.dirname(__file__))
+    ref_path = os.path.join(project_root, reference_data_path)
     try:
-        # Load reference data untuk mendapatkan semua kolom
-        project_root = os.path.dirname(os.path.dirname(__file__))
-        ref_path = os.path.join(project_root, reference_data_path)
-        if os.path.exists(ref_path):
-            ref_df = pd.read_csv(ref_path, nrows=1)  # Hanya baca header
-            # Ambil semua kolom dari reference
-            ref_cols = list(ref_df.columns)
-            
-            # Hapus target yang dikecualikan jika ada
-            if exclude_target and exclude_target in ref_cols:
-                ref_cols.remove(exclude_target)
-            
-            # Tambahkan kolom yang hilang dengan nilai default
-            missing_cols = [c for c in ref_cols if c not in df.columns]
-            if missing_cols:
-                print(f"Menambahkan {len(missing_cols)} kolom yang hilang...")
-                for col in missing_cols:
-                    # Untuk LOS_days, gunakan nilai default yang masuk akal
-                    if col == 'LOS_days':
-                        df[col] = 20  # Nilai default LOS (mean dari data)
-                    elif col == 'Mortality':
-                        df[col] = 0  # Default untuk Mortality (No)
-                    else:
-                        df[col] = 0
-            
-            # Pastikan urutan kolom sama dan semua kolom ada
-            # Reorder sesuai reference
-            df = df.reindex(columns=ref_cols, fill_value=0)
-        else:
-            print(f"Warning: File reference tidak ditemukan: {ref_path}")
+        schema = load_schema_from_data(ref_path)
     except Exception as e:
-        print(f"Warning: Tidak bisa load reference data: {str(e)}")
-        print("Menggunakan kolom yang ada saja...")
+        logger.warning("Warning: Tidak bisa load reference data: %s", e)
+    if schema is None:
+        logger.warning("Warning: Skema training tidak ditemukan: %s", ref_path)
+        logger.warning("Menggunakan kolom yang ada saja...")
+    return schema
+
+
+@instrumented()
+def _align_for_prediction(df, schema, exclude_target=None):
+    """Samakan kolom dengan skema training (kolom hilang diisi nilai default)"""
+    if schema is None:
+        return df
+    
+    missing_cols = [c for c in schema.feature_columns(exclude_target) if c not in df.columns]
+    if missing_cols:
+        logger.info("Menambahkan %d kolom yang hilang...", len(missing_cols))
+    
+    # Reorder sesuai skema training, kolom hilang diisi nilai default
+    return schema.align(df, exclude_target=exclude_target)
+
+
+def preprocess_data_for_prediction(df, reference_data_path='data/processed_pneumonia_data.csv', exclude_target=None,
+                                   schema=None, encoder=None, imputer=None):
+    """
+    Preprocess data baru agar formatnya sama dengan data training
     
-    return df
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Data yang akan diproses
+    reference_data_path : str
+        Path ke data reference untuk mendapatkan semua kolom (hanya dipakai
+        jika `schema` tidak diberikan)
+    exclude_target : str atau None
+        Target yang akan dikecualikan ('Mortality' atau 'LOS_days')
+    schema : FeatureSchema atau None
+        Skema fitur training yang disimpan bersama model
+    encoder : CategoricalEncoder atau None
+        Encoder kategorikal hasil training. Jika None (model lama), encoding
+        di-fit ulang pada batch ini.
+    imputer : MissingValueImputer atau None
+        Imputer hasil training. Jika None (model lama), missing value diisi
+        oleh pipeline model.
+    """
+    df = _encode_for_prediction(df, encoder, imputer)
+    schema = _resolve_schema(schema, reference_data_path)
+    return _align_for_prediction(df, schema, exclude_target)
 
 
-def predict_mortality(new_data, model_path='models/mortality_model'):
+@instrumented()
+def predict_mortality(new_data, model_path='models/mortality_model', verbose=False):
     """
     Prediksi mortalitas untuk data baru
     
@@ -99,75 +223,72 @@ def predict_mortality(new_data, model_path='models/mortality_model'):
         Data baru untuk prediksi atau path ke file data
     model_path : str
         Path ke model yang sudah disimpan
+    verbose : bool
+        Jika True, progres dan contoh hasil ditampilkan ke stdout. Jika False,
+        output mengikuti konfigurasi logger `pneumonia` (default diam).
     
     Returns:
     --------
     predictions : pd.DataFrame
         Data dengan kolom prediksi
     """
-    
-    print("=" * 60)
-    print("PREDIKSI MORTALITAS")
-    print("=" * 60)
-    
-    # Load data
-    if isinstance(new_data, str):
-        if new_data.endswith('.xlsx') or new_data.endswith('.xls'):
-            df = pd.read_excel(new_data)
-        else:
-            df = pd.read_csv(new_data)
-    else:
-        df = new_data.copy()
-    
-    print(f"\nData shape sebelum preprocessing: {df.shape}")
-    
-    # Preprocess data agar formatnya sama dengan data training
-    # Untuk prediksi mortalitas, kita perlu semua kolom termasuk LOS_days
-    df = preprocess_data_for_prediction(df, exclude_target='Mortality')
-    
-    print(f"Data shape setelah preprocessing: {df.shape}")
-    
-    # Load model - handle relative path
-    if not os.path.isabs(model_path):
-        # Jika path relatif, coba dari current dir atau dari project root
-        if not os.path.exists(model_path):
-            # Coba dengan path dari project root
-            project_root = os.path.dirname(os.path.dirname(__file__))
-            model_path = os.path.join(project_root, model_path)
-    
-    print(f"\nLoading model dari: {model_path}")
-    try:
-        model = load_model(model_path)
-        print("Model berhasil dimuat!")
-    except Exception as e:
-        print(f"Error loading model: {str(e)}")
-        return None
-    
-    # Predict
-    print("\nMelakukan prediksi...")
-    predictions = predict_model(model, data=df)
-    
-    print("\nPrediksi selesai!")
-    print(f"\nHasil prediksi:")
-    # PyCaret menggunakan 'prediction_label' dan 'prediction_score'
-    if 'prediction_label' in predictions.columns:
-        if 'prediction_score' in predictions.columns:
-            print(predictions[['prediction_label', 'prediction_score']].head(10))
+    with verbose_logging(verbose):
+        logger.info("=" * 60)
+        logger.info("PREDIKSI MORTALITAS")
+        logger.info("=" * 60)
+        
+        # Load data
+        df = _load_input(new_data)
+        
+        logger.info("\nData shape sebelum preprocessing: %s", df.shape)
+        
+        # Load model dari registry (hanya dimuat dari disk sekali per proses)
+        logger.info("\nLoading model dari: %s", model_path)
+        try:
+            model, schema, encoder, imputer = _model_artifacts(model_path, _load_classifier)
+            logger.info("Model berhasil dimuat!")
+        except Exception as e:
+            logger.error("Error loading model: %s", e)
+            return None
+        
+        # Preprocess data agar formatnya sama dengan data training
+        # Untuk prediksi mortalitas, kita perlu semua kolom termasuk LOS_days
+        df = preprocess_data_for_prediction(df, exclude_target='Mortality', schema=schema,
+                                            encoder=encoder, imputer=imputer)
+        
+        logger.info("Data shape setelah preprocessing: %s", df.shape)
+        
+        # Predict
+        logger.info("\nMelakukan prediksi...")
+        if isinstance(model, InferenceBundle):
+            predictions = _score_pipeline(model, df, classification=True)
         else:
-            print(predictions['prediction_label'].head(10))
-    elif 'Label' in predictions.columns:
-        if 'Score' in predictions.columns:
-            print(predictions[['Label', 'Score']].head(10))
-        else:
-            print(predictions['Label'].head(10))
-    else:
-        # Tampilkan beberapa kolom terakhir (biasanya prediksi ada di kolom terakhir)
-        print(predictions.iloc[:, -3:].head(10))
-    
-    return predictions
+            from pycaret.classification import predict_model
+            predictions = predict_model(model, data=df, verbose=logger.isEnabledFor(logging.INFO))
+        
+        logger.info("\nPrediksi selesai!")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\nHasil prediksi:")
+            # PyCaret menggunakan 'prediction_label' dan 'prediction_score'
+            if 'prediction_label' in predictions.columns:
+                if 'prediction_score' in predictions.columns:
+                    logger.info(predictions[['prediction_label', 'prediction_score']].head(10))
+                else:
+                    logger.info(predictions['prediction_label'].head(10))
+            elif 'Label' in predictions.columns:
+                if 'Score' in predictions.columns:
+                    logger.info(predictions[['Label', 'Score']].head(10))
+                else:
+                    logger.info(predictions['Label'].head(10))
+            else:
+                # Tampilkan beberapa kolom terakhir (biasanya prediksi ada di kolom terakhir)
+                logger.info(predictions.iloc[:, -3:].head(10))
+        
+        return predictions
 
 
-def predict_los(new_data, model_path='models/los_model'):
+@instrumented()
+def predict_los(new_data, model_path='models/los_model', verbose=False):
     """
     Prediksi Length of Stay untuk data baru
     
@@ -177,112 +298,202 @@ def predict_los(new_data, model_path='models/los_model'):
         Data baru untuk prediksi atau path ke file data
     model_path : str
         Path ke model yang sudah disimpan
+    verbose : bool
+        Jika True, progres dan ringkasan hasil ditampilkan ke stdout. Jika
+        False, output mengikuti konfigurasi logger `pneumonia` (default diam).
     
     Returns:
     --------
     predictions : pd.DataFrame
         Data dengan kolom prediksi LOS
     """
-    
-    print("=" * 60)
-    print("PREDIKSI LENGTH OF STAY (LOS)")
-    print("=" * 60)
-    
-    # Load data
-    if isinstance(new_data, str):
-        if new_data.endswith('.xlsx') or new_data.endswith('.xls'):
-            df = pd.read_excel(new_data)
+    with verbose_logging(verbose):
+        logger.info("=" * 60)
+        logger.info("PREDIKSI LENGTH OF STAY (LOS)")
+        logger.info("=" * 60)
+        
+        # Load data
+        df = _load_input(new_data)
+        
+        logger.info("\nData shape sebelum preprocessing: %s", df.shape)
+        
+        # Load model dari registry (hanya dimuat dari disk sekali per proses)
+        logger.info("\nLoading model dari: %s", model_path)
+        try:
+            model, schema, encoder, imputer = _model_artifacts(model_path, _load_regressor)
+            logger.info("Model berhasil dimuat!")
+        except Exception as e:
+            logger.error("Error loading model: %s", e)
+            return None
+        
+        # Preprocess data agar formatnya sama dengan data training
+        # Untuk prediksi LOS, kita perlu semua kolom termasuk Mortality
+        df = preprocess_data_for_prediction(df, exclude_target='LOS_days', schema=schema,
+                                            encoder=encoder, imputer=imputer)
+        
+        logger.info("Data shape setelah preprocessing: %s", df.shape)
+        
+        # Predict
+        logger.info("\nMelakukan prediksi...")
+        if isinstance(model, InferenceBundle):
+            predictions = _score_pipeline(model, df, classification=False)
         else:
-            df = pd.read_csv(new_data)
-    else:
-        df = new_data.copy()
+            from pycaret.regression import predict_model
+            predictions = predict_model(model, data=df, verbose=logger.isEnabledFor(logging.INFO))
+        
+        logger.info("\nPrediksi selesai!")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\nHasil prediksi LOS:")
+            # PyCaret menggunakan 'prediction_label' untuk regresi
+            if 'prediction_label' in predictions.columns:
+                pred_col = 'prediction_label'
+            elif 'Label' in predictions.columns:
+                pred_col = 'Label'
+            else:
+                # Gunakan kolom terakhir
+                pred_col = predictions.columns[-1]
+            logger.info(predictions[pred_col].describe())
+            logger.info("\nContoh prediksi:")
+            logger.info(predictions[[pred_col]].head(10))
+        
+        return predictions
+
+
+def warm_up_models(mortality_model='models/mortality_model', los_model='models/los_model'):
+    """
+    Muat model mortalitas dan LOS ke registry sebelum prediksi pertama
     
-    print(f"\nData shape sebelum preprocessing: {df.shape}")
+    Parameters:
+    -----------
+    mortality_model : str atau None
+        Path ke model mortalitas
+    los_model : str atau None
+        Path ke model LOS
+    """
+    if mortality_model:
+        default_registry.get(_artifact_path(mortality_model), _load_classifier)
+    if los_model:
+        default_registry.get(_artifact_path(los_model), _load_regressor)
+    return default_registry.stats()
+
+
+def evict_models(model_path=None):
+    """
+    Hapus model dari registry agar dimuat ulang pada prediksi berikutnya
     
-    # Preprocess data agar formatnya sama dengan data training
-    # Untuk prediksi LOS, kita perlu semua kolom termasuk Mortality
-    df = preprocess_data_for_prediction(df, exclude_target='LOS_days')
+    Semua artefak model (.pkl, inference bundle dan file pohon bersama)
+    dihapus, karena registry menyimpan model dengan path artefak yang dimuat.
     
-    print(f"Data shape setelah preprocessing: {df.shape}")
+    Parameters:
+    -----------
+    model_path : str atau None
+        Path model yang dihapus (tanpa ekstensi, atau path salah satu
+        artefaknya). Jika None, semua model dihapus.
     
-    # Load model - handle relative path
-    if not os.path.isabs(model_path):
-        # Jika path relatif, coba dari current dir atau dari project root
-        if not os.path.exists(model_path):
-            # Coba dengan path dari project root
-            project_root = os.path.dirname(os.path.dirname(__file__))
-            model_path = os.path.join(project_root, model_path)
+    Returns:
+    --------
+    n_evicted : int
+        Jumlah entri registry yang dihapus
+    """
+    if model_path is None:
+        return default_registry.evict()
+    model_path = model_path_for_trees(model_path_for_bundle(model_path))
+    return sum(default_registry.evict(path)
+               for path in (model_path, bundle_path_for(model_path), trees_path_for(model_path)))
+
+
+def model_registry_stats():
+    """Statistik registry model (hits, misses, reloads, evictions)"""
+    return default_registry.stats()
+
+
+@instrumented()
+def _score_pipeline(model, X, classification):
+    """
+    Prediksi langsung lewat pipeline final PyCaret atau inference bundle
     
-    print(f"\nLoading model dari: {model_path}")
-    try:
-        model = load_reg_model(model_path)
-        print("Model berhasil dimuat!")
-    except Exception as e:
-        print(f"Error loading model: {str(e)}")
-        return None
-    
-    # Predict
-    print("\nMelakukan prediksi...")
-    predictions = predict_reg_model(model, data=df)
-    
-    print("\nPrediksi selesai!")
-    print(f"\nHasil prediksi LOS:")
-    # PyCaret menggunakan 'prediction_label' untuk regresi
-    if 'prediction_label' in predictions.columns:
-        print(predictions['prediction_label'].describe())
-        print(f"\nContoh prediksi:")
-        print(predictions[['prediction_label']].head(10))
-    elif 'Label' in predictions.columns:
-        print(predictions['Label'].describe())
-        print(f"\nContoh prediksi:")
-        print(predictions[['Label']].head(10))
+    Hasilnya sama dengan `predict_model` (kolom `prediction_label` dan, untuk
+    klasifikasi, `prediction_score` = probabilitas kelas terpilih dibulatkan 4
+    desimal), tanpa overhead validasi dan display `predict_model` per panggilan.
+    Jika pipeline tidak bisa dipanggil langsung, fallback ke `predict_model`.
+    """
+    if isinstance(model, InferenceBundle):
+        label, score = model.predict_with_score(X)
     else:
-        # Gunakan kolom terakhir
-        pred_col = predictions.columns[-1]
-        print(predictions[pred_col].describe())
-        print(f"\nContoh prediksi:")
-        print(predictions[[pred_col]].head(10))
-    
-    return predictions
+        try:
+            # Langkah transformasi pipeline dijalankan sekali untuk predict dan predict_proba
+            Xt = model[:-1].transform(X)
+            estimator = model.steps[-1][1]
+            label = estimator.predict(Xt)
+            if hasattr(model, '_memory_full_transform'):
+                # Pipeline PyCaret: kembalikan label ke nilai target asli
+                label = model.inverse_transform(label)
+            if classification:
+                score = estimator.predict_proba(Xt).max(axis=1).round(4)
+        except Exception:
+            if classification:
+                from pycaret.classification import predict_model
+            else:
+                from pycaret.regression import predict_model
+            return predict_model(model, data=X, verbose=False)
+    
+    result = X.copy()
+    if classification:
+        try:
+            label = label.astype(int)
+        except (TypeError, ValueError):
+            pass
+        result['prediction_label'] = label
+        result['prediction_score'] = score
+    else:
+        result['prediction_label'] = np.nan_to_num(label)
+    return result
 
 
-def predict_both(new_data, mortality_model='models/mortality_model', 
-                 los_model='models/los_model'):
+def _same_artifact(a, b):
+    """True jika dua encoder/imputer menghasilkan transformasi yang sama"""
+    if a is b:
+        return True
+    if a is None or b is None:
+        return False
+    return a.to_dict() == b.to_dict()
+
+
+@instrumented()
+def _prepare_both(df, mortality_artifacts, los_artifacts):
     """
-    Prediksi mortalitas dan LOS sekaligus
+    Preprocessing bersama untuk model mortalitas dan LOS
     
     Parameters:
     -----------
-    new_data : pd.DataFrame atau str
-        Data baru untuk prediksi
-    mortality_model : str
-        Path ke model mortalitas
-    los_model : str
-        Path ke model LOS
+    mortality_artifacts, los_artifacts : tuple
+        (skema, encoder, imputer) masing-masing model
     
     Returns:
     --------
-    results : pd.DataFrame
-        Data dengan prediksi mortalitas dan LOS
+    X_mortality, X_los : pd.DataFrame
+        Matriks fitur yang sudah di-align untuk masing-masing model
     """
-    
-    print("=" * 60)
-    print("PREDIKSI MORTALITAS DAN LENGTH OF STAY")
-    print("=" * 60)
-    
-    # Prediksi mortalitas
-    print("\n1. Prediksi Mortalitas...")
-    mortality_pred = predict_mortality(new_data, mortality_model)
-    
-    # Prediksi LOS
-    print("\n2. Prediksi Length of Stay...")
-    los_pred = predict_los(new_data, los_model)
-    
-    if mortality_pred is None or los_pred is None:
-        print("\nError: Gagal melakukan prediksi")
-        return None
-    
-    # Combine results
+    mortality_schema, mortality_encoder, mortality_imputer = mortality_artifacts
+    los_schema, los_encoder, los_imputer = los_artifacts
+    # Imputasi + encoding sekali; diulang hanya jika kedua model memakai
+    # encoder atau imputer berbeda
+    encoded = _encode_for_prediction(df, mortality_encoder, mortality_imputer)
+    if _same_artifact(mortality_encoder, los_encoder) and _same_artifact(mortality_imputer, los_imputer):
+        los_encoded = encoded
+    else:
+        los_encoded = _encode_for_prediction(df, los_encoder, los_imputer)
+    
+    # Setiap model butuh matriks sendiri (tanpa target-nya); tanpa copy-on-write
+    # pandas tidak bisa membuat subset kolom sebagai view dari blok yang sama,
+    # jadi align langsung per model (satu reindex = satu salinan per model)
+    X_mortality = _align_for_prediction(encoded, _resolve_schema(mortality_schema), exclude_target='Mortality')
+    X_los = _align_for_prediction(los_encoded, _resolve_schema(los_schema), exclude_target='LOS_days')
+    return X_mortality, X_los
+
+
+def _combine_predictions(mortality_pred, los_pred):
+    """Gabungkan hasil prediksi mortalitas dan LOS ke satu DataFrame"""
     results = mortality_pred.copy()
     
     # Ambil prediksi LOS (PyCaret menggunakan 'prediction_label')
@@ -314,25 +525,328 @@ def predict_both(new_data, mortality_model='models/mortality_model',
             last_col = results.columns[-1]
             results.rename(columns={last_col: 'Predicted_Mortality'}, inplace=True)
     
-    # Pastikan kolom yang ditampilkan ada
-    display_cols = []
-    if 'Predicted_Mortality' in results.columns:
-        display_cols.append('Predicted_Mortality')
-    if 'Mortality_Probability' in results.columns or 'Score' in results.columns:
-        prob_col = 'Mortality_Probability' if 'Mortality_Probability' in results.columns else 'Score'
-        display_cols.append(prob_col)
-    if 'Predicted_LOS' in results.columns:
-        display_cols.append('Predicted_LOS')
-    
-    print("\n" + "=" * 60)
-    print("HASIL PREDIKSI GABUNGAN")
-    print("=" * 60)
-    if display_cols:
-        print(results[display_cols].head(10))
+    return results
+
+
+@instrumented()
+def predict_both(new_data, mortality_model='models/mortality_model', 
+                 los_model='models/los_model', verbose=False):
+    """
+    Prediksi mortalitas dan LOS sekaligus
+    
+    Parameters:
+    -----------
+    new_data : pd.DataFrame atau str
+        Data baru untuk prediksi
+    mortality_model : str
+        Path ke model mortalitas
+    los_model : str
+        Path ke model LOS
+    verbose : bool
+        Jika True, progres dan contoh hasil ditampilkan ke stdout. Jika False,
+        output mengikuti konfigurasi logger `pneumonia` (default diam).
+    
+    Returns:
+    --------
+    results : pd.DataFrame
+        Data dengan prediksi mortalitas dan LOS
+    """
+    with verbose_logging(verbose):
+        logger.info("=" * 60)
+        logger.info("PREDIKSI MORTALITAS DAN LENGTH OF STAY")
+        logger.info("=" * 60)
+        
+        # Load data sekali untuk kedua model
+        df = _load_input(new_data)
+        logger.info("\nData shape sebelum preprocessing: %s", df.shape)
+        
+        try:
+            mortality_clf, *mortality_artifacts = _model_artifacts(mortality_model, _load_classifier)
+            los_reg, *los_artifacts = _model_artifacts(los_model, _load_regressor)
+            logger.info("Model mortalitas dan LOS berhasil dimuat!")
+        except Exception as e:
+            logger.error("Error loading model: %s", e)
+            logger.error("\nError: Gagal melakukan prediksi")
+            return None
+        
+        X_mortality, X_los = _prepare_both(df, mortality_artifacts, los_artifacts)
+        logger.info("Data shape setelah preprocessing: %s", X_mortality.shape)
+        
+        # Prediksi mortalitas
+        logger.info("\n1. Prediksi Mortalitas...")
+        mortality_pred = _score_pipeline(mortality_clf, X_mortality, classification=True)
+        
+        # Prediksi LOS
+        logger.info("\n2. Prediksi Length of Stay...")
+        los_pred = _score_pipeline(los_reg, X_los, classification=False)
+        
+        # Combine results
+        results = _combine_predictions(mortality_pred, los_pred)
+        
+        if logger.isEnabledFor(logging.INFO):
+            # Pastikan kolom yang ditampilkan ada
+            display_cols = []
+            if 'Predicted_Mortality' in results.columns:
+                display_cols.append('Predicted_Mortality')
+            if 'Mortality_Probability' in results.columns or 'Score' in results.columns:
+                prob_col = 'Mortality_Probability' if 'Mortality_Probability' in results.columns else 'Score'
+                display_cols.append(prob_col)
+            if 'Predicted_LOS' in results.columns:
+                display_cols.append('Predicted_LOS')
+            
+            logger.info("\n" + "=" * 60)
+            logger.info("HASIL PREDIKSI GABUNGAN")
+            logger.info("=" * 60)
+            if display_cols:
+                logger.info(results[display_cols].head(10))
+            else:
+                logger.info(results.head(10))
+        
+        return results
+
+
+@instrumented()
+def score_frame(df, task='both', mortality_model='models/mortality_model', los_model='models/los_model'):
+    """
+    Prediksi ringkas untuk service dan batch scoring
+    
+    Memakai model, skema, encoder dan imputer dari registry, tanpa mencetak tabel hasil.
+    
+    Parameters:
+    -----------
+    df : pd.DataFrame
+        Data pasien (format mentah seperti input predict_both)
+    task : str
+        'mortality', 'los' atau 'both'
+    mortality_model : str
+        Path ke model mortalitas
+    los_model : str
+        Path ke model LOS
+    
+    Returns:
+    --------
+    predictions : pd.DataFrame
+        Hanya kolom prediksi (Predicted_Mortality, Mortality_Probability,
+        Predicted_LOS sesuai task) dengan index yang sama dengan `df`
+    """
+    if task == 'both':
+        mortality_clf, *mortality_artifacts = _model_artifacts(mortality_model, _load_classifier)
+        los_reg, *los_artifacts = _model_artifacts(los_model, _load_regressor)
+        X_mortality, X_los = _prepare_both(df, mortality_artifacts, los_artifacts)
+        results = _combine_predictions(
+            _score_pipeline(mortality_clf, X_mortality, classification=True),
+            _score_pipeline(los_reg, X_los, classification=False)
+        )
+    elif task == 'mortality':
+        model, schema, encoder, imputer = _model_artifacts(mortality_model, _load_classifier)
+        X = _align_for_prediction(_encode_for_prediction(df, encoder, imputer), _resolve_schema(schema),
+                                  'Mortality')
+        results = _score_pipeline(model, X, classification=True).rename(columns={
+            'prediction_label': 'Predicted_Mortality', 'prediction_score': 'Mortality_Probability'
+        })
+    elif task == 'los':
+        model, schema, encoder, imputer = _model_artifacts(los_model, _load_regressor)
+        X = _align_for_prediction(_encode_for_prediction(df, encoder, imputer), _resolve_schema(schema),
+                                  'LOS_days')
+        results = _score_pipeline(model, X, classification=False).rename(columns={
+            'prediction_label': 'Predicted_LOS'
+        })
     else:
-        print(results.head(10))
+        raise ValueError("task harus 'mortality', 'los' atau 'both'")
     
-    return results
+    return results[[c for c in PREDICTION_COLUMNS if c in results.columns]]
+
+
+def _iter_input_chunks(input_path, chunk_size):
+    """
+    Baca file input per chunk sehingga memori tetap terbatas
+    
+    CSV dibaca dengan `pd.read_csv(chunksize=...)`, Parquet per record batch,
+    Feather per potongan tabel yang di-memory map, dan Excel (.xlsx) lewat
+    mode read-only openpyxl baris demi baris.
+    """
+    if input_path.endswith('.csv'):
+        for chunk in pd.read_csv(input_path, chunksize=chunk_size):
+            yield chunk
+    elif input_path.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        offset = 0
+        for batch in pq.ParquetFile(input_path).iter_batches(batch_size=chunk_size):
+            chunk = batch.to_pandas()
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+    elif input_path.endswith('.feather'):
+        import pyarrow.feather as feather
+        table = feather.read_table(input_path, memory_map=True)
+        for offset in range(0, table.num_rows, chunk_size):
+            chunk = table.slice(offset, chunk_size).to_pandas()
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            yield chunk
+    elif input_path.endswith('.xlsx'):
+        from openpyxl import load_workbook
+        workbook = load_workbook(input_path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = list(next(rows))
+            buffer, offset = [], 0
+            for row in rows:
+                buffer.append(row)
+                if len(buffer) == chunk_size:
+                    yield _rows_to_frame(buffer, header, offset)
+                    offset += len(buffer)
+                    buffer = []
+            if buffer:
+                yield _rows_to_frame(buffer, header, offset)
+        finally:
+            workbook.close()
+    else:
+        raise ValueError("Format file tidak didukung untuk streaming. Gunakan .csv, .parquet, .feather atau .xlsx")
+
+
+def _rows_to_frame(rows, header, offset):
+    """Bangun DataFrame chunk dari baris Excel (tipe data diinfer seperti read_excel)"""
+    chunk = pd.DataFrame(rows, columns=header, index=pd.RangeIndex(offset, offset + len(rows)))
+    return chunk.infer_objects()
+
+
+class _ChunkWriter:
+    """
+    Tulis hasil prediksi per chunk secara incremental ke CSV atau Parquet
+    
+    Skema Parquet ditetapkan oleh chunk pertama. Kolom object dan kolom yang
+    seluruhnya kosong di chunk itu (tipenya belum bisa diketahui, mis. CSV
+    yang menginfer float) ditulis sebagai string, dan di setiap chunk
+    kolom-kolom tersebut dikonversi ke string sebelum ditulis.
+    """
+    
+    def __init__(self, output_path):
+        if not output_path.endswith(('.csv', '.parquet')):
+            raise ValueError("Format output tidak didukung. Gunakan .csv atau .parquet")
+        self.output_path = output_path
+        self._parquet_writer = None
+        self._schema = None
+        self._string_columns = []
+        self._first = True
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+    
+    def write(self, df):
+        if self.output_path.endswith('.csv'):
+            df.to_csv(self.output_path, mode='w' if self._first else 'a', header=self._first, index=False)
+        else:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            if self._parquet_writer is None:
+                self._string_columns = [col for col in df.columns
+                                        if df[col].dtype == object or df[col].isna().all()]
+            strings = {col: df[col].astype('string') for col in self._string_columns
+                       if col in df.columns and not isinstance(df[col].dtype, pd.StringDtype)}
+            if strings:
+                df = df.assign(**strings)
+            table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+            if self._parquet_writer is None:
+                self._schema = table.schema
+                self._parquet_writer = pq.ParquetWriter(self.output_path, self._schema)
+            self._parquet_writer.write_table(table)
+        self._first = False
+    
+    def close(self):
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+
+
+@instrumented()
+def predict_stream(input_path, output_path, chunk_size=50_000,
+                   mortality_model='models/mortality_model', los_model='models/los_model',
+                   include_input=False, verbose=False, workers=1):
+    """
+    Prediksi mortalitas dan LOS secara streaming untuk file pasien yang besar
+    
+    Input dibaca per chunk, setiap chunk di-preprocess dan diprediksi, lalu
+    hasilnya langsung ditambahkan ke file output. Memori yang dipakai
+    sebanding dengan `chunk_size`, bukan ukuran file. Dengan `workers` > 1
+    setiap chunk dibagi ke process pool (lihat modul sharded_scoring).
+    
+    Parameters:
+    -----------
+    input_path : str
+        File data pasien (.csv, .parquet, .feather atau .xlsx)
+    output_path : str
+        File hasil prediksi (.csv atau .parquet)
+    chunk_size : int
+        Jumlah baris per chunk
+    mortality_model : str
+        Path ke model mortalitas
+    los_model : str
+        Path ke model LOS
+    include_input : bool
+        Jika True, semua kolom input ikut ditulis. Jika False, hanya
+        Patient_ID (jika ada) dan kolom prediksi.
+    verbose : bool
+        Jika True, progres per chunk ditampilkan ke stdout. Jika False, output
+        mengikuti konfigurasi logger `pneumonia` (default diam).
+    workers : int atau None
+        Jumlah proses worker untuk scoring (1: di proses ini, None: semua core).
+        Setiap worker memuat model sekali untuk semua chunk.
+    
+    Returns:
+    --------
+    summary : dict
+        Jumlah baris, jumlah chunk, durasi (detik), jumlah worker dan path output
+    """
+    with verbose_logging(verbose):
+        logger.info("=" * 60)
+        logger.info("PREDIKSI STREAMING MORTALITAS DAN LENGTH OF STAY")
+        logger.info("=" * 60)
+        logger.info("Input: %s", input_path)
+        logger.info("Output: %s", output_path)
+        logger.info("Chunk size: %d", chunk_size)
+        
+        if workers == 1:
+            # Muat model sebelum chunk pertama dibaca
+            warm_up_models(mortality_model, los_model)
+            scorer = None
+        else:
+            from sharded_scoring import ShardedScorer
+            scorer = ShardedScorer(workers, task='both', mortality_model=mortality_model, los_model=los_model)
+            logger.info("Workers: %d", scorer.n_workers)
+        
+        start = time.perf_counter()
+        n_rows = 0
+        n_chunks = 0
+        writer = _ChunkWriter(output_path)
+        try:
+            for chunk in _iter_input_chunks(input_path, chunk_size):
+                if scorer is None:
+                    predictions = score_frame(chunk, task='both', mortality_model=mortality_model,
+                                              los_model=los_model)
+                else:
+                    predictions = scorer.score(chunk)
+                
+                if include_input:
+                    output = pd.concat([chunk, predictions], axis=1)
+                elif 'Patient_ID' in chunk.columns:
+                    output = pd.concat([chunk[['Patient_ID']], predictions], axis=1)
+                else:
+                    output = predictions
+                writer.write(output)
+                
+                n_rows += len(chunk)
+                n_chunks += 1
+                logger.info("   Chunk %d: %d baris diprediksi", n_chunks, n_rows)
+        finally:
+            writer.close()
+            if scorer is not None:
+                scorer.close()
+        
+        elapsed = time.perf_counter() - start
+        logger.info("\nPrediksi streaming selesai: %d baris dalam %.2f detik", n_rows, elapsed)
+        logger.info("Hasil prediksi disimpan ke: %s", output_path)
+        return {'rows': n_rows, 'chunks': n_chunks, 'seconds': elapsed,
+                'workers': 1 if scorer is None else scorer.n_workers, 'output_path': output_path}
 
 
 if __name__ == "__main__":
@@ -370,7 +884,7 @@ if __name__ == "__main__":
     })
     
     # Prediksi
-    results = predict_both(sample_data)
+    results = predict_both(sample_data, verbose=True)
     
     if results is not None:
         # Save results - pastikan folder ada
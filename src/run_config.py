@@ -0,0 +1,219 @@
+"""
+Konfigurasi Run untuk Project Prediksi Pneumonia
+RunConfig bertipe dibaca dari config.py di project root, lalu di-override oleh
+environment (`PNEUMONIA_<NAMA>`) dan argumen CLI, dengan urutan prioritas:
+default < config.py < environment < CLI
+"""
+
+import os
+import typing
+import importlib.util
+from dataclasses import dataclass, field, fields, replace, asdict
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CONFIG_PATH = os.path.join(PROJECT_ROOT, 'config.py')
+ENV_PREFIX = 'PNEUMONIA_'
+
+MISSING_VALUE_STRATEGIES = ('mean', 'median', 'mode', 'drop')
+EXCEL_ENGINES = ('auto', 'openpyxl', 'calamine')
+EDA_MODES = ('auto', 'full', 'profile', 'skip')
+
+
+@dataclass
+class RunConfig:
+    """
+    Konfigurasi seluruh pipeline: path, target, setup PyCaret, CV, tuning,
+    paralelisme dan preprocessing
+
+    Nama field = nama variabel di config.py dalam huruf kecil
+    (mis. `TUNING_N_ITER` -> `tuning_n_iter`).
+    """
+
+    # Path
+    raw_data_path: str = 'data/data-669-patients.xlsx'
+    processed_data_path: str = 'data/processed_pneumonia_data.csv'
+    mortality_model_path: str = 'models/mortality_model'
+    mortality_et_model_path: str = 'models/mortality_et_model'
+    los_model_path: str = 'models/los_model'
+    los_et_model_path: str = 'models/los_et_model'
+    results_path: str = 'results/predictions.csv'
+
+    # Target
+    mortality_target_col: str = 'Mortality'
+    los_target_col: str = 'LOS_days'
+
+    # Setup PyCaret
+    test_size: float = 0.2
+    random_seed: int = 123
+    normalize: bool = True
+    feature_selection: bool = True
+    remove_multicollinearity: bool = True
+    multicollinearity_threshold: float = 0.95
+    ignore_low_variance: bool = False
+
+    # Cross-validation dan paralelisme
+    cv_folds: int = 10
+    n_jobs: typing.Optional[int] = None
+    parallel_training: bool = False
+    leaderboard_cache: bool = True
+
+    # Model yang dibandingkan dan tuning
+    classification_models: typing.List[str] = field(
+        default_factory=lambda: ['lightgbm', 'xgboost', 'rf', 'et', 'gbc', 'ada', 'dt'])
+    regression_models: typing.List[str] = field(
+        default_factory=lambda: ['lightgbm', 'xgboost', 'rf', 'et', 'gbr', 'ada', 'dt'])
+    tuning_n_iter: int = 50
+    tuning_engine: str = 'random'
+    mortality_optimize: str = 'Accuracy'
+    los_optimize: str = 'RMSE'
+
+    # Preprocessing
+    missing_value_strategy: str = 'mean'
+    optimize_dtypes: bool = True
+    eda_mode: str = 'auto'
+    eda_sample_size: int = 10_000
+    incremental_preprocessing: bool = False
+
+    # Ingest data mentah
+    ingest_cache: bool = True
+    excel_engine: str = 'auto'
+
+    # Prediksi
+    scoring_workers: typing.Optional[int] = 1
+
+    def __post_init__(self):
+        if not 0 < self.test_size < 1:
+            raise ValueError(f"test_size harus di antara 0 dan 1, bukan {self.test_size}")
+        if self.cv_folds < 2:
+            raise ValueError(f"cv_folds minimal 2, bukan {self.cv_folds}")
+        if self.missing_value_strategy not in MISSING_VALUE_STRATEGIES:
+            raise ValueError(f"missing_value_strategy harus salah satu dari {MISSING_VALUE_STRATEGIES}")
+        if self.excel_engine not in EXCEL_ENGINES:
+            raise ValueError(f"excel_engine harus salah satu dari {EXCEL_ENGINES}")
+        if self.eda_mode not in EDA_MODES:
+            raise ValueError(f"eda_mode harus salah satu dari {EDA_MODES}")
+        if self.scoring_workers is not None and self.scoring_workers < 1:
+            raise ValueError(f"scoring_workers minimal 1, bukan {self.scoring_workers}")
+
+    @classmethod
+    def from_module(cls, module):
+        """Bangun RunConfig dari modul konfigurasi (variabel huruf besar)"""
+        values = {f.name: getattr(module, f.name.upper()) for f in fields(cls)
+                  if hasattr(module, f.name.upper())}
+        return cls().with_overrides(values)
+
+    def with_overrides(self, overrides):
+        """
+        Salinan config dengan nilai yang di-override
+
+        Parameters:
+        -----------
+        overrides : dict
+            Nama field -> nilai. Nilai string dikonversi ke tipe field
+            (mis. '4' -> 4, 'false' -> False, 'rf,et' -> ['rf', 'et']).
+
+        Raises:
+        -------
+        ValueError
+            Jika ada nama field yang tidak dikenal
+        """
+        types = typing.get_type_hints(type(self))
+        unknown = set(overrides) - set(types)
+        if unknown:
+            raise ValueError(f"Field konfigurasi tidak dikenal: {', '.join(sorted(unknown))}")
+        return replace(self, **{name: _coerce(value, types[name]) for name, value in overrides.items()})
+
+    def to_dict(self):
+        """Isi config sebagai dict"""
+        return asdict(self)
+
+    def setup_params(self):
+        """Parameter `setup()` PyCaret dari config (tanpa data/target)"""
+        params = {
+            'normalize': self.normalize,
+            'feature_selection': self.feature_selection,
+            'remove_multicollinearity': self.remove_multicollinearity,
+            'multicollinearity_threshold': self.multicollinearity_threshold,
+            'fold': self.cv_folds,
+        }
+        if self.ignore_low_variance:
+            params['low_variance_threshold'] = 0
+        if self.n_jobs is not None:
+            params['n_jobs'] = self.n_jobs
+        return params
+
+    def project_path(self, path):
+        """Path relatif di config diartikan relatif terhadap project root"""
+        return path if os.path.isabs(path) else os.path.join(PROJECT_ROOT, path)
+
+
+def _coerce(value, annotation):
+    """Konversi nilai (umumnya string dari env/CLI) ke tipe field"""
+    if typing.get_origin(annotation) is typing.Union:
+        if value is None or (isinstance(value, str) and value.strip().lower() in ('', 'none', 'null')):
+            return None
+        annotation = next(arg for arg in typing.get_args(annotation) if arg is not type(None))
+    if typing.get_origin(annotation) is list:
+        if isinstance(value, str):
+            return [item.strip() for item in value.split(',') if item.strip()]
+        return list(value)
+    if annotation is bool and isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered not in ('1', 'true', 'yes', 'y', 'on', '0', 'false', 'no', 'n', 'off'):
+            raise ValueError(f"Nilai boolean tidak valid: {value!r}")
+        return lowered in ('1', 'true', 'yes', 'y', 'on')
+    return annotation(value)
+
+
+def env_overrides(environ=None):
+    """Override dari environment `PNEUMONIA_<NAMA_FIELD>` (variabel lain diabaikan)"""
+    environ = os.environ if environ is None else environ
+    names = {f.name for f in fields(RunConfig)}
+    return {key[len(ENV_PREFIX):].lower(): value for key, value in environ.items()
+            if key.startswith(ENV_PREFIX) and key[len(ENV_PREFIX):].lower() in names}
+
+
+def parse_assignments(assignments):
+    """Ubah list 'nama=nilai' (argumen CLI `--set`) menjadi dict override"""
+    overrides = {}
+    for assignment in assignments or []:
+        name, sep, value = assignment.partition('=')
+        if not sep:
+            raise ValueError(f"Format override harus nama=nilai, bukan {assignment!r}")
+        overrides[name.strip().lower()] = value.strip()
+    return overrides
+
+
+def load_config(config_path=None, environ=None, overrides=None):
+    """
+    Muat RunConfig: config.py, lalu environment, lalu override CLI
+
+    Parameters:
+    -----------
+    config_path : str atau None
+        Path file konfigurasi Python (default config.py di project root). Jika
+        file tidak ada, nilai default RunConfig dipakai.
+    environ : dict atau None
+        Environment untuk override `PNEUMONIA_*` (default os.environ)
+    overrides : dict atau None
+        Override CLI (nilai None diabaikan)
+
+    Returns:
+    --------
+    config : RunConfig
+    """
+    config_path = config_path or DEFAULT_CONFIG_PATH
+    if os.path.exists(config_path):
+        spec = importlib.util.spec_from_file_location('pneumonia_config', config_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        config = RunConfig.from_module(module)
+    elif config_path != DEFAULT_CONFIG_PATH:
+        raise FileNotFoundError(f"File konfigurasi tidak ditemukan: {config_path}")
+    else:
+        config = RunConfig()
+
+    config = config.with_overrides(env_overrides(environ))
+    cli = {name: value for name, value in (overrides or {}).items() if value is not None}
+    return config.with_overrides(cli)
@@ -0,0 +1,165 @@
+"""
+HTTP Scoring Service untuk Prediksi Pneumonia
+Server lokal yang memuat model sekali saat startup dan melayani prediksi
+mortalitas, LOS atau keduanya untuk satu pasien maupun batch
+
+Jalankan dari root project:
+    python main.py serve --port 8000
+"""
+
+import json
+import argparse
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from run_config import load_config
+
+# pandas, predict dan micro_batching diimpor saat server dibuat sehingga
+# `add_arguments` (dipakai parser main.py) tidak ikut memuat stack prediksi
+
+
+TASKS = ('mortality', 'los', 'both')
+
+
+def _parse_patients(payload):
+    """
+    Ubah body JSON menjadi list record pasien
+
+    Body bisa berupa satu objek pasien, list pasien, atau
+    `{"patients": [...]}`.
+    """
+    if isinstance(payload, dict) and 'patients' in payload:
+        payload = payload['patients']
+    if isinstance(payload, dict):
+        payload = [payload]
+    if not isinstance(payload, list) or not payload or not all(isinstance(p, dict) for p in payload):
+        raise ValueError("Body harus berisi objek pasien atau list pasien")
+    return payload
+
+
+class ScoringHandler(BaseHTTPRequestHandler):
+    """Handler HTTP: POST /predict/<mortality|los|both>, GET /health, GET /stats"""
+
+    batchers = {}
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        # Nonaktifkan log per request (mahal pada throughput tinggi)
+        pass
+
+    def _send_json(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        elif self.path == '/stats':
+            from predict import model_registry_stats
+            self._send_json(200, {
+                'registry': model_registry_stats(),
+                'batching': {task: batcher.metrics() for task, batcher in self.batchers.items()},
+            })
+        else:
+            self._send_json(404, {'error': f'Endpoint tidak ditemukan: {self.path}'})
+
+    def do_POST(self):
+        parts = self.path.strip('/').split('/')
+        if len(parts) != 2 or parts[0] != 'predict' or parts[1] not in TASKS:
+            self._send_json(404, {'error': f'Endpoint tidak ditemukan: {self.path}'})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            patients = _parse_patients(json.loads(self.rfile.read(length) or b'null'))
+        except ValueError as e:
+            self._send_json(400, {'error': str(e)})
+            return
+
+        import pandas as pd
+        try:
+            predictions = self.batchers[parts[1]].submit_threadsafe(pd.DataFrame(patients)).result()
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+            return
+
+        records = predictions.to_dict(orient='records')
+        for record, patient in zip(records, patients):
+            if 'Patient_ID' in patient:
+                record['Patient_ID'] = patient['Patient_ID']
+        self._send_json(200, {'predictions': records})
+
+
+class ScoringServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer dengan backlog koneksi yang cukup untuk banyak client"""
+    daemon_threads = True
+    request_queue_size = 256
+
+
+def create_server(host='127.0.0.1', port=8000, mortality_model='models/mortality_model',
+                  los_model='models/los_model', max_batch_size=64, max_wait_ms=5.0):
+    """
+    Buat HTTP server dengan model yang sudah dimuat
+
+    Parameters:
+    -----------
+    host, port : str, int
+        Alamat server
+    mortality_model, los_model : str
+        Path ke model mortalitas dan LOS
+    max_batch_size : int
+        Jumlah baris maksimum per micro-batch
+    max_wait_ms : float
+        Waktu tunggu maksimum (ms) untuk mengumpulkan micro-batch
+    """
+    from predict import score_frame, warm_up_models
+    from micro_batching import MicroBatcher
+
+    print("Memuat model...")
+    warm_up_models(mortality_model, los_model)
+    models = {'mortality_model': mortality_model, 'los_model': los_model}
+    ScoringHandler.batchers = {
+        task: MicroBatcher(partial(score_frame, task=task, **models), max_batch_size=max_batch_size,
+                           max_wait_ms=max_wait_ms, name=f'batch-{task}')
+        for task in TASKS
+    }
+    return ScoringServer((host, port), ScoringHandler)
+
+
+def serve(host='127.0.0.1', port=8000, **kwargs):
+    """Jalankan scoring service sampai dihentikan (Ctrl+C)"""
+    server = create_server(host, port, **kwargs)
+    print(f"Scoring service berjalan di http://{host}:{port}")
+    print("Endpoint: POST /predict/mortality, /predict/los, /predict/both; GET /health, /stats")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        for batcher in ScoringHandler.batchers.values():
+            batcher.stop()
+
+
+def add_arguments(parser):
+    """Tambahkan argumen CLI service ke parser"""
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--mortality-model', default=None, help='Default: path di config')
+    parser.add_argument('--los-model', default=None, help='Default: path di config')
+    parser.add_argument('--max-batch-size', type=int, default=64)
+    parser.add_argument('--max-wait-ms', type=float, default=5.0)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="HTTP scoring service prediksi pneumonia")
+    add_arguments(parser)
+    args = parser.parse_args()
+    config = load_config()
+    serve(args.host, args.port, mortality_model=args.mortality_model or config.mortality_model_path,
+          los_model=args.los_model or config.los_model_path,
+          max_batch_size=args.max_batch_size, max_wait_ms=args.max_wait_ms)
@@ -0,0 +1,264 @@
+"""
+Batch Scoring Ter-shard di Process Pool
+Input besar dibagi menjadi shard baris yang diprediksi paralel oleh worker
+proses. Setiap worker memuat model, skema, encoder dan imputer sekali saat
+start (initializer) lalu memakainya untuk semua shard. Data input ditulis
+sekali sebagai file Arrow IPC di shared memory; worker hanya menerima nama
+blok, offset dan jumlah baris, lalu membaca shard-nya langsung dari sana.
+Hasil (hanya kolom prediksi) digabung kembali sesuai urutan input.
+"""
+
+import os
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from parallel_training import split_n_jobs, _init_worker as _limit_native_threads
+
+# pandas/pyarrow/predict diimpor di dalam fungsi: modul ini diimpor worker
+# sebelum initializer membatasi thread native numpy/LightGBM
+
+
+# Di bawah jumlah baris ini per worker, overhead pool lebih besar dari hasilnya
+MIN_SHARD_ROWS = 2_000
+
+# State per proses worker (diisi initializer)
+_worker_models = {}
+
+
+def _init_scoring_worker(n_threads, task, mortality_model, los_model):
+    """Batasi thread native lalu muat model sekali untuk semua shard di worker ini"""
+    _limit_native_threads(n_threads)
+    from predict import warm_up_models
+    warm_up_models(mortality_model if task in ('mortality', 'both') else None,
+                   los_model if task in ('los', 'both') else None)
+    _worker_models.update(task=task, mortality_model=mortality_model, los_model=los_model)
+
+
+def _read_shard(shard):
+    """DataFrame shard: langsung (fallback pickle) atau slice tabel Arrow di shared memory"""
+    if not isinstance(shard, tuple):
+        return shard
+    import pyarrow as pa
+    from multiprocessing import shared_memory
+    name, size, offset, length = shard
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        table = pa.ipc.open_file(pa.py_buffer(block.buf[:size])).read_all()
+        # to_pandas menyalin kolom ke blok pandas sehingga shared memory bisa ditutup
+        df = table.slice(offset, length).to_pandas()
+        del table
+    finally:
+        block.close()
+    return df
+
+
+def _score_shard(shard):
+    """Prediksi satu shard di worker; kembalikan kolom prediksi dan durasi (detik)"""
+    from predict import score_frame
+    start = time.perf_counter()
+    df = _read_shard(shard)
+    predictions = score_frame(df, task=_worker_models['task'],
+                              mortality_model=_worker_models['mortality_model'],
+                              los_model=_worker_models['los_model'])
+    return predictions.reset_index(drop=True), time.perf_counter() - start
+
+
+def _shard_bounds(n_rows, n_shards):
+    """(offset, jumlah baris) untuk `n_shards` shard yang ukurannya hampir sama"""
+    size, extra = divmod(n_rows, n_shards)
+    bounds, offset = [], 0
+    for i in range(n_shards):
+        length = size + (1 if i < extra else 0)
+        if length:
+            bounds.append((offset, length))
+        offset += length
+    return bounds
+
+
+class _SharedTable:
+    """Tabel Arrow IPC (format file) yang ditulis sekali ke blok shared memory"""
+
+    def __init__(self, df):
+        import pyarrow as pa
+        from multiprocessing import shared_memory
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        # Ukuran hasil serialisasi dihitung dulu agar data ditulis langsung ke blok
+        mock = pa.MockOutputStream()
+        with pa.ipc.new_file(mock, table.schema) as writer:
+            writer.write_table(table)
+        self.size = mock.size()
+        self.block = shared_memory.SharedMemory(create=True, size=max(self.size, 1))
+        try:
+            sink = pa.FixedSizeBufferWriter(pa.py_buffer(self.block.buf))
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            sink.close()
+        except Exception:
+            self.close()
+            raise
+
+    def shard(self, offset, length):
+        return (self.block.name, self.size, offset, length)
+
+    def close(self):
+        self.block.close()
+        self.block.unlink()
+
+
+class ShardedScorer:
+    """
+    Process pool untuk batch scoring ter-shard
+
+    Worker (dan model di dalamnya) tetap hidup selama scorer dipakai, sehingga
+    memanggil `score` berulang kali (mis. per chunk `predict_stream`) tidak
+    memuat ulang model.
+
+    Contoh:
+        with ShardedScorer(n_workers=4) as scorer:
+            predictions = scorer.score(df)
+    """
+
+    def __init__(self, n_workers=None, task='both', mortality_model='models/mortality_model',
+                 los_model='models/los_model', min_shard_rows=MIN_SHARD_ROWS, shared_memory=True):
+        """
+        Initialize ShardedScorer
+
+        Parameters:
+        -----------
+        n_workers : int atau None
+            Jumlah proses worker (default semua core). Thread native
+            (OpenMP LightGBM, BLAS) per worker dibagi rata dari core yang ada.
+        task : str
+            'mortality', 'los' atau 'both'
+        mortality_model, los_model : str
+            Path model (seperti `score_frame`)
+        min_shard_rows : int
+            Jumlah baris minimal per shard; input yang lebih kecil memakai
+            lebih sedikit worker (atau diprediksi langsung di proses ini)
+        shared_memory : bool
+            Kirim shard lewat tabel Arrow di shared memory. False (atau
+            pyarrow tidak terpasang, atau data tidak bisa dikonversi ke Arrow):
+            shard DataFrame dikirim lewat pickle.
+        """
+        if task not in ('mortality', 'los', 'both'):
+            raise ValueError("task harus 'mortality', 'los' atau 'both'")
+        self.n_workers = max(1, n_workers or os.cpu_count() or 1)
+        self.task = task
+        self.mortality_model = mortality_model
+        self.los_model = los_model
+        self.min_shard_rows = max(1, min_shard_rows)
+        self.shared_memory = shared_memory
+        self.last_run = {}
+        self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            # spawn: worker mulai bersih, tanpa state OpenMP/thread dari proses induk
+            context = multiprocessing.get_context('spawn')
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.n_workers, mp_context=context, initializer=_init_scoring_worker,
+                initargs=(split_n_jobs(self.n_workers), self.task, self.mortality_model, self.los_model)
+            )
+        return self._pool
+
+    def _share(self, df):
+        """_SharedTable untuk df, atau None jika shard dikirim lewat pickle"""
+        if not self.shared_memory:
+            return None
+        try:
+            import pyarrow as pa
+        except ImportError:
+            return None
+        try:
+            return _SharedTable(df)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            return None  # mis. kolom object berisi tipe campuran
+
+    def score(self, df):
+        """
+        Prediksi DataFrame pasien dengan membaginya ke worker
+
+        Parameters:
+        -----------
+        df : pd.DataFrame
+            Data pasien (format mentah seperti input `score_frame`)
+
+        Returns:
+        --------
+        predictions : pd.DataFrame
+            Kolom prediksi (seperti `score_frame`) dengan index dan urutan
+            baris yang sama dengan `df`
+        """
+        import pandas as pd
+
+        start = time.perf_counter()
+        n_shards = min(self.n_workers, len(df) // self.min_shard_rows)
+        if n_shards <= 1:
+            from predict import score_frame
+            predictions = score_frame(df, task=self.task, mortality_model=self.mortality_model,
+                                      los_model=self.los_model)
+            self.last_run = {'rows': len(df), 'shards': 1, 'transport': 'in-process',
+                             'shard_seconds': [], 'seconds': time.perf_counter() - start}
+            return predictions
+
+        pool = self._get_pool()
+        bounds = _shard_bounds(len(df), n_shards)
+        shared = self._share(df)
+        try:
+            if shared is not None:
+                shards = [shared.shard(offset, length) for offset, length in bounds]
+            else:
+                shards = [df.iloc[offset:offset + length] for offset, length in bounds]
+            # map mengembalikan hasil sesuai urutan shard
+            results = list(pool.map(_score_shard, shards))
+        finally:
+            if shared is not None:
+                shared.close()
+
+        predictions = pd.concat([result for result, _ in results], ignore_index=True)
+        predictions.index = df.index
+        self.last_run = {'rows': len(df), 'shards': len(shards),
+                         'transport': 'shared-memory' if shared is not None else 'pickle',
+                         'shard_seconds': [seconds for _, seconds in results],
+                         'seconds': time.perf_counter() - start}
+        return predictions
+
+    def close(self):
+        """Hentikan worker"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def score_sharded(new_data, n_workers=None, task='both', mortality_model='models/mortality_model',
+                  los_model='models/los_model', min_shard_rows=MIN_SHARD_ROWS):
+    """
+    Batch scoring satu input dengan process pool sementara
+
+    Untuk banyak batch berturut-turut, pakai `ShardedScorer` agar worker dan
+    model tidak dimuat ulang setiap panggilan.
+
+    Parameters:
+    -----------
+    new_data : pd.DataFrame atau str
+        Data pasien atau path file (.csv, .xlsx, .parquet, .feather)
+    n_workers : int atau None
+        Jumlah proses worker (default semua core)
+
+    Returns:
+    --------
+    predictions : pd.DataFrame
+        Lihat `ShardedScorer.score`
+    """
+    from data_io import read_table
+
+    df = read_table(new_data) if isinstance(new_data, str) else new_data
+    with ShardedScorer(n_workers, task, mortality_model, los_model, min_shard_rows) as scorer:
+        return scorer.score(df)
@@ -0,0 +1,475 @@
+"""
+Model Pohon Bersama (Memory-Mapped) untuk Worker Prediksi
+Inference bundle dengan estimator ensemble pohon (Extra Trees, Random Forest,
+Decision Tree, LightGBM) diratakan menjadi array node (fitur, threshold,
+anak kiri/kanan, nilai daun) dalam satu file `<model>.trees`. File dibuka
+read-only lewat memory map, sehingga semua worker di satu host memakai
+halaman page cache yang sama alih-alih masing-masing meng-unpickle salinan
+model. Prediksi berjalan langsung di atas array tersebut (numpy).
+
+Ekspor model yang sudah ada:
+    python src/shared_trees.py models/mortality_et_model models/los_et_model
+"""
+
+import os
+import json
+import struct
+
+import numpy as np
+
+from inference_bundle import InferenceBundle, bundle_path_for
+from log_config import get_logger, configure_logging
+
+
+logger = get_logger('shared_trees')
+
+TREES_SUFFIX = '.trees'
+TREES_VERSION = 1
+_MAGIC = b'PNTREES1'
+_ALIGN = 64
+# Jumlah pasangan (pohon, baris) yang ditelusuri sekaligus (array sementara muat di cache CPU)
+_MAX_PAIRS = 1 << 16
+# Penanganan missing value per node
+MISSING_AS_ZERO = 0  # NaN diperlakukan sebagai 0 (LightGBM missing_type None)
+MISSING_ZERO = 1  # 0 (dan NaN) mengikuti arah default (LightGBM missing_type Zero)
+MISSING_NAN = 2  # NaN mengikuti arah default (LightGBM missing_type NaN, sklearn)
+_LIGHTGBM_MISSING = {'None': MISSING_AS_ZERO, 'Zero': MISSING_ZERO, 'NaN': MISSING_NAN}
+_LIGHTGBM_ZERO_THRESHOLD = 1e-35
+
+
+def trees_path_for(model_path):
+    """
+    Path file pohon bersama untuk sebuah model
+
+    `models/los_et_model` -> `models/los_et_model.trees`
+    """
+    if model_path.endswith('.pkl'):
+        model_path = model_path[:-len('.pkl')]
+    return model_path + TREES_SUFFIX
+
+
+def model_path_for_trees(trees_path):
+    """Kebalikan `trees_path_for`: path model (tanpa .pkl) untuk sebuah file pohon"""
+    if trees_path.endswith(TREES_SUFFIX):
+        return trees_path[:-len(TREES_SUFFIX)]
+    return trees_path
+
+
+def _sklearn_trees(estimator):
+    """Array node dan metadata dari DecisionTree/RandomForest/ExtraTrees sklearn"""
+    trees = [est.tree_ for est in getattr(estimator, 'estimators_', [estimator])]
+    if any(tree.n_outputs != 1 for tree in trees):
+        raise ValueError("Model multi-output tidak didukung")
+    classification = hasattr(estimator, 'classes_')
+    feature, threshold, children, default_left, value, roots = [], [], [], [], [], []
+    base = 0
+    for tree in trees:
+        leaf = tree.children_left < 0
+        node_ids = np.arange(tree.node_count) + base
+        roots.append(base)
+        feature.append(np.where(leaf, -1, tree.feature))
+        threshold.append(tree.threshold)
+        children.append(np.column_stack([np.where(leaf, node_ids, tree.children_left + base),
+                                         np.where(leaf, node_ids, tree.children_right + base)]))
+        # sklearn >= 1.3: arah NaN per node; sebelumnya NaN ditolak saat predict
+        default_left.append(getattr(tree, 'missing_go_to_left', np.zeros(tree.node_count, dtype=np.uint8)))
+        node_value = tree.value[:, 0, :]
+        if classification:
+            # Sama seperti DecisionTreeClassifier.predict_proba: normalisasi per node
+            normalizer = node_value.sum(axis=1, keepdims=True)
+            normalizer[normalizer == 0.0] = 1.0
+            node_value = node_value / normalizer
+        value.append(node_value)
+        base += tree.node_count
+    arrays = {
+        'feature': np.concatenate(feature).astype(np.int32),
+        'threshold': np.concatenate(threshold).astype(np.float64),
+        'children': np.concatenate(children).astype(np.int32),
+        'default_left': np.concatenate(default_left).astype(np.uint8),
+        'missing_type': np.full(base, MISSING_NAN, dtype=np.uint8),
+        'value': np.concatenate(value).astype(np.float64),
+        'roots': np.asarray(roots, dtype=np.int64),
+    }
+    meta = {
+        'source': type(estimator).__name__,
+        'classification': classification,
+        'classes': estimator.classes_.tolist() if classification else None,
+        'aggregate': 'mean' if hasattr(estimator, 'estimators_') else 'sum',
+        'output': 'proba' if classification else 'identity',
+        'input_dtype': 'float32',  # Tree sklearn membandingkan fitur sebagai float32
+        'n_features': int(estimator.n_features_in_),
+        'max_depth': max(int(tree.max_depth) for tree in trees),
+    }
+    return arrays, meta
+
+
+def _lightgbm_trees(estimator):
+    """Array node dan metadata dari LGBMClassifier/LGBMRegressor (biner atau regresi)"""
+    dump = estimator.booster_.dump_model()
+    objective = dump.get('objective', '').split()
+    classification = hasattr(estimator, 'classes_')
+    if classification:
+        if objective[:1] != ['binary'] or len(estimator.classes_) != 2:
+            raise ValueError(f"Objective LightGBM '{dump.get('objective')}' tidak didukung")
+        sigmoid = float(next((item.split(':')[1] for item in objective if item.startswith('sigmoid:')), 1.0))
+    elif objective[:1] not in (['regression'], ['regression_l1'], ['huber'], ['fair'], ['quantile']):
+        raise ValueError(f"Objective LightGBM '{dump.get('objective')}' tidak didukung")
+
+    feature, threshold, children, default_left, missing_type, value, roots = [], [], [], [], [], [], []
+    max_depth = 0
+    for info in dump['tree_info']:
+        roots.append(len(feature))
+        stack = [(info['tree_structure'], None, 0, 0)]
+        while stack:
+            node, parent, side, depth = stack.pop()
+            index = len(feature)
+            if parent is not None:
+                children[parent][side] = index
+            if 'leaf_value' in node:
+                feature.append(-1)
+                threshold.append(0.0)
+                default_left.append(0)
+                missing_type.append(MISSING_AS_ZERO)
+                value.append(node['leaf_value'])
+                children.append([index, index])
+                max_depth = max(max_depth, depth)
+                continue
+            if node['decision_type'] != '<=':
+                raise ValueError("Split kategorikal LightGBM tidak didukung")
+            feature.append(node['split_feature'])
+            threshold.append(node['threshold'])
+            default_left.append(int(node['default_left']))
+            missing_type.append(_LIGHTGBM_MISSING[node['missing_type']])
+            value.append(0.0)
+            children.append([index, index])
+            stack.append((node['right_child'], index, 1, depth + 1))
+            stack.append((node['left_child'], index, 0, depth + 1))
+    arrays = {
+        'feature': np.asarray(feature, dtype=np.int32),
+        'threshold': np.asarray(threshold, dtype=np.float64),
+        'children': np.asarray(children, dtype=np.int32).reshape(-1, 2),
+        'default_left': np.asarray(default_left, dtype=np.uint8),
+        'missing_type': np.asarray(missing_type, dtype=np.uint8),
+        'value': np.asarray(value, dtype=np.float64).reshape(-1, 1),
+        'roots': np.asarray(roots, dtype=np.int64),
+    }
+    meta = {
+        'source': type(estimator).__name__,
+        'classification': classification,
+        'classes': estimator.classes_.tolist() if classification else None,
+        'aggregate': 'mean' if dump.get('average_output') else 'sum',
+        'output': 'sigmoid' if classification else 'identity',
+        'sigmoid': sigmoid if classification else None,
+        'input_dtype': 'float64',
+        'n_features': int(dump['max_feature_idx']) + 1,
+        'max_depth': max_depth,
+    }
+    return arrays, meta
+
+
+def flatten_trees(estimator):
+    """
+    Ratakan ensemble pohon menjadi array node
+
+    Returns:
+    --------
+    arrays : dict
+        feature, threshold, children (kiri, kanan; daun menunjuk dirinya
+        sendiri), default_left, missing_type, value (per node semua pohon) dan
+        roots (node akar per pohon)
+    meta : dict
+        Jenis output, agregasi antar pohon, kelas dan dtype input
+
+    Raises:
+    -------
+    ValueError
+        Jika estimator bukan ensemble pohon yang didukung
+    """
+    if hasattr(estimator, 'booster_'):
+        return _lightgbm_trees(estimator)
+    if hasattr(estimator, 'tree_') or (
+            hasattr(estimator, 'estimators_') and all(hasattr(est, 'tree_') for est in estimator.estimators_)):
+        return _sklearn_trees(estimator)
+    raise ValueError(f"Estimator {type(estimator).__name__} bukan ensemble pohon yang didukung")
+
+
+class SharedTreeEnsemble:
+    """
+    Estimator read-only di atas array node hasil `flatten_trees`
+
+    Array bisa berupa view memory map (dibagi antar proses). Menyediakan
+    `predict`/`predict_proba` seperti estimator sklearn sehingga bisa dipakai
+    sebagai estimator InferenceBundle.
+    """
+
+    def __init__(self, arrays, meta):
+        self.meta = dict(meta)
+        self.feature = arrays['feature']
+        self.threshold = arrays['threshold']
+        self.children = arrays['children'].reshape(-1)  # [kiri, kanan] per node, rata
+        self.default_left = arrays['default_left'].view(bool)
+        self.missing_type = arrays['missing_type']
+        self.value = arrays['value']
+        self.roots = arrays['roots']
+        self.classes_ = np.asarray(meta['classes']) if meta.get('classes') is not None else None
+        self.n_features_in_ = meta['n_features']
+        self.max_depth = meta['max_depth']
+        self._input_dtype = np.dtype(meta['input_dtype'])
+        self._zero_missing = bool((self.missing_type == MISSING_ZERO).any())
+
+    def _leaves_chunk(self, X):
+        """
+        Node daun per pohon dan baris, shape (n_pohon, n_baris)
+
+        Semua pasangan (pohon, baris) turun satu level per iterasi, paling
+        banyak `max_depth` kali. Daun menunjuk dirinya sendiri sehingga tidak
+        perlu dicek setiap level; pasangan yang sudah di daun baru dibuang
+        jika jumlahnya lebih dari separuh.
+        """
+        n_rows, n_trees = len(X), len(self.roots)
+        flat = np.ascontiguousarray(X).reshape(-1)
+        nodes = np.repeat(self.roots.astype(np.int32), n_rows)
+        offsets = np.tile(np.arange(n_rows, dtype=np.int64) * X.shape[1], n_trees)
+        check_missing = self._zero_missing or bool(np.isnan(flat).any())
+        leaves, pairs = np.empty(len(nodes), dtype=np.int32), None
+        for _ in range(self.max_depth):
+            feature = self.feature[nodes]
+            leaf = feature < 0
+            n_leaf = np.count_nonzero(leaf)
+            if n_leaf == len(nodes):
+                break
+            if 2 * n_leaf > len(nodes):
+                inner = ~leaf
+                leaves[pairs[leaf] if pairs is not None else np.flatnonzero(leaf)] = nodes[leaf]
+                pairs = pairs[inner] if pairs is not None else np.flatnonzero(inner)
+                nodes, offsets, feature = nodes[inner], offsets[inner], feature[inner]
+            # Node daun membaca fitur -1 (nilai sembarang); hasilnya tetap node itu sendiri
+            x = flat[offsets + feature]
+            threshold = self.threshold[nodes]
+            if check_missing:
+                nan = np.isnan(x)
+                missing_type = self.missing_type[nodes]
+                x = np.where(nan, 0.0, x)
+                missing = (nan & (missing_type == MISSING_NAN)) | (
+                    (missing_type == MISSING_ZERO) & (np.abs(x) <= _LIGHTGBM_ZERO_THRESHOLD))
+                go_right = np.where(missing, ~self.default_left[nodes], ~(x <= threshold))
+            else:
+                go_right = ~(x <= threshold)
+            nodes = self.children[2 * nodes + go_right]
+        if pairs is None:
+            leaves = nodes
+        else:
+            leaves[pairs] = nodes
+        return leaves.reshape(n_trees, n_rows)
+
+    def _leaves(self, X):
+        X = np.asarray(X, dtype=self._input_dtype)
+        if not len(X):
+            return np.empty((len(self.roots), 0), dtype=np.int32)
+        step = max(1, _MAX_PAIRS // max(1, len(self.roots)))
+        return np.concatenate([self._leaves_chunk(X[start:start + step]) for start in range(0, len(X), step)],
+                              axis=1)
+
+    def apply(self, X):
+        """Indeks node daun (global) per baris dan pohon, shape (n_baris, n_pohon)"""
+        return self._leaves(X).T
+
+    def _raw(self, X):
+        """Nilai daun dijumlahkan per pohon (urutan sama dengan sklearn/LightGBM)"""
+        leaves = self._leaves(X)
+        total = np.zeros((leaves.shape[1], self.value.shape[1]))
+        for tree_leaves in leaves:
+            total += self.value[tree_leaves]
+        if self.meta['aggregate'] == 'mean':
+            total /= len(self.roots)
+        return total
+
+    def predict_proba(self, X):
+        """Probabilitas per kelas (klasifikasi)"""
+        if not self.meta['classification']:
+            raise AttributeError("predict_proba hanya untuk model klasifikasi")
+        raw = self._raw(X)
+        if self.meta['output'] == 'sigmoid':
+            positive = 1.0 / (1.0 + np.exp(-self.meta['sigmoid'] * raw[:, 0]))
+            return np.column_stack([1.0 - positive, positive])
+        return raw
+
+    def predict_with_proba(self, X):
+        """Label dan probabilitas dengan satu kali penelusuran pohon (klasifikasi)"""
+        proba = self.predict_proba(X)
+        return self.classes_[np.argmax(proba, axis=1)], proba
+
+    def predict(self, X):
+        """Label (klasifikasi) atau nilai prediksi (regresi)"""
+        if self.meta['classification']:
+            return self.predict_with_proba(X)[0]
+        return self._raw(X)[:, 0]
+
+
+def write_tree_store(path, arrays, meta):
+    """
+    Tulis array dan metadata ke satu file yang bisa di-memory map
+
+    Format: magic, panjang header (uint64), header JSON, lalu setiap array
+    (little-endian, C-contiguous) di offset kelipatan 64 byte. File ditulis ke
+    file sementara lalu di-rename, sehingga proses yang sedang memetakan file
+    lama tidak terganggu.
+    """
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        layout[name] = {'dtype': array.dtype.newbyteorder('<').str, 'shape': list(array.shape), 'offset': offset}
+        offset += -(-array.nbytes // _ALIGN) * _ALIGN
+    header = json.dumps({'version': TREES_VERSION, 'meta': meta, 'arrays': layout}, default=str).encode()
+    data_start = -(-(len(_MAGIC) + 8 + len(header)) // _ALIGN) * _ALIGN
+
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_MAGIC + struct.pack('<Q', len(header)) + header)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name]['offset'])
+            f.write(np.ascontiguousarray(array, dtype=np.dtype(layout[name]['dtype'])).tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_tree_store(path):
+    """
+    Buka file pohon lewat memory map read-only
+
+    Returns:
+    --------
+    arrays : dict
+        View numpy (read-only) ke memory map, tanpa menyalin data
+    meta : dict
+    """
+    buffer = np.memmap(path, dtype=np.uint8, mode='r')
+    if bytes(buffer[:len(_MAGIC)]) != _MAGIC:
+        raise ValueError(f"Bukan file pohon bersama: {path}")
+    (header_size,) = struct.unpack('<Q', bytes(buffer[len(_MAGIC):len(_MAGIC) + 8]))
+    header = json.loads(bytes(buffer[len(_MAGIC) + 8:len(_MAGIC) + 8 + header_size]))
+    if header.get('version') != TREES_VERSION:
+        raise ValueError(f"Versi file pohon tidak didukung: {header.get('version')}")
+    data_start = -(-(len(_MAGIC) + 8 + header_size) // _ALIGN) * _ALIGN
+    arrays = {}
+    for name, spec in header['arrays'].items():
+        dtype = np.dtype(spec['dtype'])
+        count = int(np.prod(spec['shape'], dtype=np.int64))
+        arrays[name] = np.frombuffer(buffer, dtype=dtype, count=count,
+                                     offset=data_start + spec['offset']).reshape(spec['shape'])
+    return arrays, header['meta']
+
+
+def build_shared_bundle_store(bundle, path, X=None):
+    """
+    Tulis InferenceBundle (parameter preprocessing + pohon yang diratakan) ke file pohon
+
+    Parameters:
+    -----------
+    bundle : InferenceBundle
+        Bundle dengan estimator ensemble pohon
+    path : str
+        File tujuan (`<model>.trees`)
+    X : pd.DataFrame atau None
+        Contoh data input; jika ada, prediksi dari file dibandingkan dengan
+        prediksi bundle asli
+
+    Raises:
+    -------
+    ValueError
+        Jika estimator tidak didukung atau prediksi berbeda
+    """
+    arrays, trees_meta = flatten_trees(bundle.estimator)
+    arrays.update(fill_values=bundle.fill_values, offset=bundle.offset, scale=bundle.scale)
+    meta = {
+        'trees': trees_meta,
+        'bundle': {
+            'task': bundle.task,
+            'input_columns': bundle.input_columns,
+            'feature_names': bundle.feature_names,
+            'classes': bundle.classes.tolist() if bundle.classes is not None else None,
+            'labels': bundle.labels.tolist() if bundle.labels is not None else None,
+            'metadata': bundle.metadata,
+        },
+    }
+    if X is not None:
+        shared = InferenceBundle(bundle.task, bundle.input_columns, bundle.fill_values, bundle.offset,
+                                 bundle.scale, SharedTreeEnsemble(arrays, trees_meta), bundle.feature_names,
+                                 bundle.classes, bundle.labels)
+        expected, expected_score = bundle.predict_with_score(X)
+        label, score = shared.predict_with_score(X)
+        if bundle.task == 'classification':
+            matches = np.array_equal(np.asarray(label), np.asarray(expected)) and np.allclose(score, expected_score)
+        else:
+            matches = np.allclose(label, expected, rtol=1e-9, atol=1e-9)
+        if not matches:
+            raise ValueError("Prediksi file pohon bersama berbeda dengan inference bundle")
+    return write_tree_store(path, arrays, meta)
+
+
+def load_shared_bundle(path):
+    """
+    Muat InferenceBundle dari file pohon (memory map, tanpa unpickle estimator)
+
+    Parameters:
+    -----------
+    path : str
+        File `<model>.trees`
+    """
+    arrays, meta = read_tree_store(path)
+    info = meta['bundle']
+    return InferenceBundle(
+        task=info['task'],
+        input_columns=info['input_columns'],
+        fill_values=arrays['fill_values'],
+        offset=arrays['offset'],
+        scale=arrays['scale'],
+        estimator=SharedTreeEnsemble(arrays, meta['trees']),
+        feature_names=info.get('feature_names'),
+        classes=info.get('classes'),
+        labels=info.get('labels'),
+        metadata=dict(info.get('metadata') or {}, shared_trees=path),
+    )
+
+
+def export_shared_trees(model_path, X=None):
+    """
+    Ekspor inference bundle `<model_path>.bundle.joblib` ke `<model_path>.trees`
+
+    Parameters:
+    -----------
+    model_path : str
+        Path model (tanpa ekstensi .pkl)
+    X : pd.DataFrame atau None
+        Fitur training untuk validasi prediksi
+
+    Returns:
+    --------
+    trees_path : str atau None
+        Path file yang ditulis, None jika bundle tidak ada atau estimatornya
+        bukan ensemble pohon yang didukung
+    """
+    path = trees_path_for(model_path)
+    try:
+        bundle = InferenceBundle.load(bundle_path_for(model_path))
+        return build_shared_bundle_store(bundle, path, X)
+    except (OSError, ValueError, KeyError) as e:
+        logger.info("File pohon bersama tidak dibuat: %s", e)
+        # Hapus file lama agar prediksi tidak memakai model yang usang
+        if os.path.exists(path):
+            os.remove(path)
+        return None
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Ekspor inference bundle ke file pohon bersama (.trees)")
+    parser.add_argument('models', nargs='+', help='Path model tanpa ekstensi, mis. models/los_et_model')
+    args = parser.parse_args()
+    configure_logging('INFO')
+    for model_path in args.models:
+        trees_path = export_shared_trees(model_path)
+        if trees_path:
+            print(f"{model_path} -> {trees_path} ({os.path.getsize(trees_path) / 1e6:.2f} MB)")
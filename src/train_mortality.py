@@ -6,12 +6,15 @@ Menggunakan PyCaret untuk Low Code Machine Learning
 import pandas as pd
 import numpy as np
 import os
-from pycaret.classification import *
+from training_session import TrainingSession
+from run_config import load_config
+from instrumentation import instrumented, stage
 import warnings
 warnings.filterwarnings('ignore')
 
 
-def train_mortality_model(data_path, target_col='Mortality', test_size=0.2):
+@instrumented()
+def train_mortality_model(data_path, target_col=None, test_size=None, session=None):
     """
     Train model untuk prediksi mortalitas menggunakan PyCaret
     
@@ -19,66 +22,67 @@ def train_mortality_model(data_path, target_col='Mortality', test_size=0.2):
     -----------
     data_path : str
         Path ke dataset yang sudah diproses
-    target_col : str
-        Nama kolom target (mortalitas)
-    test_size : float
-        Proporsi data test (default 0.2 = 20%)
+    target_col : str atau None
+        Nama kolom target mortalitas (default dari config)
+    test_size : float atau None
+        Proporsi data test (default dari config, 0.2 = 20%)
+    session : TrainingSession atau None
+        Session training bersama (data dan setup PyCaret dipakai ulang). Jika
+        None, session baru dibuat khusus untuk model ini.
     """
     
     print("=" * 60)
     print("TRAINING MODEL PREDIKSI MORTALITAS")
     print("=" * 60)
     
-    # Load data
+    if session is None:
+        session = TrainingSession(data_path, target_col, task='classification', test_size=test_size)
+    session.check_target(target_col)
+    
+    # Load data (dibaca sekali per session)
     print("\n1. Loading data...")
-    if data_path.endswith('.xlsx') or data_path.endswith('.xls'):
-        df = pd.read_excel(data_path)
-    else:
-        df = pd.read_csv(data_path)
+    df = session.load_data()
     
     print(f"   Data shape: {df.shape}")
     print(f"   Kolom: {list(df.columns)}")
     
-    # Setup PyCaret untuk klasifikasi
+    # Setup PyCaret untuk klasifikasi (dijalankan sekali per session)
     print(f"\n2. Setup PyCaret Classification...")
-    print(f"   Target: {target_col}")
-    
-    clf = setup(
-        data=df,
-        target=target_col,
-        train_size=1-test_size,
-        session_id=123,
-        normalize=True,
-        feature_selection=True,
-        remove_multicollinearity=True,
-        multicollinearity_threshold=0.95,
-        verbose=False
-    )
+    print(f"   Target: {session.target_col}")
+    
+    if session.is_setup:
+        print("   Memakai setup dari session (tidak diulang)")
+    clf = session.setup()
     
     print("   Setup selesai!")
     
     # Compare models
     print("\n3. Membandingkan berbagai model...")
     try:
-        best_models = compare_models(
-            include=['lightgbm', 'xgboost', 'rf', 'et', 'gbc', 'ada', 'dt'],
-            sort='Accuracy',
+        best_models = session.compare_models(
+            include=session.config.classification_models,
+            sort=session.config.mortality_optimize,
             n_select=3,
             verbose=False
         )
         
+        if session.leaderboard_cached:
+            print("   Leaderboard diambil dari cache (compare_models dilewati)")
         print("   Model terbaik:")
         for i, model in enumerate(best_models, 1):
             print(f"   {i}. {type(model).__name__}")
     except Exception as e:
         print(f"   Warning: Error saat compare models: {str(e)}")
         print("   Mencoba model alternatif...")
-        best_models = compare_models(
-            include=['rf', 'et', 'gbc', 'ada', 'dt'],
-            sort='Accuracy',
+        best_models = session.compare_models(
+            include=[m for m in session.config.classification_models
+                     if m not in ('lightgbm', 'xgboost')],
+            sort=session.config.mortality_optimize,
             n_select=3,
             verbose=False
         )
+        if session.leaderboard_cached:
+            print("   Leaderboard diambil dari cache (compare_models dilewati)")
         print("   Model terbaik:")
         for i, model in enumerate(best_models, 1):
             print(f"   {i}. {type(model).__name__}")
@@ -86,47 +90,48 @@ def train_mortality_model(data_path, target_col='Mortality', test_size=0.2):
     # Pilih model terbaik (LightGBM sesuai dokumen)
     print("\n4. Memilih model LightGBM (sesuai dokumen)...")
     try:
-        lgbm_model = create_model('lightgbm', verbose=False)
+        with stage('create_model'):
+            lgbm_model = clf.create_model('lightgbm', verbose=False)
         print("   LightGBM model berhasil dibuat!")
     except Exception as e:
         print(f"   LightGBM tidak tersedia ({str(e)}), menggunakan model terbaik...")
         lgbm_model = best_models[0]
     
-    # Tune model
-    print("\n5. Tuning hyperparameters...")
-    tuned_model = tune_model(
+    # Tune model (engine random search atau successive halving, sesuai session)
+    print(f"\n5. Tuning hyperparameters ({session.tuning})...")
+    tuned_model = session.tune(
         lgbm_model,
-        optimize='Accuracy',
-        n_iter=50,
-        verbose=False
+        optimize=session.config.mortality_optimize,
+        n_iter=session.config.tuning_n_iter
     )
-    print("   Tuning selesai!")
+    print(f"   Tuning selesai! ({session.tuning_history[-1]['seconds']:.1f} detik)")
     
     # Evaluate model
     print("\n6. Evaluasi model...")
-    evaluate_model(tuned_model)
+    with stage('evaluate_model'):
+        clf.evaluate_model(tuned_model)
     
     # Finalize model
     print("\n7. Finalizing model...")
-    final_model = finalize_model(tuned_model)
+    with stage('finalize_model'):
+        final_model = clf.finalize_model(tuned_model)
     print("   Model finalized!")
     
-    # Save model
-    model_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'models')
-    os.makedirs(model_dir, exist_ok=True)
-    model_path = os.path.join(model_dir, 'mortality_model')
-    save_model(final_model, model_path)
+    # Save model (beserta skema, encoder dan inference bundle)
+    model_path = session.save_model(final_model, session.config.mortality_model_path)
     print(f"\n8. Model disimpan ke: {model_path}")
     
     # Predictions
     print("\n9. Membuat prediksi pada test set...")
-    predictions = predict_model(final_model)
+    with stage('predict_model'):
+        predictions = clf.predict_model(final_model)
     print("   Prediksi selesai!")
     
     return final_model, predictions
 
 
-def train_extra_tree_model(data_path, target_col='Mortality', test_size=0.2):
+@instrumented()
+def train_extra_tree_model(data_path, target_col=None, test_size=None, session=None):
     """
     Train Extra Tree Classifier (sesuai dokumen)
     
@@ -134,79 +139,82 @@ def train_extra_tree_model(data_path, target_col='Mortality', test_size=0.2):
     -----------
     data_path : str
         Path ke dataset yang sudah diproses
-    target_col : str
-        Nama kolom target
-    test_size : float
-        Proporsi data test
+    target_col : str atau None
+        Nama kolom target (default dari config)
+    test_size : float atau None
+        Proporsi data test (default dari config, 0.2 = 20%)
+    session : TrainingSession atau None
+        Session training bersama (data dan setup PyCaret dipakai ulang). Jika
+        None, session baru dibuat dengan setup Extra Tree (hanya normalisasi).
     """
     
     print("=" * 60)
     print("TRAINING EXTRA TREE CLASSIFIER")
     print("=" * 60)
     
+    if session is None:
+        session = TrainingSession(data_path, target_col, task='classification', test_size=test_size,
+                                  feature_selection=False, remove_multicollinearity=False)
+    session.check_target(target_col)
+    
     # Load data
     print("\n1. Loading data...")
-    if data_path.endswith('.xlsx') or data_path.endswith('.xls'):
-        df = pd.read_excel(data_path)
-    else:
-        df = pd.read_csv(data_path)
+    session.load_data()
     
     # Setup
     print("\n2. Setup PyCaret...")
-    clf = setup(
-        data=df,
-        target=target_col,
-        train_size=1-test_size,
-        session_id=123,
-        normalize=True,
-        verbose=False
-    )
+    if session.is_setup:
+        print("   Memakai setup dari session (tidak diulang)")
+    clf = session.setup()
     
     # Create Extra Tree model
     print("\n3. Membuat Extra Tree Classifier...")
-    et_model = create_model('et', verbose=False)
+    with stage('create_model'):
+        et_model = clf.create_model('et', verbose=False)
     
     # Tune model
-    print("\n4. Tuning model...")
-    tuned_et = tune_model(et_model, optimize='Accuracy', n_iter=50, verbose=False)
+    print(f"\n4. Tuning model ({session.tuning})...")
+    tuned_et = session.tune(et_model, optimize=session.config.mortality_optimize,
+                            n_iter=session.config.tuning_n_iter)
     
     # Evaluate
     print("\n5. Evaluasi model...")
-    evaluate_model(tuned_et)
+    with stage('evaluate_model'):
+        clf.evaluate_model(tuned_et)
     
     # Finalize
     print("\n6. Finalizing model...")
-    final_et = finalize_model(tuned_et)
+    with stage('finalize_model'):
+        final_et = clf.finalize_model(tuned_et)
     
-    # Save
-    model_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'models')
-    os.makedirs(model_dir, exist_ok=True)
-    model_path = os.path.join(model_dir, 'mortality_et_model')
-    save_model(final_et, model_path)
+    # Save (beserta skema, encoder dan inference bundle)
+    model_path = session.save_model(final_et, session.config.mortality_et_model_path)
     print(f"\n7. Model disimpan ke: {model_path}")
     
     return final_et
 
 
 if __name__ == "__main__":
-    # Contoh penggunaan
-    data_path = "../data/processed_pneumonia_data.csv"
+    # Contoh penggunaan (path, target dan parameter dari config.py)
+    config = load_config()
+    data_path = config.project_path(config.processed_data_path)
     
     print("Training Model Prediksi Mortalitas")
     print("=" * 60)
     
+    # Satu session (data + setup PyCaret) untuk kedua model
+    session = TrainingSession(data_path, None, task='classification', config=config)
+    
     # Train LightGBM model
     model, predictions = train_mortality_model(
         data_path=data_path,
-        target_col='Mortality',
-        test_size=0.2
+        session=session
     )
     
     # Train Extra Tree model
     et_model = train_extra_tree_model(
         data_path=data_path,
-        target_col='Mortality',
-        test_size=0.2
+        session=session
     )
     
     print("\n" + "=" * 60)
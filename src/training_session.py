@@ -0,0 +1,265 @@
+"""
+Training Session untuk Model Pneumonia
+Data training dibaca dan `setup()` PyCaret dijalankan sekali per task, lalu
+semua kandidat model (LightGBM, Extra Trees) dilatih pada experiment yang sama
+"""
+
+import os
+import time
+
+from feature_schema import save_feature_schema
+from data_io import read_table
+from categorical_encoder import save_encoder_for_model
+from missing_value_imputer import save_imputer_for_model
+from inference_bundle import export_inference_bundle
+from shared_trees import export_shared_trees
+from tuning import ENGINES, tune_model
+from leaderboard_cache import LeaderboardCache, cache_key
+from run_config import load_config
+from instrumentation import instrumented, stage
+
+
+TASKS = ('classification', 'regression')
+
+
+class TrainingSession:
+    """
+    Satu experiment PyCaret per task (klasifikasi mortalitas atau regresi LOS)
+
+    Memakai API OOP PyCaret (`ClassificationExperiment`/`RegressionExperiment`)
+    sehingga beberapa session bisa hidup bersamaan tanpa saling menimpa state
+    global PyCaret.
+    """
+
+    def __init__(self, data_path, target_col, task, test_size=None, session_id=None,
+                 model_dir=None, tuning=None, leaderboard_cache=None, config=None, columns=None,
+                 **setup_params):
+        """
+        Initialize TrainingSession
+
+        Parameter yang None diambil dari `config` (RunConfig, default
+        config.py + override environment).
+
+        Parameters:
+        -----------
+        data_path : str
+            Path ke dataset yang sudah diproses (.csv, .parquet, .feather, .xlsx)
+        target_col : str atau None
+            Nama kolom target (None: target mortalitas/LOS dari config sesuai task)
+        task : str
+            'classification' atau 'regression'
+        test_size : float atau None
+            Proporsi data test
+        session_id : int atau None
+            Seed PyCaret
+        model_dir : str atau None
+            Folder penyimpanan model. None: path model di config.
+        tuning : str atau None
+            Engine tuning hyperparameter: 'random' (random search PyCaret) atau
+            'halving' (successive halving, lihat modul tuning)
+        leaderboard_cache : bool, LeaderboardCache atau None
+            Cache hasil `compare_models`. True memakai cache default
+            (cache/leaderboard/), False mematikan cache.
+        config : RunConfig atau None
+            Konfigurasi run
+        columns : list atau None
+            Proyeksi kolom: hanya fitur ini (plus target) yang dibaca dari
+            dataset. None: semua kolom.
+        **setup_params
+            Parameter tambahan/override untuk `setup()` (default dari
+            `config.setup_params()`: normalisasi, seleksi fitur, fold, n_jobs, ...)
+        """
+        config = config or load_config()
+        if task not in TASKS:
+            raise ValueError(f"task harus salah satu dari {TASKS}")
+        tuning = tuning or config.tuning_engine
+        if tuning not in ENGINES:
+            raise ValueError(f"tuning harus salah satu dari {ENGINES}")
+        if target_col is None:
+            target_col = config.mortality_target_col if task == 'classification' else config.los_target_col
+        self.config = config
+        self.data_path = data_path
+        self.columns = columns
+        self.target_col = target_col
+        self.task = task
+        self.test_size = config.test_size if test_size is None else test_size
+        self.session_id = config.random_seed if session_id is None else session_id
+        self.model_dir = model_dir
+        self.tuning = tuning
+        self.setup_params = {**config.setup_params(), **setup_params}
+        if leaderboard_cache is None:
+            leaderboard_cache = config.leaderboard_cache
+        if leaderboard_cache is True:
+            leaderboard_cache = LeaderboardCache()
+        self.leaderboard_cache = leaderboard_cache or None
+
+        self.df = None
+        self.experiment = None
+        self.load_seconds = None
+        self.setup_seconds = None
+        self.tuning_history = []
+        self.leaderboard = None
+        self.leaderboard_cached = False
+
+    @property
+    def is_setup(self):
+        """True jika `setup()` PyCaret sudah dijalankan"""
+        return self.experiment is not None
+
+    def load_data(self):
+        """Baca dataset sekali (Excel, CSV, Parquet atau Feather)"""
+        if self.df is None:
+            columns = None
+            if self.columns is not None:
+                columns = list(dict.fromkeys([*self.columns, self.target_col]))
+            start = time.perf_counter()
+            with stage('TrainingSession.load_data'):
+                self.df = read_table(self.data_path, columns=columns,
+                                     ingest_cache=self.config.ingest_cache,
+                                     excel_engine=self.config.excel_engine)
+            self.load_seconds = time.perf_counter() - start
+        return self.df
+
+    def setup(self):
+        """
+        Jalankan `setup()` PyCaret sekali, kembalikan experiment-nya
+
+        Returns:
+        --------
+        experiment : ClassificationExperiment atau RegressionExperiment
+        """
+        if self.experiment is None:
+            df = self.load_data()
+            # PyCaret diimpor saat training dimulai, bukan saat modul diimpor
+            if self.task == 'classification':
+                from pycaret.classification import ClassificationExperiment as Experiment
+            else:
+                from pycaret.regression import RegressionExperiment as Experiment
+
+            start = time.perf_counter()
+            experiment = Experiment()
+            with stage('TrainingSession.setup'):
+                experiment.setup(
+                    data=df,
+                    target=self.target_col,
+                    train_size=1-self.test_size,
+                    session_id=self.session_id,
+                    verbose=False,
+                    **self.setup_params
+                )
+            self.setup_seconds = time.perf_counter() - start
+            self.experiment = experiment
+        return self.experiment
+
+    @instrumented()
+    def compare_models(self, **compare_params):
+        """
+        `compare_models` PyCaret dengan cache leaderboard
+
+        Key cache: isi data, parameter setup, parameter compare dan versi
+        library. Jika cocok, leaderboard dan model terbaik diambil dari cache
+        tanpa cross-validation ulang.
+
+        Parameters:
+        -----------
+        **compare_params
+            Parameter `compare_models()` (include, sort, n_select, ...)
+
+        Returns:
+        --------
+        best_models : object atau list
+            Sama seperti hasil `compare_models`; leaderboard di `self.leaderboard`
+        """
+        experiment = self.setup()
+        key = None
+        if self.leaderboard_cache is not None:
+            setup_params = {'target': self.target_col, 'task': self.task, 'test_size': self.test_size,
+                            'session_id': self.session_id, **self.setup_params}
+            key = cache_key(self.df, setup_params, compare_params)
+            entry = self.leaderboard_cache.get(key)
+            if entry is not None:
+                self.leaderboard = entry['leaderboard']
+                self.leaderboard_cached = True
+                return entry['models']
+
+        best_models = experiment.compare_models(**compare_params)
+        self.leaderboard = experiment.pull()
+        self.leaderboard_cached = False
+        if key is not None:
+            self.leaderboard_cache.put(key, self.leaderboard, best_models,
+                                       metadata={'data_path': self.data_path, 'target': self.target_col})
+        return best_models
+
+    @instrumented()
+    def tune(self, model, optimize, n_iter=None, engine=None):
+        """
+        Tuning hyperparameter model pada experiment session
+
+        Parameters:
+        -----------
+        model : object
+            Model hasil `create_model`
+        optimize : str
+            Metrik yang dioptimasi (mis. 'Accuracy', 'RMSE')
+        n_iter : int atau None
+            Jumlah konfigurasi random search (default `config.tuning_n_iter`)
+        engine : str atau None
+            Override engine tuning session
+
+        Returns:
+        --------
+        tuned_model : object
+            Ringkasan tuning ditambahkan ke `tuning_history`
+        """
+        return tune_model(self.setup(), model, optimize, engine=engine or self.tuning,
+                          n_iter=n_iter or self.config.tuning_n_iter, history=self.tuning_history)
+
+    def check_target(self, target_col):
+        """Pastikan session dipakai untuk target yang sama dengan trainer"""
+        if target_col is not None and target_col != self.target_col:
+            raise ValueError(
+                f"Session dibuat untuk target '{self.target_col}', bukan '{target_col}'"
+            )
+
+    def model_path(self, name):
+        """
+        Path model (tanpa ekstensi .pkl)
+
+        `name` bisa nama file ('mortality_model') atau path dari config
+        ('models/mortality_model'). Jika `model_dir` diisi, model disimpan di
+        folder tersebut dengan nama file yang sama.
+        """
+        if self.model_dir is not None:
+            return os.path.join(self.model_dir, os.path.basename(name))
+        return self.config.project_path(name)
+
+    @instrumented()
+    def save_model(self, model, name):
+        """
+        Simpan model beserta skema fitur, encoder, imputer dan inference bundle
+
+        Parameters:
+        -----------
+        model : Pipeline
+            Model hasil `finalize_model`
+        name : str
+            Nama atau path model (tanpa ekstensi), mis. `config.mortality_model_path`
+
+        Returns:
+        --------
+        model_path : str
+            Path model yang disimpan (tanpa ekstensi .pkl)
+        """
+        model_path = self.model_path(name)
+        os.makedirs(os.path.dirname(model_path) or '.', exist_ok=True)
+        self.setup().save_model(model, model_path)
+        # Simpan skema fitur, encoder dan imputer training di samping model (dipakai saat prediksi)
+        save_feature_schema(self.df, model_path)
+        save_encoder_for_model(self.data_path, model_path)
+        save_imputer_for_model(self.data_path, model_path)
+        # Ekspor inference bundle ringan (prediksi tanpa PyCaret) dan, untuk
+        # ensemble pohon, file pohon bersama yang di-memory map oleh worker
+        X = self.df.drop(columns=[self.target_col])
+        export_inference_bundle(model, X, model_path, task=self.task)
+        export_shared_trees(model_path, X)
+        return model_path
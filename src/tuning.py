@@ -0,0 +1,130 @@
+"""
+Tuning Hyperparameter untuk Model Pneumonia
+Dua engine: 'random' (random search `tune_model` PyCaret, n_iter konfigurasi
+dengan CV penuh) dan 'halving' (successive halving: banyak konfigurasi dicoba
+dengan jumlah tree kecil, hanya yang menjanjikan dinaikkan budget-nya)
+"""
+
+import time
+
+import numpy as np
+
+
+ENGINES = ('random', 'halving')
+
+# Parameter budget successive halving (jumlah boosting round / tree)
+HALVING_RESOURCE = 'n_estimators'
+HALVING_MIN_RESOURCES = 10
+HALVING_MAX_RESOURCES = 300
+HALVING_FACTOR = 3
+
+
+def _scorer(experiment, optimize):
+    """Scorer sklearn untuk metrik PyCaret (mis. 'Accuracy' -> 'accuracy', 'RMSE' -> neg RMSE)"""
+    metrics = experiment.get_metrics()
+    row = metrics[(metrics['Name'] == optimize) | (metrics.index == optimize.lower())]
+    if row.empty:
+        raise ValueError(f"Metrik '{optimize}' tidak dikenal PyCaret")
+    return row['Scorer'].iloc[0]
+
+
+def _param_grid(experiment, model):
+    """Grid tuning default PyCaret untuk estimator (tanpa parameter budget)"""
+    model_id = next(
+        (mid for mid, container in experiment._all_models_internal.items()
+         if type(model) is container.class_def),
+        None
+    )
+    if model_id is None:
+        raise ValueError(f"Grid tuning untuk {type(model).__name__} tidak ditemukan")
+    grid = experiment._all_models_internal[model_id].tune_grid
+    return {name: values for name, values in grid.items() if name != HALVING_RESOURCE}
+
+
+def _halving_search(experiment, model, optimize, n_candidates, factor):
+    """
+    Successive halving dengan `n_estimators` sebagai budget
+
+    Kandidat disaring pada data training yang sudah ditransformasi pipeline
+    experiment (preprocessing di-fit sekali, bukan per kandidat per fold).
+    Skor akhir tetap diukur ulang dengan CV pipeline penuh di `tune_model`.
+    """
+    from sklearn.base import clone
+    from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+    from sklearn.model_selection import HalvingRandomSearchCV
+
+    search = HalvingRandomSearchCV(
+        clone(model),
+        _param_grid(experiment, model),
+        n_candidates=n_candidates,
+        factor=factor,
+        resource=HALVING_RESOURCE,
+        min_resources=HALVING_MIN_RESOURCES,
+        max_resources=HALVING_MAX_RESOURCES,
+        scoring=_scorer(experiment, optimize),
+        cv=experiment.get_config('fold_generator'),
+        random_state=experiment.get_config('seed'),
+        n_jobs=experiment.get_config('n_jobs_param'),
+        refit=False,
+    )
+    search.fit(experiment.get_config('X_train_transformed'), experiment.get_config('y_train_transformed'))
+    return clone(model).set_params(**search.best_params_), search
+
+
+def tune_model(experiment, model, optimize, engine='random', n_iter=50, n_candidates='exhaust',
+               factor=HALVING_FACTOR, history=None):
+    """
+    Tuning hyperparameter dengan engine yang dipilih
+
+    Parameters:
+    -----------
+    experiment : ClassificationExperiment atau RegressionExperiment
+        Experiment PyCaret yang sudah di-setup
+    model : object
+        Model hasil `create_model`
+    optimize : str
+        Metrik PyCaret yang dioptimasi (mis. 'Accuracy', 'RMSE')
+    engine : str
+        'random' (random search PyCaret) atau 'halving' (successive halving)
+    n_iter : int
+        Jumlah konfigurasi random search (engine 'random')
+    n_candidates : int atau 'exhaust'
+        Jumlah konfigurasi di ronde pertama successive halving (engine 'halving')
+    factor : int
+        Pembagi kandidat (dan pengali budget) antar ronde successive halving
+    history : list atau None
+        Jika diberikan, ringkasan tuning (engine, durasi, skor CV) ditambahkan
+
+    Returns:
+    --------
+    tuned_model : object
+        Model ter-tuning yang sudah di-fit (seperti hasil `tune_model` PyCaret)
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine harus salah satu dari {ENGINES}")
+
+    start = time.perf_counter()
+    record = {'engine': engine, 'model': type(model).__name__, 'optimize': optimize}
+    if engine == 'random':
+        tuned_model = experiment.tune_model(model, optimize=optimize, n_iter=n_iter, verbose=False)
+        record['n_candidates'] = n_iter
+        record['n_fits'] = n_iter * experiment.get_config('fold_generator').get_n_splits()
+    else:
+        best_model, search = _halving_search(experiment, model, optimize, n_candidates, factor)
+        # Latih ulang konfigurasi terbaik dengan budget penuh dan CV PyCaret
+        tuned_model = experiment.create_model(best_model, verbose=False)
+        record['n_candidates'] = int(search.n_candidates_[0])
+        record['n_fits'] = int(np.sum(search.n_candidates_)) * experiment.get_config('fold_generator').get_n_splits()
+        record['rounds'] = [{'candidates': int(c), HALVING_RESOURCE: int(r)}
+                            for c, r in zip(search.n_candidates_, search.n_resources_)]
+    record['seconds'] = time.perf_counter() - start
+    # Baris 'Mean' hasil CV model akhir (sama untuk kedua engine)
+    cv_results = experiment.pull()
+    record['cv_score'] = float(cv_results.loc['Mean', optimize])
+    record['cv_metrics'] = {key: float(value) for key, value in cv_results.loc['Mean'].items()}
+    tuned_params = set(_param_grid(experiment, model)) | {HALVING_RESOURCE}
+    record['params'] = {key: (value.item() if isinstance(value, np.generic) else value)
+                        for key, value in tuned_model.get_params().items() if key in tuned_params}
+    if history is not None:
+        history.append(record)
+    return tuned_model
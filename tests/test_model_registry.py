@@ -0,0 +1,59 @@
+"""
+Test registry model: eviction lewat nama model untuk semua artefak yang dimuat
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.tree import DecisionTreeClassifier
+
+sys.path.append(str(Path(__file__).parent.parent / 'src'))
+
+import predict
+from inference_bundle import InferenceBundle, bundle_path_for
+from model_registry import default_registry
+from shared_trees import build_shared_bundle_store, trees_path_for
+
+
+def _write_artifacts(tmp_path):
+    """Tulis .pkl (placeholder), inference bundle dan file pohon bersama untuk satu model"""
+    model_path = str(tmp_path / 'mortality_model')
+    Path(model_path + '.pkl').write_bytes(b'pycaret pipeline')
+    time.sleep(0.01)  # bundle tidak boleh lebih lama dari .pkl
+    X = pd.DataFrame({'Age': [40.0, 60.0, 80.0, 90.0], 'CRP': [1.0, 5.0, 9.0, 20.0]})
+    estimator = DecisionTreeClassifier(random_state=0).fit(X.to_numpy(), [0, 0, 1, 1])
+    bundle = InferenceBundle('classification', list(X.columns), np.full(2, np.nan), np.zeros(2),
+                             np.ones(2), estimator, classes=estimator.classes_)
+    bundle.save(bundle_path_for(model_path))
+    build_shared_bundle_store(bundle, trees_path_for(model_path), X)
+    return model_path
+
+
+def test_evict_models_after_loading_bundle(tmp_path):
+    model_path = _write_artifacts(tmp_path)
+    artifact = predict._artifact_path(model_path)
+    assert artifact == bundle_path_for(model_path)
+    default_registry.get(artifact, InferenceBundle.load)
+
+    assert predict.evict_models(model_path) == 1
+    assert artifact not in default_registry.stats()['models']
+    assert predict.evict_models(model_path) == 0
+
+
+def test_evict_models_after_loading_shared_trees(tmp_path, monkeypatch):
+    from shared_trees import load_shared_bundle
+
+    model_path = _write_artifacts(tmp_path)
+    monkeypatch.setattr(predict, 'USE_SHARED_TREES', True)
+    artifact = predict._artifact_path(model_path)
+    assert artifact == trees_path_for(model_path)
+    default_registry.get(artifact, load_shared_bundle)
+    default_registry.get(bundle_path_for(model_path), InferenceBundle.load)
+
+    # Path artefak mana pun menghapus semua varian model yang sama
+    assert predict.evict_models(artifact) == 2
+    loaded = default_registry.stats()['models']
+    assert artifact not in loaded and bundle_path_for(model_path) not in loaded